@@ -18,6 +18,10 @@ from .providers.cloudflare.Cloudflare import Cloudflare
 from .utils.auth import auth
 from .utils.tf_plan import execute_terraform_plan, print_tf_plan
 from .utils.github import GithubUtils
+from .utils.cassette import Cassette
+from .utils.api_metrics import ApiMetrics, set_current_module
+from .utils.parallel import parse_inner_parallel
+from .utils.scheduler import ModuleScheduler
 
 
 from rich.progress import Progress
@@ -33,6 +37,7 @@ ftstacks = set()
 
 
 def execute_provider_method(provider, method_name):
+    set_current_module(method_name)
     try:
         if method_name == "iam":
             # Special handling for IAM module
@@ -65,12 +70,23 @@ def execute_provider_method(provider, method_name):
 @click.option('--filters', '-f', default=None, help='Filters to apply to the resources')
 @click.option('--github-push-repo', '-ghr', default=None, help='Push to GitHub repository')
 @click.option('--stack-name', '-s', default=None, help='Stack name')
-def main(provider, module, output_dir, process_dependencies, run_plan, token, cache_dir, filters, github_push_repo, stack_name):
+@click.option('--api-cache-dir', default=None, help='Directory to persist AWS API responses between runs')
+@click.option('--api-cache-ttl', default=3600, type=int, help='Seconds a persisted AWS API response is reused')
+@click.option('--record', default=None, help='Record all provider API responses to this directory')
+@click.option('--replay', default=None, help='Replay provider API responses recorded in this directory')
+@click.option('--metrics-out', default=None, help='Write per-operation AWS API metrics to this JSON file')
+@click.option('--inner-parallel', default=None, help='Workers per module for its own resources, e.g. "4" or "vpc=4,s3=8"')
+@click.option('--refresh-shards', default=None, type=click.IntRange(min=1), help='Concurrent terraform refreshes a module state is split into')
+@click.option('--full-refresh', is_flag=True, default=False, help='Refresh every resource, ignoring the states cached by previous runs')
+def main(provider, module, output_dir, process_dependencies, run_plan, token, cache_dir, filters, github_push_repo, stack_name, api_cache_dir, api_cache_ttl, record, replay, metrics_out, inner_parallel, refresh_shards, full_refresh):
 
     if github_push_repo and output_dir != os.getcwd():
         raise click.UsageError(
             "Cannot specify '--output_dir' when '--github-push-repo' is provided. Please remove the '--output_dir' option.")
 
+    if record and replay:
+        raise click.UsageError("Cannot specify both '--record' and '--replay'.")
+
     if output_dir:
         output_dir = os.path.abspath(output_dir)
 
@@ -80,6 +96,20 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
     if not os.environ.get('FT_CACHE_DIR') and cache_dir:
         os.environ['FT_CACHE_DIR'] = cache_dir
 
+    if inner_parallel:
+        try:
+            parse_inner_parallel(inner_parallel)
+        except ValueError:
+            raise click.BadParameter(
+                f"Invalid value '{inner_parallel}'", param_hint="'--inner-parallel'")
+        os.environ['FT_INNER_PARALLEL'] = inner_parallel
+
+    if refresh_shards:
+        os.environ['FT_REFRESH_SHARDS'] = str(refresh_shards)
+
+    if full_refresh:
+        os.environ['FT_FULL_REFRESH'] = 'true'
+
     setup_logger()
     logger = logging.getLogger('finisterra')
 
@@ -101,6 +131,17 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
         console=console
     )
 
+    cassette = None
+    if record:
+        cassette = Cassette(record, "record", provider)
+    elif replay:
+        cassette = Cassette(replay, "replay", provider)
+
+    api_metrics = None
+    if metrics_out:
+        metrics_out = os.path.abspath(metrics_out)
+        api_metrics = ApiMetrics()
+
     execute = False
 
     if provider == "cloudflare":
@@ -117,12 +158,13 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
 
         script_dir = tempfile.mkdtemp()
         provider_instance = Cloudflare(
-            progress, script_dir, output_dir, filters)
+            progress, script_dir, output_dir, filters, cassette)
 
         # Define all provider methods for execution
         all_provider_methods = [
             'dns',
         ]
+        module_order_hints = {}
 
     if provider == "aws":
         execute = True
@@ -146,6 +188,8 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
             )
 
         sts = session.client('sts')
+        if cassette:
+            cassette.register(sts)
         account_id = sts.get_caller_identity()['Account']
 
         auth_payload = {
@@ -162,7 +206,8 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
         script_dir = tempfile.mkdtemp()
 
         provider_instance = Aws(progress, script_dir, s3Bucket, dynamoDBTable,
-                                stateKey, account_id, region, output_dir, filters)
+                                stateKey, account_id, region, output_dir, filters,
+                                api_cache_dir, api_cache_ttl, cassette, api_metrics)
 
         # Define all provider methods for execution
         all_provider_methods = [
@@ -202,6 +247,11 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
             'client_vpn',
         ]
 
+        # Modules whose results warm the shared caches for others, run first
+        module_order_hints = {
+            'security_group': ['ec2', 'elbv2'],
+        }
+
         if github_push_repo:
             github_utils.create_aws_gh_role()
 
@@ -231,13 +281,15 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
                 modules_to_execute = [mod.strip()
                                       for mod in modules_to_execute]
 
-            max_parallel = int(os.getenv('MAX_PARALLEL', 5))
-            results = []
-            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
-                futures = [executor.submit(
-                    execute_provider_method, provider_instance, method) for method in modules_to_execute]
-                for future in as_completed(futures):
-                    results.append(future.result())
+            max_parallel = int(os.getenv('MAX_PARALLEL', max(5, os.cpu_count() or 1)))
+            scheduler = ModuleScheduler(
+                provider, modules_to_execute, max_parallel, module_order_hints)
+            results = scheduler.run(execute_provider_method, provider_instance)
+
+            if provider == "aws":
+                provider_instance.api_cache.report()
+            if cassette:
+                cassette.save()
 
             # After collecting all results, update ftstacks once
             global ftstacks
@@ -264,8 +316,6 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
             ftstacks = [stack_name]
 
         if run_plan and ftstacks:
-            # check if the output directory exists
-            os.chdir(os.path.join(output_dir, "tf_code"))
             shutil.copyfile(os.path.join(base_dir, "terragrunt.hcl"),
                             os.path.join(base_dir, "terragrunt.hcl.remote-state"))
             shutil.copyfile(os.path.join(
@@ -282,7 +332,6 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
                         results.append(result)
 
             # Restore original terragrunt.hcl files after all plans have been executed
-            os.chdir(os.path.join(output_dir, "tf_code"))
             shutil.copyfile(os.path.join(base_dir, "terragrunt.hcl"), os.path.join(
                 base_dir, "terragrunt.hcl.local-state"))
             shutil.copyfile(os.path.join(base_dir, "terragrunt.hcl.remote-state"),
@@ -319,6 +368,9 @@ def main(provider, module, output_dir, process_dependencies, run_plan, token, ca
                 if not github_push_repo:
                     logger.info(f"Terraform code created at: {generated_path}")
 
+    if api_metrics:
+        api_metrics.save(metrics_out)
+
 
 def setup_logger():
     # Set the log level for the root logger to NOTSET (this is required to allow handlers to control the logging level)
@@ -7,6 +7,7 @@ import logging
 
 
 from ...utils.filesystem import load_provider_schema
+from ...utils.api_store import ApiStore
 from ...providers.aws.vpc import VPC
 from ...providers.aws.vpc_endpoint import VPCEndPoint
 from ...providers.aws.acm import ACM
@@ -40,17 +41,22 @@ from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.target_group import TargetGroup
 from ...providers.aws.elasticsearch import Elasticsearch
 from ...providers.aws.aws_clients import AwsClients
+from ...providers.aws.api_cache import ApiCache
+from ...providers.aws.rate_limiter import RateLimiter
 from ...providers.aws.codeartifact import CodeArtifact
 from ...providers.aws.launchtemplate import LaunchTemplate
 from ...providers.aws.client_vpn import ClientVPN
-from ...providers.aws.utils import parse_filters
+from ...providers.aws.filters import ResourceFilter
+from ...providers.aws.network_inventory import get_network_inventory
+from ...providers.aws.utils import parse_filters, get_network_index, get_kms_alias_index, get_tag_index
 
 logger = logging.getLogger('finisterra')
 
 
 class Aws:
     def __init__(self, progress, script_dir, s3Bucket,
-                 dynamoDBTable, state_key, aws_account_id, aws_region, output_dir, filters):
+                 dynamoDBTable, state_key, aws_account_id, aws_region, output_dir, filters,
+                 api_cache_dir=None, api_cache_ttl=3600, cassette=None, api_metrics=None):
         self.progress = progress
         self.output_dir = output_dir
         self.provider_name = "registry.terraform.io/hashicorp/aws"
@@ -69,7 +75,19 @@ class Aws:
         self.region = aws_region
         self.aws_account_id = aws_account_id
         self.session = boto3.Session()
-        self.aws_clients = AwsClients(self.session, self.region)
+        api_store = ApiStore(api_cache_dir, api_cache_ttl) if api_cache_dir else None
+        self.api_cache = ApiCache(self.aws_account_id, api_store)
+        hooks = [self.api_cache]
+        if api_metrics:
+            hooks.append(api_metrics)
+        if cassette:
+            hooks.append(cassette)
+        hooks.append(RateLimiter())
+        self.aws_clients = AwsClients(self.session, self.region, hooks=hooks)
+        self.network_index = get_network_index(self.aws_clients)
+        self.kms_alias_index = get_kms_alias_index(self.aws_clients)
+        self.tag_index = get_tag_index(self.aws_clients)
+        self.network_inventory = get_network_inventory(self.aws_clients)
         self.account_name = self.get_account_name()
 
         if filters:
@@ -77,6 +95,7 @@ class Aws:
             logger.info(f"Filters: {self.filters}")
         else:
             self.filters = None
+        self.resource_filter = ResourceFilter(self.filters)
 
     def get_account_name(self):
         account_name = self.aws_account_id
@@ -1,4 +1,5 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import paginate_with_progress, stream_pages, state_payload, combined_state_payload
 import datetime
 import logging
 import inspect
@@ -56,20 +57,11 @@ class ACM:
 
         paginator = self.provider_instance.aws_clients.acm_client.get_paginator(
             "list_certificates")
-        total = 0
-        for page in paginator.paginate():
-            for cert_summary in page["CertificateSummaryList"]:
-                total += 1
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for cert_summary in page["CertificateSummaryList"]:
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{cert_summary['CertificateArn'].split('/')[-1]}[/]")
-                cert_arn = cert_summary["CertificateArn"]
-                self.process_single_acm_certificate(cert_arn, ftstack)
+        for cert_summary in paginate_with_progress(self, stream_pages(paginator), "CertificateSummaryList"):
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{cert_summary['CertificateArn'].split('/')[-1]}[/]")
+            cert_arn = cert_summary["CertificateArn"]
+            self.process_single_acm_certificate(cert_arn, ftstack)
 
     def process_single_acm_certificate(self, cert_arn, ftstack=None):
         resource_name = "aws_acm_certificate"
@@ -108,8 +100,11 @@ class ACM:
             "domain_name": cert_domain,
         }
 
+        tags = state_payload(
+            self.provider_instance.aws_clients.acm_client.list_tags_for_certificate, "Tags", CertificateArn=cert_arn)
         self.hcl.process_resource(
-            resource_name, cert_arn.replace("-", "_"), attributes)
+            resource_name, cert_arn.replace("-", "_"), attributes,
+            combined_state_payload(certificate=cert_details, tags=tags))
         self.hcl.add_stack(resource_name, id, ftstack)
 
         # self.aws_acm_certificate_validation(cert_arn, cert_details)
@@ -127,4 +122,4 @@ class ACM:
                 cert["DomainValidationOptions"][0]["ResourceRecord"]["Name"]]
 
         self.hcl.process_resource(
-            "aws_acm_certificate_validation", cert_arn.replace("-", "_"), attributes)
+            "aws_acm_certificate_validation", cert_arn.replace("-", "_"), attributes, cert)
@@ -0,0 +1,160 @@
+import copy
+import json
+import logging
+import threading
+
+from botocore.awsrequest import AWSResponse
+
+logger = logging.getLogger('finisterra')
+
+CACHEABLE_PREFIXES = ("Describe", "List", "Get")
+
+THROTTLING_ERRORS = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+}
+
+
+def is_cacheable(model):
+    return model.name.startswith(CACHEABLE_PREFIXES) and not model.has_streaming_output
+
+
+def cache_key(model, params, context):
+    normalized = json.dumps(params, sort_keys=True, default=str)
+    return (context.get('client_region'), model.service_model.service_name, model.name, normalized)
+
+
+def error_code(parsed):
+    return parsed.get("Error", {}).get("Code")
+
+
+class ApiCache:
+    """
+    Run-scoped memo of read-only (Describe*/List*/Get*) AWS calls.
+
+    It is registered on every client built by AwsClients, so paginators and
+    direct calls from all module threads share the same entries. Identical
+    calls issued concurrently are collapsed into a single request: the first
+    thread performs it and the others wait for its response.
+
+    With a store (see utils.api_store.ApiStore) successful responses are also
+    persisted, keyed by account, region and call, and served from disk by the
+    next runs while they are fresh.
+    """
+
+    def __init__(self, account_id=None, store=None, wait_timeout=300):
+        self.account_id = account_id
+        self.store = store
+        self.wait_timeout = wait_timeout
+        self.responses = {}
+        self.in_flight = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def register(self, client):
+        events = client.meta.events
+        events.register('before-parameter-build', self.before_parameter_build)
+        events.register('before-call', self.before_call)
+        events.register('after-call', self.after_call)
+        events.register('after-call-error', self.after_call_error)
+
+    def before_parameter_build(self, params, model, context, **kwargs):
+        if is_cacheable(model):
+            context['ft_cache_key'] = cache_key(model, params, context)
+
+    def before_call(self, context, **kwargs):
+        key = context.get('ft_cache_key')
+        if key is None:
+            return None
+
+        while True:
+            with self.lock:
+                if key in self.responses:
+                    self.hits += 1
+                    status_code, parsed = self.responses[key]
+                    return AWSResponse(None, status_code, {}, None), copy.deepcopy(parsed)
+                event = self.in_flight.get(key)
+                if event is None:
+                    self.in_flight[key] = threading.Event()
+                    break
+
+            # Another thread is already fetching this call, wait for it
+            if not event.wait(self.wait_timeout):
+                logger.debug(f"Timed out waiting for in-flight call {key[2]}")
+                with self.lock:
+                    self.misses += 1
+                return None
+
+        # This thread is the one fetching the call, try the disk first. Unless
+        # it goes on to send the request, waiters are released whatever happens.
+        leader = False
+        try:
+            stored = self.store.get(self.store_key(key)) if self.store else None
+            with self.lock:
+                if stored:
+                    self.disk_hits += 1
+                    self.responses[key] = stored
+                else:
+                    self.misses += 1
+                    context['ft_cache_leader'] = leader = True
+                    return None
+        finally:
+            if not leader:
+                self.release(key)
+        status_code, parsed = stored
+        return AWSResponse(None, status_code, {}, None), copy.deepcopy(parsed)
+
+    def after_call(self, http_response, parsed, context, **kwargs):
+        if not context.pop('ft_cache_leader', False):
+            return
+        key = context['ft_cache_key']
+        status_code = http_response.status_code
+        try:
+            with self.lock:
+                # Client errors (e.g. NoSuchTagSet) are as stable as the data itself
+                # within a run, throttling and server errors are not.
+                if status_code < 300 or (status_code < 500 and error_code(parsed) not in THROTTLING_ERRORS):
+                    self.responses[key] = (status_code, copy.deepcopy(parsed))
+        finally:
+            self.release(key)
+        if self.store and status_code < 300:
+            self.store.put(self.store_key(key), status_code, parsed)
+
+    def after_call_error(self, context, **kwargs):
+        if not context.pop('ft_cache_leader', False):
+            return
+        self.release(context['ft_cache_key'])
+
+    def release(self, key):
+        """Wakes the threads waiting for the in-flight call."""
+        with self.lock:
+            event = self.in_flight.pop(key, None)
+        if event is not None:
+            event.set()
+
+    def store_key(self, key):
+        return (self.account_id,) + key
+
+    def report(self):
+        hits = self.hits + self.disk_hits
+        total = hits + self.misses
+        ratio = (hits / total * 100) if total else 0
+        message = f"API cache: {self.hits} hits, "
+        if self.store:
+            message += f"{self.disk_hits} disk hits, "
+        message += f"{self.misses} misses ({ratio:.1f}% hit rate)"
+        logger.info(message)
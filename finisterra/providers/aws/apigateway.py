@@ -3,7 +3,8 @@ from ...providers.aws.vpc_endpoint import VPCEndPoint
 from ...providers.aws.elbv2 import ELBV2
 from ...providers.aws.logs import Logs
 from ...providers.aws.acm import ACM
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from ...providers.aws.utils import state_payload
+from ...utils.parallel import for_each
 import logging
 import inspect
 
@@ -74,7 +75,7 @@ class Apigateway:
         attributes["id"] = "api_gateway_account"
 
         self.hcl.process_resource(
-            "aws_api_gateway_account", "api_gateway_account", attributes)
+            "aws_api_gateway_account", "api_gateway_account", attributes, account)
 
     def aws_api_gateway_rest_api(self):
         resource_type = "aws_api_gateway_rest_api"
@@ -109,9 +110,11 @@ class Apigateway:
 
             ftstack = "apigateway"
             try:
-                response = self.provider_instance.aws_clients.apigateway_client.get_tags(
-                    resourceArn=arn)
-                tags = response.get('tags', {})
+                tags = self.provider_instance.tag_index.tags(arn)
+                if tags is None:
+                    response = self.provider_instance.aws_clients.apigateway_client.get_tags(
+                        resourceArn=arn)
+                    tags = response.get('tags', {})
                 for tag_key, tag_value in tags.items():
                     if tag_key == 'ftstack':
                         if tag_value != 'apigateway':
@@ -126,7 +129,7 @@ class Apigateway:
 
             resource_name = f"{api_id}"
             self.hcl.process_resource(
-                resource_type, resource_name, attributes)
+                resource_type, resource_name, attributes, rest_api)
 
             endpoint_configuration = rest_api.get("endpointConfiguration", {})
             if "vpcEndpointIds" in endpoint_configuration:
@@ -171,7 +174,7 @@ class Apigateway:
 
             resource_name = f"{rest_api_id}-{stage['stageName']}"
             self.hcl.process_resource(
-                "aws_api_gateway_stage", resource_name, attributes)
+                "aws_api_gateway_stage", resource_name, attributes, stage)
 
             accessLogSettings = stage.get("accessLogSettings", {})
             if "destinationArn" in accessLogSettings:
@@ -211,7 +214,9 @@ class Apigateway:
         }
 
         self.hcl.process_resource(
-            "aws_api_gateway_deployment", deployment_id, attributes)
+            "aws_api_gateway_deployment", deployment_id, attributes,
+            state_payload(self.provider_instance.aws_clients.apigateway_client.get_deployment,
+                          restApiId=rest_api_id, deploymentId=deployment_id))
 
     def aws_api_gateway_method(self, rest_api_id, resource_id, ftstack):
         try:
@@ -235,7 +240,9 @@ class Apigateway:
 
                 resource_name = f"{rest_api_id}-{resource_id}-{method}"
                 self.hcl.process_resource(
-                    "aws_api_gateway_method", resource_name, attributes)
+                    "aws_api_gateway_method", resource_name, attributes,
+                    state_payload(self.provider_instance.aws_clients.apigateway_client.get_method,
+                                  restApiId=rest_api_id, resourceId=resource_id, httpMethod=method))
                 self.aws_api_gateway_integration(
                     rest_api_id, resource_id, method, ftstack)
                 self.aws_api_gateway_method_response(
@@ -264,7 +271,7 @@ class Apigateway:
 
                 resource_name = f"{rest_api_id}-{stage['stageName']}-{key}"
                 self.hcl.process_resource(
-                    "aws_api_gateway_method_settings", resource_name, attributes)
+                    "aws_api_gateway_method_settings", resource_name, attributes, setting)
 
     def aws_api_gateway_rest_api_policy(self, rest_api_id):
         logger.debug(f"Processing API Gateway REST API Policies...")
@@ -286,7 +293,7 @@ class Apigateway:
 
             resource_name = f"{rest_api_id}-policy"
             self.hcl.process_resource(
-                "aws_api_gateway_rest_api_policy", resource_name, attributes)
+                "aws_api_gateway_rest_api_policy", resource_name, attributes, policy)
 
     def aws_api_gateway_vpc_link(self, vpc_link_id, ftstack):
         resource_type = "aws_api_gateway_vpc_link"
@@ -307,7 +314,7 @@ class Apigateway:
             "description": vpc_link.get("description", ""),
             "target_arns": vpc_link["targetArns"],
         }
-        self.hcl.process_resource(resource_type, vpc_link_id, attributes)
+        self.hcl.process_resource(resource_type, vpc_link_id, attributes, vpc_link)
         self.hcl.add_stack(resource_type, vpc_link_id, ftstack)
 
         # find any elb and call self.elbv2_instance
@@ -397,7 +404,7 @@ class Apigateway:
                         attributes["base_path"] = base_path_mapping["basePath"]
 
                     self.hcl.process_resource(
-                        "aws_api_gateway_base_path_mapping", attributes["id"], attributes)
+                        "aws_api_gateway_base_path_mapping", attributes["id"], attributes, base_path_mapping)
                     process_domain = True
             if process_domain:
                 self.aws_api_gateway_domain_name(domain, ftstack)
@@ -484,7 +491,7 @@ class Apigateway:
                 }
 
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, domain)
                 self.hcl.add_stack(resource_type, id, ftstack)
 
                 regional_certificate_arn = domain.get(
@@ -521,7 +528,7 @@ class Apigateway:
 
             resource_name = f"{rest_api_id}-{gateway_response['responseType']}"
             self.hcl.process_resource(
-                "aws_api_gateway_gateway_response", resource_name, attributes)
+                "aws_api_gateway_gateway_response", resource_name, attributes, gateway_response)
 
     def aws_api_gateway_integration(self, api_id, resource_id, method, ftstack):
         logger.debug(f"Processing API Gateway Integrations...")
@@ -547,7 +554,7 @@ class Apigateway:
 
             # Process the integration with the attributes
             self.hcl.process_resource(
-                "aws_api_gateway_integration", resource_name, attributes)
+                "aws_api_gateway_integration", resource_name, attributes, integration)
 
             connection_type = integration.get("connectionType", None)
             if connection_type == "VPC_LINK":
@@ -578,7 +585,7 @@ class Apigateway:
 
             resource_name = f"{rest_api_id}-{resource_id}-{method}-{status_code}"
             self.hcl.process_resource(
-                "aws_api_gateway_integration_response", resource_name, attributes)
+                "aws_api_gateway_integration_response", resource_name, attributes, integration_responses[status_code])
 
     def aws_api_gateway_method_response(self, rest_api_id, resource_id, method):
         logger.debug(f"Processing API Gateway Method Responses...")
@@ -599,7 +606,7 @@ class Apigateway:
 
             resource_name = f"{rest_api_id}-{resource_id}-{method}-{status_code}"
             self.hcl.process_resource(
-                "aws_api_gateway_method_response", resource_name, attributes)
+                "aws_api_gateway_method_response", resource_name, attributes, method_details["methodResponses"][status_code])
 
     def aws_api_gateway_model(self, rest_api_id):
         logger.debug(
@@ -619,7 +626,7 @@ class Apigateway:
 
             resource_name = f"{rest_api_id}-{model['name']}"
             self.hcl.process_resource(
-                "aws_api_gateway_model", resource_name, attributes)
+                "aws_api_gateway_model", resource_name, attributes, model)
 
     # def aws_api_gateway_request_validator(self):
     #     logger.debug(f"Processing API Gateway Request Validators...")
@@ -652,22 +659,15 @@ class Apigateway:
         paginator = self.provider_instance.aws_clients.apigateway_client.get_paginator(
             "get_resources")
 
-        page_iterator = paginator.paginate(restApiId=api_id)
-        max_parallel_workers = 1
-        with ThreadPoolExecutor(max_workers=max_parallel_workers) as executor:
-            # Prepare a list of futures
-            futures = []
+        resources = [resource for page in paginator.paginate(restApiId=api_id)
+                     for resource in page["items"]]
 
-            for page in page_iterator:
-                resources = page["items"]
-
-                for resource in resources:
-                    future = executor.submit(
-                        self.single_aws_api_gateway_resource, resource, api_id, ftstack)
-                    futures.append(future)
+        # Created before the workers start, they all add to it
+        if api_id not in self.api_gateway_resource_list:
+            self.api_gateway_resource_list[api_id] = {}
 
-            for future in as_completed(futures):
-                pass
+        for_each(lambda resource: self.single_aws_api_gateway_resource(
+            resource, api_id, ftstack), resources)
 
     def single_aws_api_gateway_resource(self, resource, api_id, ftstack):
         resource_type = "aws_api_gateway_resource"
@@ -680,21 +680,14 @@ class Apigateway:
             "path_part": resource.get("pathPart"),
         }
 
-        if resource_type not in self.hcl.additional_data:
-            self.hcl.additional_data[resource_type] = {}
-        if resource_id not in self.hcl.additional_data[resource_type]:
-            self.hcl.additional_data[resource_type][resource_id] = {}
-        self.hcl.additional_data[resource_type][resource_id]["path"] = resource.get(
-            "path")
-
-        if api_id not in self.api_gateway_resource_list:
-            self.api_gateway_resource_list[api_id] = {}
+        self.hcl.add_additional_data(
+            resource_type, resource_id, "path", resource.get("path"))
 
         self.api_gateway_resource_list[api_id][resource_id] = resource.get(
             "path")
 
         resource_name = f"{api_id}-{resource['path'].replace('/', '-')}"
-        self.hcl.process_resource(resource_type, resource_name, attributes)
+        self.hcl.process_resource(resource_type, resource_name, attributes, resource)
 
         self.aws_api_gateway_method(api_id, resource_id, ftstack)
 
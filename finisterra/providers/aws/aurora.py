@@ -3,8 +3,7 @@ from ...providers.aws.iam_role import IAM
 from ...providers.aws.logs import Logs
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.kms import KMS
-from ...providers.aws.utils import get_subnet_names
-import botocore
+from ...providers.aws.utils import get_subnet_names, get_vpc_name, get_vpc_name_by_subnet, get_kms_alias, paginated_state_payload, combined_state_payload
 import logging
 import inspect
 
@@ -37,63 +36,6 @@ class Aurora:
 
         self.aws_rds_cluster_attrs = {}
 
-    def get_kms_alias(self, kms_key_id):
-        try:
-            value = ""
-            response = self.provider_instance.aws_clients.kms_client.list_aliases()
-            aliases = response.get('Aliases', [])
-            while 'NextMarker' in response:
-                response = self.provider_instance.aws_clients.kms_client.list_aliases(
-                    Marker=response['NextMarker'])
-                aliases.extend(response.get('Aliases', []))
-            for alias in aliases:
-                if 'TargetKeyId' in alias and alias['TargetKeyId'] == kms_key_id.split('/')[-1]:
-                    value = alias['AliasName']
-                    break
-            return value
-        except botocore.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'AccessDeniedException':
-                return ""
-            else:
-                raise e
-
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
-    def get_vpc_name_by_subnet(self, subnet_ids):
-        vpc_id = ""
-        vpc_name = ""
-        if subnet_ids:
-            subnet_id = subnet_ids[0]
-            # get the vpc id for the subnet_id
-            response = self.provider_instance.aws_clients.ec2_client.describe_subnets(SubnetIds=[
-                                                                    subnet_id])
-            if not response or 'Subnets' not in response or not response['Subnets']:
-                # Handle this case as required, for example:
-                logger.debug(
-                    f"No subnet information found for Subnet ID: {subnet_id}")
-                return None
-            vpc_id = response['Subnets'][0].get('VpcId', None)
-
-            if vpc_id:
-                vpc_name = self.get_vpc_name(vpc_id)
-
-        return vpc_id, vpc_name
-
     def aurora(self):
         self.hcl.prepare_folder()
         self.aws_rds_cluster()
@@ -129,7 +71,7 @@ class Aurora:
                         "id": snapshot_id,
                     }
                     self.hcl.process_resource(
-                        "aws_db_cluster_snapshot", snapshot_id.replace("-", "_"), attributes)
+                        "aws_db_cluster_snapshot", snapshot_id.replace("-", "_"), attributes, snapshot)
 
     def aws_appautoscaling_target(self, cluster_arn):
         logger.debug(
@@ -155,7 +97,7 @@ class Aurora:
                 }
 
                 self.hcl.process_resource(
-                    "aws_appautoscaling_target", target_id, attributes)
+                    "aws_appautoscaling_target", target_id, attributes, target)
 
     def aws_appautoscaling_policy(self, cluster_arn):
         logger.debug(
@@ -182,7 +124,7 @@ class Aurora:
                 }
 
                 self.hcl.process_resource(
-                    "aws_appautoscaling_policy", policy_name, attributes)
+                    "aws_appautoscaling_policy", policy_name, attributes, policy)
 
     def aws_db_event_subscription(self):
         logger.debug(f"Processing DB Event Subscriptions...")
@@ -204,7 +146,7 @@ class Aurora:
                     "enabled": subscription["Enabled"],
                 }
                 self.hcl.process_resource(
-                    "aws_db_event_subscription", subscription_id.replace("-", "_"), attributes)
+                    "aws_db_event_subscription", subscription_id.replace("-", "_"), attributes, subscription)
 
     def aws_db_instance(self):
         logger.debug(f"Processing DB Instances...")
@@ -234,7 +176,7 @@ class Aurora:
                     "skip_final_snapshot": instance.get("SkipFinalSnapshot", False),
                 }
                 self.hcl.process_resource(
-                    "aws_db_instance", instance_id.replace("-", "_"), attributes)
+                    "aws_db_instance", instance_id.replace("-", "_"), attributes, instance)
 
     def aws_db_instance_automated_backups_replication(self):
         logger.debug(
@@ -257,7 +199,7 @@ class Aurora:
                             "replica_db_instance_identifier": replica_id,
                         }
                         self.hcl.process_resource("aws_db_instance_automated_backups_replication",
-                                                  f"{source_instance_id}-{replica_id}".replace("-", "_"), attributes)
+                                                  f"{source_instance_id}-{replica_id}".replace("-", "_"), attributes, instance)
 
     def aws_db_instance_role_association(self):
         logger.debug(f"Processing DB Instance Role Associations...")
@@ -281,7 +223,7 @@ class Aurora:
                         "role_arn": role_arn,
                     }
                     self.hcl.process_resource(
-                        "aws_db_instance_role_association", f"{instance_id}-{role_arn}".replace("-", "_"), attributes)
+                        "aws_db_instance_role_association", f"{instance_id}-{role_arn}".replace("-", "_"), attributes, role)
 
     def aws_db_option_group(self):
         logger.debug(f"Processing DB Option Groups...")
@@ -301,7 +243,7 @@ class Aurora:
                     "option_group_description": option_group["OptionGroupDescription"],
                 }
                 self.hcl.process_resource(
-                    "aws_db_option_group", option_group_name.replace("-", "_"), attributes)
+                    "aws_db_option_group", option_group_name.replace("-", "_"), attributes, option_group)
 
     def aws_db_parameter_group(self, parameter_group_name, ftstack):
         resource_type = "aws_db_parameter_group"
@@ -327,9 +269,16 @@ class Aurora:
                     "description": parameter_group["Description"],
                 }
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, self.parameter_group_payload(parameter_group))
                 self.hcl.add_stack(resource_type, id, ftstack)
 
+    def parameter_group_payload(self, parameter_group):
+        """The parameter group and the parameters set on it, None if they cannot be listed."""
+        parameters = paginated_state_payload(
+            self.provider_instance.aws_clients.rds_client.get_paginator("describe_db_parameters"),
+            "Parameters", DBParameterGroupName=parameter_group["DBParameterGroupName"], Source="user")
+        return combined_state_payload(group=parameter_group, parameters=parameters)
+
     def aws_db_proxy(self):
         logger.debug(f"Processing DB Proxies...")
 
@@ -347,7 +296,7 @@ class Aurora:
                     "role_arn": db_proxy["RoleArn"],
                 }
                 self.hcl.process_resource(
-                    "aws_db_proxy", db_proxy_name.replace("-", "_"), attributes)
+                    "aws_db_proxy", db_proxy_name.replace("-", "_"), attributes, db_proxy)
 
     def aws_db_proxy_default_target_group(self):
         logger.debug(f"Processing DB Proxy Default Target Groups...")
@@ -374,7 +323,7 @@ class Aurora:
                     "db_proxy_name": target_group.get("DBProxyName"),
                 }
                 self.hcl.process_resource(
-                    "aws_db_proxy_default_target_group", target_group_name.replace("-", "_"), attributes)
+                    "aws_db_proxy_default_target_group", target_group_name.replace("-", "_"), attributes, target_group)
 
     def aws_db_proxy_endpoint(self):
         logger.debug(f"Processing DB Proxy Endpoints...")
@@ -393,7 +342,7 @@ class Aurora:
                     "vpc_subnet_ids": db_proxy_endpoint["VpcSubnetIds"],
                 }
                 self.hcl.process_resource(
-                    "aws_db_proxy_endpoint", db_proxy_endpoint_name.replace("-", "_"), attributes)
+                    "aws_db_proxy_endpoint", db_proxy_endpoint_name.replace("-", "_"), attributes, db_proxy_endpoint)
 
     def aws_db_proxy_target(self):
         logger.debug(f"Processing DB Proxy Targets...")
@@ -421,7 +370,7 @@ class Aurora:
                         "db_instance_identifier": db_proxy_target.get("DbInstanceIdentifier", None),
                     }
                     self.hcl.process_resource("aws_db_proxy_target", target_arn.replace(
-                        ":", "_").replace("-", "_"), attributes)
+                        ":", "_").replace("-", "_"), attributes, db_proxy_target)
 
     def aws_db_snapshot(self):
         logger.debug(f"Processing DB Snapshots...")
@@ -436,7 +385,7 @@ class Aurora:
                     "id": db_snapshot_id,
                 }
                 self.hcl.process_resource(
-                    "aws_db_snapshot", db_snapshot_id.replace("-", "_"), attributes)
+                    "aws_db_snapshot", db_snapshot_id.replace("-", "_"), attributes, db_snapshot)
 
     def aws_db_snapshot_copy(self):
         logger.debug(f"Processing DB Snapshot Copies...")
@@ -456,7 +405,7 @@ class Aurora:
                         "source_region": db_snapshot["SourceRegion"],
                     }
                     self.hcl.process_resource(
-                        "aws_db_snapshot_copy", db_snapshot_id.replace("-", "_"), attributes)
+                        "aws_db_snapshot_copy", db_snapshot_id.replace("-", "_"), attributes, db_snapshot)
 
     def aws_db_subnet_group(self, db_subnet_group_name, ftstack):
         resource_type = "aws_db_subnet_group"
@@ -479,7 +428,7 @@ class Aurora:
                     self.hcl.add_additional_data(
                         resource_type, id, "subnet_names",  subnet_names)
 
-                vpc_id, vpc_name = self.get_vpc_name_by_subnet(subnet_ids)
+                vpc_id, vpc_name = get_vpc_name_by_subnet(self.provider_instance.aws_clients, subnet_ids)
                 if vpc_id:
                     self.hcl.add_additional_data(
                         resource_type, id, "vpc_id",  vpc_id)
@@ -500,7 +449,7 @@ class Aurora:
                     "id": id,
                 }
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, db_subnet_group)
                 self.hcl.add_stack(resource_type, id, ftstack)
 
     def aws_rds_cluster(self):
@@ -550,7 +499,7 @@ class Aurora:
                     "port": rds_cluster["Port"],
                 }
                 self.hcl.process_resource(
-                    resource_type, cluster_arn, attributes)
+                    resource_type, cluster_arn, attributes, rds_cluster)
 
                 self.hcl.add_stack(resource_type, cluster_arn, ftstack)
 
@@ -562,7 +511,7 @@ class Aurora:
 
                     if sg_details and sg_details['SecurityGroups']:
                         vpc_id = sg_details['SecurityGroups'][0].get('VpcId')
-                        vpc_name = self.get_vpc_name(vpc_id)
+                        vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
                         if vpc_name:
                             self.hcl.add_additional_data(
                                 resource_type, cluster_arn, "vpc_name",  vpc_name)
@@ -583,7 +532,7 @@ class Aurora:
                 if kms_key_id:
                     type = self.kms_instance.aws_kms_key(kms_key_id, ftstack)
                     if type == "MANAGED":
-                        kms_key_alias = self.get_kms_alias(kms_key_id)
+                        kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, kms_key_id)
                         if kms_key_alias:
                             self.hcl.add_additional_data(
                                 resource_type, cluster_arn, "kms_key_alias",  kms_key_alias)
@@ -624,7 +573,7 @@ class Aurora:
                         "activity_stream_kms_key_id": rds_cluster["ActivityStreamKmsKeyId"],
                     }
                     self.hcl.process_resource(
-                        "aws_rds_cluster_activity_stream", rds_cluster_id.replace("-", "_"), attributes)
+                        "aws_rds_cluster_activity_stream", rds_cluster_id.replace("-", "_"), attributes, rds_cluster)
 
     def aws_rds_cluster_endpoint(self, cluster_id):
         logger.debug(f"Processing RDS Cluster Endpoints...")
@@ -647,7 +596,7 @@ class Aurora:
                         # "custom_endpoint_type": rds_cluster_endpoint.get("CustomEndpointType"),
                     }
                     self.hcl.process_resource(
-                        "aws_rds_cluster_endpoint", endpoint_id.replace("-", "_"), attributes)
+                        "aws_rds_cluster_endpoint", endpoint_id.replace("-", "_"), attributes, rds_cluster_endpoint)
 
     def aws_rds_cluster_instance(self, cluster_id, ftstack, rds_cluster_data):
         logger.debug(f"Processing RDS Cluster Instances...")
@@ -666,7 +615,7 @@ class Aurora:
                         "id": rds_instance["DBInstanceArn"],
                     }
                     self.hcl.process_resource(
-                        "aws_rds_cluster_instance", instance_id.replace("-", "_"), attributes)
+                        "aws_rds_cluster_instance", instance_id.replace("-", "_"), attributes, rds_instance)
 
                     # Extract the DBSubnetGroupName and call the aws_db_subnet_group function
                     db_subnet_group = rds_instance.get(
@@ -698,7 +647,7 @@ class Aurora:
                         type = self.kms_instance.aws_kms_key(
                             performance_insights_kms_key_id, ftstack)
                         if type == "MANAGED":
-                            kms_key_alias = self.get_kms_alias(
+                            kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, 
                                 performance_insights_kms_key_id)
                             if kms_key_alias:
                                 self.hcl.add_additional_data(
@@ -746,9 +695,16 @@ class Aurora:
                     # "description": rds_cluster_parameter_group["Description"],
                 }
                 self.hcl.process_resource(
-                    resource_type, parameter_group_id.replace("-", "_"), attributes)
+                    resource_type, parameter_group_id.replace("-", "_"), attributes, self.cluster_parameter_group_payload(rds_cluster_parameter_group))
                 self.hcl.add_stack(resource_type, id, ftstack)
 
+    def cluster_parameter_group_payload(self, parameter_group):
+        """The parameter group and the parameters set on it, None if they cannot be listed."""
+        parameters = paginated_state_payload(
+            self.provider_instance.aws_clients.rds_client.get_paginator("describe_db_cluster_parameters"),
+            "Parameters", DBClusterParameterGroupName=parameter_group["DBClusterParameterGroupName"], Source="user")
+        return combined_state_payload(group=parameter_group, parameters=parameters)
+
     def aws_rds_cluster_role_association(self, cluster_id):
         logger.debug(f"Processing RDS Cluster Role Associations...")
 
@@ -775,7 +731,7 @@ class Aurora:
                         "role_arn": role_arn,
                     }
                     self.hcl.process_resource(
-                        "aws_rds_cluster_role_association", association_id.replace("-", "_"), attributes)
+                        "aws_rds_cluster_role_association", association_id.replace("-", "_"), attributes, associated_role)
 
     def aws_rds_export_task(self):
         logger.debug(f"Processing RDS Export Tasks...")
@@ -797,7 +753,7 @@ class Aurora:
                     "export_only": export_task["ExportOnly"],
                 }
                 self.hcl.process_resource(
-                    "aws_rds_export_task", export_task_id.replace("-", "_"), attributes)
+                    "aws_rds_export_task", export_task_id.replace("-", "_"), attributes, export_task)
 
     def aws_rds_global_cluster(self):
         logger.debug(f"Processing RDS Global Clusters...")
@@ -817,7 +773,7 @@ class Aurora:
                     "deletion_protection": global_cluster["DeletionProtection"],
                 }
                 self.hcl.process_resource(
-                    "aws_rds_global_cluster", global_cluster_id.replace("-", "_"), attributes)
+                    "aws_rds_global_cluster", global_cluster_id.replace("-", "_"), attributes, global_cluster)
 
     def aws_rds_reserved_instance(self):
         logger.debug(f"Processing RDS Reserved Instances...")
@@ -842,7 +798,7 @@ class Aurora:
                     "product_description": reserved_instance["ProductDescription"],
                 }
                 self.hcl.process_resource(
-                    "aws_rds_reserved_instance", reserved_instance_id.replace("-", "_"), attributes)
+                    "aws_rds_reserved_instance", reserved_instance_id.replace("-", "_"), attributes, reserved_instance)
 
     def aws_appautoscaling_target(self, cluster_identifier):
         cluster_identifier = f"cluster:{cluster_identifier}"
@@ -869,7 +825,7 @@ class Aurora:
                 }
 
                 self.hcl.process_resource(
-                    "aws_appautoscaling_target", target_id, attributes)
+                    "aws_appautoscaling_target", target_id, attributes, target)
 
     def aws_appautoscaling_policy(self, cluster_identifier):
         cluster_identifier = f"cluster:{cluster_identifier}"
@@ -897,4 +853,4 @@ class Aurora:
                 }
 
                 self.hcl.process_resource(
-                    "aws_appautoscaling_policy", policy_name, attributes)
+                    "aws_appautoscaling_policy", policy_name, attributes, policy)
@@ -2,7 +2,7 @@ from ...utils.hcl import HCL
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.iam_role import IAM
 from ...providers.aws.launchtemplate import LaunchTemplate
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import paginate_items, paginate_with_progress, stream_pages, get_subnet_names
 import logging
 import inspect
 
@@ -57,8 +57,8 @@ class AutoScaling:
     def aws_autoscaling_attachment(self):
         logger.debug(f"Processing AutoScaling Attachments...")
 
-        as_groups = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_groups()[
-            "AutoScalingGroups"]
+        as_groups = paginate_items(
+            self.provider_instance.aws_clients.autoscaling_client.get_paginator("describe_auto_scaling_groups"), "AutoScalingGroups")
 
         for as_group in as_groups:
             as_group_name = as_group["AutoScalingGroupName"]
@@ -73,20 +73,16 @@ class AutoScaling:
                     "elb": elb_name,
                 }
                 self.hcl.process_resource(
-                    "aws_autoscaling_attachment", resource_name.replace("-", "_"), attributes)
+                    "aws_autoscaling_attachment", resource_name.replace("-", "_"), attributes, elb_name)
 
     def aws_autoscaling_group(self):
         resource_type = "aws_autoscaling_group"
         # logger.debug(f"Processing AutoScaling Groups...")
 
-        as_groups = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_groups()[
-            "AutoScalingGroups"]
+        paginator = self.provider_instance.aws_clients.autoscaling_client.get_paginator(
+            "describe_auto_scaling_groups")
 
-        if len(as_groups) > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=len(as_groups))
-
-        for as_group in as_groups:
+        for as_group in paginate_with_progress(self, stream_pages(paginator), "AutoScalingGroups"):
             as_group_name = as_group["AutoScalingGroupName"]
 
             # if as_group_name != "xxxx":
@@ -113,7 +109,7 @@ class AutoScaling:
             }
 
             self.hcl.process_resource(
-                resource_type, id, attributes)
+                resource_type, id, attributes, {key: value for key, value in as_group.items() if key != "Instances"})
 
             ftstack = "autoscaling"
             # get the autoscaling tags
@@ -164,8 +160,8 @@ class AutoScaling:
     def aws_autoscaling_group_tag(self):
         logger.debug(f"Processing AutoScaling Group Tags...")
 
-        as_groups = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_groups()[
-            "AutoScalingGroups"]
+        as_groups = paginate_items(
+            self.provider_instance.aws_clients.autoscaling_client.get_paginator("describe_auto_scaling_groups"), "AutoScalingGroups")
 
         for as_group in as_groups:
             as_group_name = as_group["AutoScalingGroupName"]
@@ -184,13 +180,13 @@ class AutoScaling:
                     "value": value,
                 }
                 self.hcl.process_resource(
-                    "aws_autoscaling_group_tag", resource_name.replace("-", "_"), attributes)
+                    "aws_autoscaling_group_tag", resource_name.replace("-", "_"), attributes, tag)
 
     def aws_autoscaling_lifecycle_hook(self):
         logger.debug(f"Processing AutoScaling Lifecycle Hooks...")
 
-        as_groups = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_groups()[
-            "AutoScalingGroups"]
+        as_groups = paginate_items(
+            self.provider_instance.aws_clients.autoscaling_client.get_paginator("describe_auto_scaling_groups"), "AutoScalingGroups")
 
         for as_group in as_groups:
             as_group_name = as_group["AutoScalingGroupName"]
@@ -222,13 +218,13 @@ class AutoScaling:
                     attributes["default_result"] = hook["DefaultResult"]
 
                 self.hcl.process_resource(
-                    "aws_autoscaling_lifecycle_hook", resource_name, attributes)
+                    "aws_autoscaling_lifecycle_hook", resource_name, attributes, hook)
 
     def aws_autoscaling_notification(self):
         logger.debug(f"Processing AutoScaling Notifications...")
 
-        as_groups = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_groups()[
-            "AutoScalingGroups"]
+        as_groups = paginate_items(
+            self.provider_instance.aws_clients.autoscaling_client.get_paginator("describe_auto_scaling_groups"), "AutoScalingGroups")
 
         notification_types = [
             "autoscaling:EC2_INSTANCE_LAUNCH",
@@ -259,7 +255,7 @@ class AutoScaling:
                     "topic_arn": sns_topic_arn,
                 }
                 self.hcl.process_resource(
-                    "aws_autoscaling_notification", resource_name.replace("-", "_"), attributes)
+                    "aws_autoscaling_notification", resource_name.replace("-", "_"), attributes, notification_types)
 
     def get_sns_topic_arns_for_autoscaling_group(self, as_group_name):
         response = self.provider_instance.aws_clients.autoscaling_client.describe_notification_configurations(
@@ -313,7 +309,7 @@ class AutoScaling:
 
             # Process the attributes with your custom function
             self.hcl.process_resource(
-                "aws_autoscaling_policy", policy_name.replace("-", "_"), attributes)
+                "aws_autoscaling_policy", policy_name.replace("-", "_"), attributes, policy)
 
             if 'Alarms' in policy:
                 for alarm in policy['Alarms']:
@@ -323,8 +319,8 @@ class AutoScaling:
     def aws_autoscaling_schedule(self):
         logger.debug(f"Processing AutoScaling Schedules...")
 
-        as_groups = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_groups()[
-            "AutoScalingGroups"]
+        as_groups = paginate_items(
+            self.provider_instance.aws_clients.autoscaling_client.get_paginator("describe_auto_scaling_groups"), "AutoScalingGroups")
 
         for as_group in as_groups:
             as_group_name = as_group["AutoScalingGroupName"]
@@ -357,7 +353,7 @@ class AutoScaling:
                     attributes["recurrence"] = action["Recurrence"]
 
                 self.hcl.process_resource(
-                    "aws_autoscaling_schedule", action_name.replace("-", "_"), attributes)
+                    "aws_autoscaling_schedule", action_name.replace("-", "_"), attributes, action)
 
     def aws_launch_configuration(self, id, ftstack):
         logger.debug(f"Processing Launch Configuration: {id}")
@@ -405,7 +401,7 @@ class AutoScaling:
             # self.user_data[lc_name] = attributes["user_data"]
 
         self.hcl.process_resource(
-            "aws_launch_configuration", lc_name.replace("-", "_"), attributes)
+            "aws_launch_configuration", lc_name.replace("-", "_"), attributes, launch_configuration)
 
     def aws_cloudwatch_metric_alarm(self, alarm_name):
         logger.debug(f"Processing CloudWatch Metric Alarm: {alarm_name}")
@@ -435,4 +431,4 @@ class AutoScaling:
         }
 
         self.hcl.process_resource("aws_cloudwatch_metric_alarm",
-                                  metric_alarm['AlarmName'].replace("-", "_"), attributes)
+                                  metric_alarm['AlarmName'].replace("-", "_"), attributes, metric_alarm)
@@ -1,46 +1,93 @@
+import threading
+import weakref
+
+# Attribute name on AwsClients -> boto3 service name
+CLIENT_SERVICES = {
+    'acm_client': 'acm',
+    'apigateway_client': 'apigateway',
+    'apigatewayv2_client': 'apigatewayv2',
+    'appautoscaling_client': 'application-autoscaling',
+    'autoscaling_client': 'autoscaling',
+    'backup_client': 'backup',
+    'cloudfront_client': 'cloudfront',
+    'cloudmap_client': 'servicediscovery',
+    'cloudtrail_client': 'cloudtrail',
+    'cloudwatch_client': 'cloudwatch',
+    'cognito_identity_client': 'cognito-identity',
+    'cognito_idp_client': 'cognito-idp',
+    'docdb_client': 'docdb',
+    'dynamodb_client': 'dynamodb',
+    'ec2_client': 'ec2',
+    'ecr_client': 'ecr',
+    'ecr_public_client': 'ecr-public',
+    'ecs_client': 'ecs',
+    'eks_client': 'eks',
+    'efs_client': 'efs',
+    'elasticache_client': 'elasticache',
+    'elasticbeanstalk_client': 'elasticbeanstalk',
+    'elasticsearch_client': 'es',
+    'elb_client': 'elb',
+    'elbv2_client': 'elbv2',
+    'guardduty_client': 'guardduty',
+    'iam_client': 'iam',
+    'kms_client': 'kms',
+    'lambda_client': 'lambda',
+    'logs_client': 'logs',
+    'msk_client': 'kafka',
+    'opensearch_client': 'opensearch',
+    'rds_client': 'rds',
+    'resourcegroupstaggingapi_client': 'resourcegroupstaggingapi',
+    'route53_client': 'route53',
+    's3_client': 's3',
+    'secretsmanager_client': 'secretsmanager',
+    'sns_client': 'sns',
+    'sqs_client': 'sqs',
+    'ssm_client': 'ssm',
+    'sfn_client': 'stepfunctions',
+    'sts_client': 'sts',
+    'wafv2_client': 'wafv2',
+    'codeartifact_client': 'codeartifact',
+}
+
+# Clients already built, per session and then per (region, service, hooks)
+_session_clients = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
 class AwsClients:
-    def __init__(self, session, aws_region):
-        self.acm_client = session.client('acm', region_name=aws_region)
-        self.apigateway_client = session.client('apigateway', region_name=aws_region)
-        self.apigatewayv2_client = session.client('apigatewayv2', region_name=aws_region)
-        self.appautoscaling_client = session.client('application-autoscaling', region_name=aws_region)
-        self.autoscaling_client = session.client('autoscaling', region_name=aws_region)
-        self.backup_client = session.client('backup', region_name=aws_region)
-        self.cloudfront_client = session.client('cloudfront', region_name=aws_region)
-        self.cloudmap_client = session.client('servicediscovery', region_name=aws_region)
-        self.cloudtrail_client = session.client('cloudtrail', region_name=aws_region)
-        self.cloudwatch_client = session.client('cloudwatch', region_name=aws_region)
-        self.cognito_identity_client = session.client('cognito-identity', region_name=aws_region)
-        self.cognito_idp_client = session.client('cognito-idp', region_name=aws_region)
-        self.docdb_client = session.client('docdb', region_name=aws_region)
-        self.dynamodb_client = session.client('dynamodb', region_name=aws_region)
-        self.ec2_client = session.client('ec2', region_name=aws_region)
-        self.ecr_client = session.client('ecr', region_name=aws_region)
-        self.ecr_public_client = session.client('ecr-public', region_name=aws_region)
-        self.ecs_client = session.client('ecs', region_name=aws_region)
-        self.eks_client = session.client('eks', region_name=aws_region)
-        self.efs_client = session.client('efs', region_name=aws_region)
-        self.elasticache_client = session.client('elasticache', region_name=aws_region)
-        self.elasticbeanstalk_client = session.client('elasticbeanstalk', region_name=aws_region)
-        self.elasticsearch_client = session.client('es', region_name=aws_region)
-        self.elb_client = session.client('elb', region_name=aws_region)
-        self.elbv2_client = session.client('elbv2', region_name=aws_region)
-        self.guardduty_client = session.client('guardduty', region_name=aws_region)
-        self.iam_client = session.client('iam', region_name=aws_region)
-        self.kms_client = session.client('kms', region_name=aws_region)
-        self.lambda_client = session.client('lambda', region_name=aws_region)
-        self.logs_client = session.client('logs', region_name=aws_region)
-        self.msk_client = session.client('kafka', region_name=aws_region)
-        self.opensearch_client = session.client('opensearch', region_name=aws_region)
-        self.rds_client = session.client('rds', region_name=aws_region)
-        self.route53_client = session.client('route53', region_name=aws_region)
-        self.s3_client = session.client('s3', region_name=aws_region)
-        self.secretsmanager_client = session.client('secretsmanager', region_name=aws_region)
-        self.sns_client = session.client('sns', region_name=aws_region)
-        self.sqs_client = session.client('sqs', region_name=aws_region)
-        self.ssm_client = session.client('ssm', region_name=aws_region)
-        self.sfn_client = session.client('stepfunctions', region_name=aws_region)
-        self.sts_client = session.client('sts', region_name=aws_region)
-        self.wafv2_client = session.client('wafv2', region_name=aws_region)
-        self.codeartifact_client = session.client('codeartifact', region_name=aws_region)
-        
+    """
+    Builds boto3 clients on first attribute access (e.g. ``ec2_client``) and
+    reuses them for every AwsClients sharing the same session and region.
+
+    Each hook is an object with a ``register(client)`` method, called once
+    per new client to attach botocore event handlers to it.
+    """
+
+    def __init__(self, session, aws_region, hooks=None):
+        self.session = session
+        self.aws_region = aws_region
+        self.hooks = tuple(hooks or ())
+
+    def __getattr__(self, name):
+        service_name = CLIENT_SERVICES.get(name)
+        if service_name is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        # boto3 sessions are not thread-safe when creating clients
+        with _lock:
+            clients = _session_clients.setdefault(self.session, {})
+            key = (self.aws_region, service_name, self.hooks)
+            client = clients.get(key)
+            if client is None:
+                client = self.create_client(service_name)
+                clients[key] = client
+
+        setattr(self, name, client)
+        return client
+
+    def create_client(self, service_name):
+        client = self.session.client(service_name, region_name=self.aws_region)
+        for hook in self.hooks:
+            hook.register(client)
+        return client
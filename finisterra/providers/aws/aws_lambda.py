@@ -9,7 +9,7 @@ from ...utils.hcl import HCL
 from ...providers.aws.iam_role import IAM
 from ...providers.aws.logs import Logs
 from ...providers.aws.security_group import SECURITY_GROUP
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import paginate_items, get_subnet_names, get_vpc_name
 import logging
 import inspect
 
@@ -39,23 +39,6 @@ class AwsLambda:
         self.logs_instance = Logs(self.provider_instance, self.hcl)
         self.security_group_instance = SECURITY_GROUP(self.provider_instance, self.hcl)
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
     def aws_lambda(self):
         self.hcl.prepare_folder()
 
@@ -121,8 +104,10 @@ class AwsLambda:
         if not ftstack:
             ftstack = "aws_lambda"
             try:
-                tags = self.provider_instance.aws_clients.lambda_client.list_tags(
-                    Resource=function_arn)['Tags']
+                tags = self.provider_instance.tag_index.tags(function_arn)
+                if tags is None:
+                    tags = self.provider_instance.aws_clients.lambda_client.list_tags(
+                        Resource=function_arn)['Tags']
                 if tags.get('ftstack', 'aws_lambda') != 'aws_lambda':
                     ftstack = "stack_" + tags.get('ftstack', 'aws_lambda')
             except Exception as e:
@@ -184,7 +169,7 @@ class AwsLambda:
             subnet_ids = vpc_config.get('SubnetIds', [])
             security_group_ids = vpc_config.get('SecurityGroupIds', [])
             if vpc_id:
-                vpc_name = self.get_vpc_name(vpc_id)
+                vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
                 if vpc_name:
                     self.hcl.add_additional_data(
                         resource_type, function_arn, "vpc_name", vpc_name)
@@ -207,8 +192,8 @@ class AwsLambda:
     def aws_lambda_alias(self):
         logger.debug(f"Processing Lambda Aliases...")
 
-        functions = self.provider_instance.aws_clients.lambda_client.list_functions()[
-            "Functions"]
+        functions = paginate_items(
+            self.provider_instance.aws_clients.lambda_client.get_paginator("list_functions"), "Functions")
 
         for function in functions:
             function_name = function["FunctionName"]
@@ -226,7 +211,7 @@ class AwsLambda:
                     "function_version": alias["FunctionVersion"],
                 }
                 self.hcl.process_resource(
-                    "aws_lambda_alias", f"{function_name}_{alias_name}".replace("-", "_"), attributes)
+                    "aws_lambda_alias", f"{function_name}_{alias_name}".replace("-", "_"), attributes, alias)
 
     def aws_lambda_code_signing_config(self):
         logger.debug(f"Processing Lambda Code Signing Configs...")
@@ -249,13 +234,13 @@ class AwsLambda:
                     attributes["description"] = config["Description"]
 
                 self.hcl.process_resource(
-                    "aws_lambda_code_signing_config", config_id.replace("-", "_"), attributes)
+                    "aws_lambda_code_signing_config", config_id.replace("-", "_"), attributes, config)
 
     def aws_lambda_event_source_mapping(self):
         logger.debug(f"Processing Lambda Event Source Mappings...")
 
-        functions = self.provider_instance.aws_clients.lambda_client.list_functions()[
-            "Functions"]
+        functions = paginate_items(
+            self.provider_instance.aws_clients.lambda_client.get_paginator("list_functions"), "Functions")
 
         for function in functions:
             function_name = function["FunctionName"]
@@ -273,13 +258,13 @@ class AwsLambda:
                     "event_source_arn": mapping["EventSourceArn"],
                 }
                 self.hcl.process_resource(
-                    "aws_lambda_event_source_mapping", mapping_id.replace("-", "_"), attributes)
+                    "aws_lambda_event_source_mapping", mapping_id.replace("-", "_"), attributes, mapping)
 
     def aws_lambda_function_event_invoke_config(self):
         logger.debug(f"Processing Lambda Function Event Invoke Configs...")
 
-        functions = self.provider_instance.aws_clients.lambda_client.list_functions()[
-            "Functions"]
+        functions = paginate_items(
+            self.provider_instance.aws_clients.lambda_client.get_paginator("list_functions"), "Functions")
 
         for function in functions:
             function_name = function["FunctionName"]
@@ -296,7 +281,7 @@ class AwsLambda:
                     "maximum_retry_attempts": event_invoke_config.get("MaximumRetryAttempts", ""),
                 }
                 self.hcl.process_resource(
-                    "aws_lambda_function_event_invoke_config", function_name.replace("-", "_"), attributes)
+                    "aws_lambda_function_event_invoke_config", function_name.replace("-", "_"), attributes, event_invoke_config)
             except botocore.exceptions.ClientError as e:
                 if e.response['Error']['Code'] == 'ResourceNotFoundException':
                     logger.debug(
@@ -307,8 +292,8 @@ class AwsLambda:
     def aws_lambda_function_url(self):
         logger.debug(f"Processing Lambda Function URLs...")
 
-        functions = self.provider_instance.aws_clients.lambda_client.list_functions()[
-            "Functions"]
+        functions = paginate_items(
+            self.provider_instance.aws_clients.lambda_client.get_paginator("list_functions"), "Functions")
 
         for function in functions:
             function_name = function["FunctionName"]
@@ -326,7 +311,7 @@ class AwsLambda:
                 "url": url,
             }
             self.hcl.process_resource(
-                "aws_lambda_function_url", function_name.replace("-", "_"), attributes)
+                "aws_lambda_function_url", function_name.replace("-", "_"), attributes, function)
 
     def aws_lambda_layer_version(self):
         logger.debug(f"Processing Lambda Layer Versions...")
@@ -360,7 +345,7 @@ class AwsLambda:
                             statement["Principal"]["AWS"])
 
                 self.hcl.process_resource(
-                    "aws_lambda_layer_version", f"{layer_name.replace('-', '_')}_version_{version}", attributes)
+                    "aws_lambda_layer_version", f"{layer_name.replace('-', '_')}_version_{version}", attributes, layer_version)
 
     def aws_lambda_layer_version_permission(self):
         logger.debug(f"Processing Lambda Layer Version Permissions...")
@@ -383,13 +368,13 @@ class AwsLambda:
                         "principal": permission_arn,
                     }
                     self.hcl.process_resource(
-                        "aws_lambda_layer_version_permission", id.replace("-", "_"), attributes)
+                        "aws_lambda_layer_version_permission", id.replace("-", "_"), attributes, layer)
 
     def aws_lambda_permission(self):
         logger.debug(f"Processing Lambda Permissions...")
 
-        functions = self.provider_instance.aws_clients.lambda_client.list_functions()[
-            "Functions"]
+        functions = paginate_items(
+            self.provider_instance.aws_clients.lambda_client.get_paginator("list_functions"), "Functions")
 
         for function in functions:
             function_name = function["FunctionName"]
@@ -409,7 +394,7 @@ class AwsLambda:
                         "statement_id": statement_id,
                     }
                     self.hcl.process_resource(
-                        "aws_lambda_permission", f"{function_name.replace('-', '_')}_permission_{statement_id}", attributes)
+                        "aws_lambda_permission", f"{function_name.replace('-', '_')}_permission_{statement_id}", attributes, statement)
             except self.provider_instance.aws_clients.lambda_client.exceptions.ResourceNotFoundException:
                 logger.debug(
                     f"  Skipping Lambda Function: {function_name} because no resource policy found")
@@ -418,8 +403,8 @@ class AwsLambda:
         logger.debug(
             f"Processing Lambda Provisioned Concurrency Configurations...")
 
-        functions = self.provider_instance.aws_clients.lambda_client.list_functions()[
-            "Functions"]
+        functions = paginate_items(
+            self.provider_instance.aws_clients.lambda_client.get_paginator("list_functions"), "Functions")
 
         for function in functions:
             function_name = function["FunctionName"]
@@ -440,7 +425,7 @@ class AwsLambda:
                         "provisioned_concurrent_executions": allocated_concurrent_executions,
                     }
                     self.hcl.process_resource("aws_lambda_provisioned_concurrency_config",
-                                              f"{function_name.replace('-', '_')}_provisioned_concurrency_{version}", attributes)
+                                              f"{function_name.replace('-', '_')}_provisioned_concurrency_{version}", attributes, config)
             except self.provider_instance.aws_clients.lambda_client.exceptions.ResourceNotFoundException:
                 logger.debug(
                     f"  No provisioned concurrency configuration found for Lambda Function: {function_name}")
@@ -81,8 +81,9 @@ class ClientVPN:
             "describe_client_vpn_endpoints")
 
         # Update to paginate with filters if available
-        if self.provider_instance.filters:
-            pages = paginator.paginate(Filters=self.provider_instance.filters)
+        if self.provider_instance.resource_filter:
+            pages = paginator.paginate(
+                Filters=self.provider_instance.resource_filter.ec2_filters())
         else:
             pages = paginator.paginate()
 
@@ -112,7 +113,7 @@ class ClientVPN:
         if vpc_name:
             self.hcl.add_additional_data(
                 resource_type, id, "vpc_name", vpc_name)
-        self.hcl.process_resource(resource_type, id, attributes)
+        self.hcl.process_resource(resource_type, id, attributes, vpn_endpoint)
         if not ftstack:
             ftstack = "vpn"
         self.hcl.add_stack(resource_type, id, ftstack)
@@ -162,7 +163,7 @@ class ClientVPN:
                         "aws_ec2_client_vpn_network_association", association_id, "subnet_name", subnet_name)
 
                 self.hcl.process_resource(
-                    "aws_ec2_client_vpn_network_association", association_id, attributes)
+                    "aws_ec2_client_vpn_network_association", association_id, attributes, association)
 
     def aws_ec2_client_vpn_authorization_rule(self, client_vpn_endpoint_id):
         logger.debug("Processing EC2 Client VPN Authorization Rules...")
@@ -184,7 +185,7 @@ class ClientVPN:
                     "client_vpn_endpoint_id": client_vpn_endpoint_id,
                 }
                 self.hcl.process_resource(
-                    "aws_ec2_client_vpn_authorization_rule", id, attributes)
+                    "aws_ec2_client_vpn_authorization_rule", id, attributes, rule)
 
     def aws_ec2_client_vpn_route(self, client_vpn_endpoint_id, client_cidr_block):
         logger.debug("Processing EC2 Client VPN Routes...")
@@ -225,4 +226,4 @@ class ClientVPN:
                         "aws_ec2_client_vpn_route", route_id, "subnet_name", subnet_name)
 
                 self.hcl.process_resource(
-                    "aws_ec2_client_vpn_route", route_id, attributes)
+                    "aws_ec2_client_vpn_route", route_id, attributes, route)
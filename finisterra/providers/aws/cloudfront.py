@@ -4,6 +4,7 @@ from ...providers.aws.acm import ACM
 from ...providers.aws.s3 import S3
 from ...providers.aws.aws_lambda import AwsLambda
 from ...providers.aws.wafv2 import Wafv2
+from ...providers.aws.utils import combined_state_payload
 import logging
 import inspect
 
@@ -97,35 +98,25 @@ class CloudFront:
             items = distribution_list.get("Items", [])
             all_distributions.extend(items)
 
-        # If filters are specified, proceed to fetch tags for each distribution and filter
-        if self.provider_instance.filters:
-            filtered_distributions = []
-            for dist in all_distributions:
-                distribution_id = dist['Id']
-                tags_response = self.provider_instance.aws_clients.cloudfront_client.list_tags_for_resource(
-                    Resource=f'arn:aws:cloudfront::{self.provider_instance.aws_account_id}:distribution/{distribution_id}')
-                tags = {tag['Key']: tag['Value']
-                        for tag in tags_response['Tags']['Items']}
-
-                # Check if distribution matches all filter conditions
-                match_all_conditions = all(
-                    any(tags.get(f['Name'].replace('tag:', ''),
-                        '') == value for value in f['Values'])
-                    for f in self.provider_instance.filters
-                )
-
-                if match_all_conditions:
-                    filtered_distributions.append(dist)
-            distributions_to_process = filtered_distributions
-        else:
-            distributions_to_process = all_distributions
+        def fetch_tags(dist):
+            tags_response = self.provider_instance.aws_clients.cloudfront_client.list_tags_for_resource(
+                Resource=dist["ARN"])
+            return {tag['Key']: tag['Value']
+                    for tag in tags_response['Tags']['Items']}
+
+        # Distribution id first, then tags of the remaining ones. CloudFront
+        # tags live in us-east-1, so the regional tag index is not used.
+        distributions_to_process = self.provider_instance.resource_filter.select(
+            all_distributions,
+            name=lambda dist: dist["Id"],
+            fetch_tags=fetch_tags)
 
         total = len(distributions_to_process)
         if total > 0:
             self.task = self.provider_instance.progress.add_task(
                 f"[cyan]Processing {self.__class__.__name__}...", total=total)
 
-        for distribution_summary in distributions_to_process:
+        for distribution_summary, tags in distributions_to_process:
             distribution_id = distribution_summary["Id"]
             self.provider_instance.progress.update(
                 self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{distribution_id}[/]")
@@ -137,14 +128,11 @@ class CloudFront:
 
             ftstack = "cloudfront"
             try:
-                response = self.provider_instance.aws_clients.cloudfront_client.list_tags_for_resource(
-                    Resource=distribution_summary["ARN"])
-                tags = response.get('Tags', {}).get('Items', [])
-                for tag in tags:
-                    if tag['Key'] == 'ftstack':
-                        if tag['Value'] != 'cloudfront':
-                            ftstack = "stack_"+tag['Value']
-                        break
+                # Tags already fetched by the filters are reused
+                if tags is None:
+                    tags = fetch_tags(distribution_summary)
+                if tags.get('ftstack', 'cloudfront') != 'cloudfront':
+                    ftstack = "stack_"+tags['ftstack']
             except Exception as e:
                 logger.error("Error occurred: ", e)
 
@@ -156,8 +144,9 @@ class CloudFront:
                 "domain_name": distribution_summary["DomainName"],
             }
 
+            # The summary's LastModifiedTime changes with every configuration update
             self.hcl.process_resource(
-                resource_type, distribution_id.replace("-", "_"), attributes)
+                resource_type, distribution_id.replace("-", "_"), attributes, combined_state_payload(distribution=distribution_summary, tags=tags))
 
             self.hcl.add_stack(resource_type, id, ftstack)
 
@@ -293,7 +282,7 @@ class CloudFront:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudfront_cache_policy", cache_policy_id.replace("-", "_"), attributes)
+                    "aws_cloudfront_cache_policy", cache_policy_id.replace("-", "_"), attributes, cache_policy_summary)
 
     def aws_cloudfront_field_level_encryption_config(self):
         logger.debug(
@@ -311,7 +300,7 @@ class CloudFront:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudfront_field_level_encryption_config", config_id.replace("-", "_"), attributes)
+                    "aws_cloudfront_field_level_encryption_config", config_id.replace("-", "_"), attributes, config_summary)
 
     def aws_cloudfront_field_level_encryption_profile(self):
         logger.debug(
@@ -329,7 +318,7 @@ class CloudFront:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudfront_field_level_encryption_profile", profile_id.replace("-", "_"), attributes)
+                    "aws_cloudfront_field_level_encryption_profile", profile_id.replace("-", "_"), attributes, profile_summary)
 
     def aws_cloudfront_function(self, function_arn, ftstack):
         resource_type = "aws_cloudfront_function"
@@ -354,7 +343,7 @@ class CloudFront:
                     }
 
                     self.hcl.process_resource(
-                        resource_type, id, attributes)
+                        resource_type, id, attributes, function_summary)
                     self.hcl.add_stack(resource_type, id, ftstack)
                     return  # Exit after processing the specific function
 
@@ -374,7 +363,7 @@ class CloudFront:
             }
 
             self.hcl.process_resource(
-                "aws_cloudfront_key_group", key_group_id.replace("-", "_"), attributes)
+                "aws_cloudfront_key_group", key_group_id.replace("-", "_"), attributes, response["KeyGroup"])
 
     def aws_cloudfront_monitoring_subscription(self, target_distribution_id):
         logger.debug(f"Processing CloudFront Monitoring Subscriptions...")
@@ -406,7 +395,7 @@ class CloudFront:
                         }
 
                         self.hcl.process_resource(
-                            "aws_cloudfront_monitoring_subscription", distribution_id.replace("-", "_"), attributes)
+                            "aws_cloudfront_monitoring_subscription", distribution_id.replace("-", "_"), attributes, monitoring_subscription)
                 except botocore.exceptions.ClientError as e:
                     if e.response['Error']['Code'] == 'NoSuchMonitoringSubscription':
                         logger.debug(
@@ -437,7 +426,7 @@ class CloudFront:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudfront_origin_access_identity", oai_id.replace("-", "_"), attributes)
+                    "aws_cloudfront_origin_access_identity", oai_id.replace("-", "_"), attributes, oai_summary)
 
     def aws_cloudfront_origin_access_control(self):
         logger.debug(f"Processing CloudFront Origin Access Identities...")
@@ -455,7 +444,7 @@ class CloudFront:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudfront_origin_access_control", oai_id.replace("-", "_"), attributes)
+                    "aws_cloudfront_origin_access_control", oai_id.replace("-", "_"), attributes, oai_summary)
 
     def aws_cloudfront_origin_request_policy(self, specific_policy_id):
         logger.debug(f"Processing CloudFront Origin Request Policies...")
@@ -489,7 +478,7 @@ class CloudFront:
                 # Add other required attributes as needed
             }
             self.hcl.process_resource(
-                "aws_cloudfront_origin_request_policy", specific_policy_id.replace("-", "_"), attributes)
+                "aws_cloudfront_origin_request_policy", specific_policy_id.replace("-", "_"), attributes, policy)
 
         except Exception as e:
             logger.error(
@@ -515,7 +504,7 @@ class CloudFront:
                     "comment": public_key["PublicKeyConfig"].get("Comment", ""),
                 }
                 self.hcl.process_resource(
-                    "aws_cloudfront_public_key", public_key_id.replace("-", "_"), attributes)
+                    "aws_cloudfront_public_key", public_key_id.replace("-", "_"), attributes, public_key)
 
     def aws_cloudfront_public_key(self):
         logger.debug(f"Processing CloudFront Public Keys...")
@@ -533,7 +522,7 @@ class CloudFront:
             }
 
             self.hcl.process_resource(
-                "aws_cloudfront_public_key", public_key_id.replace("-", "_"), attributes)
+                "aws_cloudfront_public_key", public_key_id.replace("-", "_"), attributes, public_key)
 
     def aws_cloudfront_realtime_log_config(self):
         logger.debug(f"Processing CloudFront Realtime Log Configs...")
@@ -554,7 +543,7 @@ class CloudFront:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudfront_realtime_log_config", log_config_id.replace("-", "_"), attributes)
+                    "aws_cloudfront_realtime_log_config", log_config_id.replace("-", "_"), attributes, log_config)
 
     def aws_cloudfront_response_headers_policy(self, specific_policy_id):
         logger.debug(f"Processing CloudFront Response Headers Policies...")
@@ -588,7 +577,7 @@ class CloudFront:
                 # Add other required attributes, like "cors_config", "security_headers_config", etc.
             }
             self.hcl.process_resource(
-                "aws_cloudfront_response_headers_policy", specific_policy_id.replace("-", "_"), attributes)
+                "aws_cloudfront_response_headers_policy", specific_policy_id.replace("-", "_"), attributes, policy)
 
         except Exception as e:
             logger.error(
@@ -1,4 +1,5 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import get_vpc_name
 import logging
 import inspect
 
@@ -23,23 +24,6 @@ class Cloudmap:
         self.hcl.provider_version = self.provider_instance.provider_version
         self.hcl.account_name = self.provider_instance.account_name
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
     def cloudmap(self):
         self.hcl.prepare_folder()
 
@@ -82,7 +66,7 @@ class Cloudmap:
                     }
 
                     self.hcl.process_resource(
-                        "aws_service_discovery_http_namespace", namespace_id.replace("-", "_"), attributes)
+                        "aws_service_discovery_http_namespace", namespace_id.replace("-", "_"), attributes, http_namespace)
 
     def aws_service_discovery_instance(self):
         logger.debug(f"Processing AWS Service Discovery Instances...")
@@ -110,7 +94,7 @@ class Cloudmap:
                             attributes["attributes"] = instance["Attributes"]
 
                         self.hcl.process_resource(
-                            "aws_service_discovery_instance", instance_id.replace("-", "_"), attributes)
+                            "aws_service_discovery_instance", instance_id.replace("-", "_"), attributes, instance)
 
     def aws_service_discovery_private_dns_namespace(self):
         resource_type = "aws_service_discovery_private_dns_namespace"
@@ -147,6 +131,7 @@ class Cloudmap:
                     id = namespace_id
 
                     ftstack = "cloudmap"
+                    tags = []
                     try:
                         response = self.provider_instance.aws_clients.cloudmap_client.list_tags_for_resource(
                             ResourceARN=private_dns_namespace["Arn"])
@@ -167,18 +152,15 @@ class Cloudmap:
                     }
 
                     self.hcl.process_resource(
-                        "aws_service_discovery_private_dns_namespace", namespace_id.replace("-", "_"), attributes)
+                        "aws_service_discovery_private_dns_namespace", namespace_id.replace("-", "_"), attributes, {"namespace": private_dns_namespace, "tags": tags})
 
                     self.aws_service_discovery_service(namespace_id)
                     self.hcl.add_stack(resource_type, id, ftstack)
 
-                    vpc_name = self.get_vpc_name(vpc_id)
+                    vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
                     if vpc_name:
-                        if resource_type not in self.hcl.additional_data:
-                            self.hcl.additional_data[resource_type] = {}
-                        if id not in self.hcl.additional_data[resource_type]:
-                            self.hcl.additional_data[resource_type][id] = {}
-                        self.hcl.additional_data[resource_type][id]["vpc_name"] = vpc_name
+                        self.hcl.add_additional_data(
+                            resource_type, id, "vpc_name", vpc_name)
 
     def aws_service_discovery_public_dns_namespace(self):
         logger.debug(
@@ -202,7 +184,7 @@ class Cloudmap:
                     }
 
                     self.hcl.process_resource(
-                        "aws_service_discovery_public_dns_namespace", namespace_id.replace("-", "_"), attributes)
+                        "aws_service_discovery_public_dns_namespace", namespace_id.replace("-", "_"), attributes, public_dns_namespace)
 
     def aws_service_discovery_service(self, namespace_id):
         logger.debug(f"Processing AWS Service Discovery Services...")
@@ -232,4 +214,4 @@ class Cloudmap:
                 }
 
                 self.hcl.process_resource(
-                    "aws_service_discovery_service", service_id.replace("-", "_"), attributes)
+                    "aws_service_discovery_service", service_id.replace("-", "_"), attributes, sd_service)
@@ -1,6 +1,7 @@
 from ...utils.hcl import HCL
 import botocore
 from ...providers.aws.kms import KMS
+from ...providers.aws.utils import paginate_with_progress, stream_pages, get_kms_alias, state_payload, combined_state_payload
 import logging
 import inspect
 
@@ -28,28 +29,6 @@ class CodeArtifact:
 
         self.kms_instance = KMS(self.provider_instance, self.hcl)
 
-    def code_artifact_get_kms_alias(self, kms_key_id):
-        if kms_key_id:
-            try:
-                value = ""
-                response = self.provider_instance.aws_clients.kms_client.list_aliases()
-                aliases = response.get('Aliases', [])
-                while 'NextMarker' in response:
-                    response = self.provider_instance.aws_clients.kms_client.list_aliases(
-                        Marker=response['NextMarker'])
-                    aliases.extend(response.get('Aliases', []))
-                for alias in aliases:
-                    if 'TargetKeyId' in alias and alias['TargetKeyId'] == kms_key_id.split('/')[-1]:
-                        value = alias['AliasName']
-                        break
-                return value
-            except botocore.exceptions.ClientError as e:
-                if e.response['Error']['Code'] == 'AccessDeniedException':
-                    return ""
-                else:
-                    raise e
-        return ""
-
     def codeartifact(self):
         self.hcl.prepare_folder()
         self.aws_codeartifact_domain()
@@ -78,30 +57,23 @@ class CodeArtifact:
 
         paginator = self.provider_instance.aws_clients.codeartifact_client.get_paginator(
             'list_domains')
-        total = 0
-        for response in paginator.paginate():
-            total += len(response["domains"])
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for response in paginator.paginate():
-            for domain in response["domains"]:
-                domain_name = domain["name"]
-                domain_arn = domain["arn"]
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{domain_name}[/]")
-                self.process_single_codeartifact_domain(domain_name, ftstack)
-
-                try:
-                    policy = self.provider_instance.aws_clients.codeartifact_client.get_domain_permissions_policy(
-                        domain=domain_name)
-                    if policy["policy"]:
-                        document = policy["policy"]["document"]
-                        self.aws_codeartifact_domain_permissions_policy(
-                            domain_arn)
-                except botocore.exceptions.ClientError as error:
-                    # Ignore ResourceNotFoundException and continue
-                    pass
+        for domain in paginate_with_progress(self, stream_pages(paginator), "domains"):
+            domain_name = domain["name"]
+            domain_arn = domain["arn"]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{domain_name}[/]")
+            self.process_single_codeartifact_domain(domain_name, ftstack)
+
+            try:
+                policy = self.provider_instance.aws_clients.codeartifact_client.get_domain_permissions_policy(
+                    domain=domain_name)
+                if policy["policy"]:
+                    document = policy["policy"]["document"]
+                    self.aws_codeartifact_domain_permissions_policy(
+                        domain_arn, policy["policy"])
+            except botocore.exceptions.ClientError as error:
+                # Ignore ResourceNotFoundException and continue
+                pass
 
     def process_single_codeartifact_domain(self, domain_name, ftstack=None):
         resource_type = "aws_codeartifact_domain"
@@ -125,14 +97,17 @@ class CodeArtifact:
                     ftstack = tag["Value"]
                     break
 
-        self.hcl.process_resource(resource_type, id, attributes)
+        tags = state_payload(
+            self.provider_instance.aws_clients.codeartifact_client.list_tags_for_resource, "tags", resourceArn=domain_arn)
+        self.hcl.process_resource(
+            resource_type, id, attributes, combined_state_payload(domain=domain_info, tags=tags))
         self.hcl.add_stack(resource_type, id, ftstack)
 
         kms_key_id = domain_info["domain"].get("encryptionKey")
         if kms_key_id:
             type = self.kms_instance.aws_kms_key(kms_key_id, ftstack)
             if type == "MANAGED":
-                alias = self.code_artifact_get_kms_alias(kms_key_id)
+                alias = get_kms_alias(self.provider_instance.aws_clients, kms_key_id)
                 if alias:
                     if 'codeartifact' not in self.hcl.additional_data:
                         self.hcl.additional_data["codeartifact"] = {}
@@ -160,19 +135,21 @@ class CodeArtifact:
         }
 
         self.hcl.process_resource(
-            resource_type, id, attributes)
+            resource_type, id, attributes,
+            state_payload(self.provider_instance.aws_clients.codeartifact_client.describe_repository,
+                          "repository", domain=domain_name, repository=repository_name))
 
         try:
             policy = self.provider_instance.aws_clients.codeartifact_client.get_repository_permissions_policy(
                 domain=domain_name, repository=repository_name)
             if policy["policy"]:
                 self.aws_codeartifact_repository_permissions_policy(
-                    repository_arn)
+                    repository_arn, policy["policy"])
         except botocore.exceptions.ClientError as error:
             # Ignore ResourceNotFoundException and continue
             pass
 
-    def aws_codeartifact_repository_permissions_policy(self, repository_arn):
+    def aws_codeartifact_repository_permissions_policy(self, repository_arn, policy=None):
         logger.debug(
             f"Processing CodeArtifact Repository Permissions Policy {repository_arn}")
         resource_type = "aws_codeartifact_repository_permissions_policy"
@@ -180,9 +157,9 @@ class CodeArtifact:
         attributes = {
             "id": id,
         }
-        self.hcl.process_resource(resource_type, id, attributes)
+        self.hcl.process_resource(resource_type, id, attributes, policy)
 
-    def aws_codeartifact_domain_permissions_policy(self, domain_name_arn):
+    def aws_codeartifact_domain_permissions_policy(self, domain_name_arn, policy=None):
         logger.debug(
             f"Processing CodeArtifact Domain Permissions Policy {domain_name_arn}")
         resource_type = "aws_codeartifact_domain_permissions_policy"
@@ -190,4 +167,4 @@ class CodeArtifact:
         attributes = {
             "id": id,
         }
-        self.hcl.process_resource(resource_type, id, attributes)
+        self.hcl.process_resource(resource_type, id, attributes, policy)
@@ -1,7 +1,7 @@
 from ...utils.hcl import HCL
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.kms import KMS
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import paginate_with_progress, stream_pages, get_subnet_names, get_vpc_name, paginated_state_payload, combined_state_payload
 import logging
 import inspect
 
@@ -29,23 +29,6 @@ class DocDb:
         self.security_group_instance = SECURITY_GROUP(self.provider_instance, self.hcl)
         self.kms_instance = KMS(self.provider_instance, self.hcl)
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
     def docdb(self):
         self.hcl.prepare_folder()
 
@@ -72,61 +55,51 @@ class DocDb:
 
         paginator = self.provider_instance.aws_clients.docdb_client.get_paginator(
             "describe_db_clusters")
-        total = 0
-        for page in paginator.paginate():
-            for db_cluster in page["DBClusters"]:
-                if db_cluster["Engine"] == "docdb":
-                    total += 1
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-
-        for page in paginator.paginate():
-            for db_cluster in page["DBClusters"]:
-                if db_cluster["Engine"] == "docdb":
-                    logger.debug(
-                        f"Processing DocumentDB Cluster: {db_cluster['DBClusterIdentifier']}")
-
-                    id = db_cluster["DBClusterIdentifier"]
-                    self.provider_instance.progress.update(
-                        self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{id}[/]")
-
-                    ftstack = "docdb"
-                    try:
-                        response = self.provider_instance.aws_clients.docdb_client.list_tags_for_resource(
-                            ResourceName=db_cluster["DBClusterArn"])
-                        tags = response.get('TagList', [])
-                        for tag in tags:
-                            if tag['Key'] == 'ftstack':
-                                if tag['Value'] != 'docdb':
-                                    ftstack = "docdb_"+tag['Value']
-                                break
-                    except Exception as e:
-                        logger.error("Error occurred: ", e)
-
-                    attributes = {
-                        "id": db_cluster["DBClusterIdentifier"],
-                    }
-                    self.hcl.process_resource(
-                        resource_type, id.replace("-", "_"), attributes)
+        for db_cluster in paginate_with_progress(self, stream_pages(paginator), "DBClusters",
+                                                 include=lambda db_cluster: db_cluster["Engine"] == "docdb"):
+            logger.debug(
+                f"Processing DocumentDB Cluster: {db_cluster['DBClusterIdentifier']}")
 
-                    self.hcl.add_stack(resource_type, id, ftstack)
-
-                    # Call aws_docdb_cluster_instance with db_cluster as an argument
-                    self.aws_docdb_cluster_instance(db_cluster)
-
-                    # Call aws_security_group with the list of VpcSecurityGroups
-
-                    for sg in db_cluster.get("VpcSecurityGroups", []):
-                        self.security_group_instance.aws_security_group(
-                            sg["VpcSecurityGroupId"], ftstack)
-                    # vpc_security_group_ids = [sg["VpcSecurityGroupId"]
-                    #                         for sg in db_cluster.get("VpcSecurityGroups", [])]
-                    # self.aws_security_group(vpc_security_group_ids)
-                    KmsKeyId = db_cluster.get("KmsKeyId", None)
-                    if KmsKeyId:
-                        self.kms_instance.aws_kms_key(KmsKeyId, ftstack)
+            id = db_cluster["DBClusterIdentifier"]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{id}[/]")
+
+            ftstack = "docdb"
+            tags = []
+            try:
+                response = self.provider_instance.aws_clients.docdb_client.list_tags_for_resource(
+                    ResourceName=db_cluster["DBClusterArn"])
+                tags = response.get('TagList', [])
+                for tag in tags:
+                    if tag['Key'] == 'ftstack':
+                        if tag['Value'] != 'docdb':
+                            ftstack = "docdb_"+tag['Value']
+                        break
+            except Exception as e:
+                logger.error("Error occurred: ", e)
+
+            attributes = {
+                "id": db_cluster["DBClusterIdentifier"],
+            }
+            self.hcl.process_resource(
+                resource_type, id.replace("-", "_"), attributes, {"cluster": db_cluster, "tags": tags})
+
+            self.hcl.add_stack(resource_type, id, ftstack)
+
+            # Call aws_docdb_cluster_instance with db_cluster as an argument
+            self.aws_docdb_cluster_instance(db_cluster)
+
+            # Call aws_security_group with the list of VpcSecurityGroups
+
+            for sg in db_cluster.get("VpcSecurityGroups", []):
+                self.security_group_instance.aws_security_group(
+                    sg["VpcSecurityGroupId"], ftstack)
+            # vpc_security_group_ids = [sg["VpcSecurityGroupId"]
+            #                         for sg in db_cluster.get("VpcSecurityGroups", [])]
+            # self.aws_security_group(vpc_security_group_ids)
+            KmsKeyId = db_cluster.get("KmsKeyId", None)
+            if KmsKeyId:
+                self.kms_instance.aws_kms_key(KmsKeyId, ftstack)
 
     def aws_docdb_cluster_instance(self, db_cluster):
         logger.debug(f"Processing DocumentDB Cluster Instances...")
@@ -151,7 +124,7 @@ class DocDb:
                         "port": db_instance.get("DbInstancePort", None),
                     }
                     self.hcl.process_resource(
-                        "aws_docdb_cluster_instance", db_instance["DBInstanceIdentifier"].replace("-", "_"), attributes)
+                        "aws_docdb_cluster_instance", db_instance["DBInstanceIdentifier"].replace("-", "_"), attributes, db_instance)
 
                     # Call aws_docdb_cluster_parameter_group if db_instance's DBParameterGroupName matches parameter_group in DBClusterParameterGroups
                     if db_instance.get('DBParameterGroups'):
@@ -165,6 +138,13 @@ class DocDb:
                         self.aws_docdb_subnet_group(
                             db_instance['DBSubnetGroup']['DBSubnetGroupName'])
 
+    def cluster_parameter_group_payload(self, parameter_group):
+        """The parameter group and the parameters set on it, None if they cannot be listed."""
+        parameters = paginated_state_payload(
+            self.provider_instance.aws_clients.docdb_client.get_paginator("describe_db_cluster_parameters"),
+            "Parameters", DBClusterParameterGroupName=parameter_group["DBClusterParameterGroupName"], Source="user")
+        return combined_state_payload(group=parameter_group, parameters=parameters)
+
     def aws_docdb_cluster_parameter_group(self, parameter_group_name):
         logger.debug(f"Processing DocumentDB Cluster Parameter Groups...")
 
@@ -185,7 +165,7 @@ class DocDb:
                             "description": parameter_group["Description"],
                         }
                         self.hcl.process_resource("aws_docdb_cluster_parameter_group",
-                                                  parameter_group["DBClusterParameterGroupName"].replace("-", "_"), attributes)
+                                                  parameter_group["DBClusterParameterGroupName"].replace("-", "_"), attributes, self.cluster_parameter_group_payload(parameter_group))
 
     def aws_docdb_subnet_group(self, subnet_group_name):
         resource_type = "aws_docdb_subnet_group"
@@ -213,35 +193,22 @@ class DocDb:
                             "arn": subnet_group.get("DBSubnetGroupArn", None),
                         }
                         self.hcl.process_resource(
-                            resource_type, subnet_group["DBSubnetGroupName"].replace("-", "_"), attributes)
+                            resource_type, subnet_group["DBSubnetGroupName"].replace("-", "_"), attributes, subnet_group)
 
                         subnet_names = get_subnet_names(
                             self.provider_instance.aws_clients, subnet_ids)
                         if subnet_names:
-                            if resource_type not in self.hcl.additional_data:
-                                self.hcl.additional_data[resource_type] = {}
-                            if id not in self.hcl.additional_data[resource_type]:
-                                self.hcl.additional_data[resource_type][id] = {
-                                }
-                            self.hcl.additional_data[resource_type][id]["subnet_names"] = subnet_names
+                            self.hcl.add_additional_data(
+                                resource_type, id, "subnet_names", subnet_names)
 
                         VpcId = subnet_group.get("VpcId", None)
                         if VpcId:
-                            if resource_type not in self.hcl.additional_data:
-                                self.hcl.additional_data[resource_type] = {}
-                            if id not in self.hcl.additional_data[resource_type]:
-                                self.hcl.additional_data[resource_type][id] = {
-                                }
-                            self.hcl.additional_data[resource_type][id]["vpc_id"] = VpcId
-                            vpc_name = self.get_vpc_name(VpcId)
+                            self.hcl.add_additional_data(
+                                resource_type, id, "vpc_id", VpcId)
+                            vpc_name = get_vpc_name(self.provider_instance.aws_clients, VpcId)
                             if vpc_name:
-                                if resource_type not in self.hcl.additional_data:
-                                    self.hcl.additional_data[resource_type] = {
-                                    }
-                                if id not in self.hcl.additional_data[resource_type]:
-                                    self.hcl.additional_data[resource_type][id] = {
-                                    }
-                                self.hcl.additional_data[resource_type][id]["vpc_name"] = vpc_name
+                                self.hcl.add_additional_data(
+                                    resource_type, id, "vpc_name", vpc_name)
 
     def aws_docdb_cluster_snapshot(self):
         logger.debug(f"Processing DocumentDB Cluster Snapshots...")
@@ -266,7 +233,7 @@ class DocDb:
                         "availability_zone": snapshot.get("AvailabilityZone", None),
                     }
                     self.hcl.process_resource(
-                        "aws_docdb_cluster_snapshot", snapshot["DBClusterSnapshotIdentifier"].replace("-", "_"), attributes)
+                        "aws_docdb_cluster_snapshot", snapshot["DBClusterSnapshotIdentifier"].replace("-", "_"), attributes, snapshot)
 
     def aws_docdb_event_subscription(self):
         logger.debug(f"Processing DocumentDB Event Subscriptions...")
@@ -287,7 +254,7 @@ class DocDb:
                     "enabled": subscription.get("Enabled", None),
                 }
                 self.hcl.process_resource(
-                    "aws_docdb_event_subscription", subscription["CustSubscriptionId"].replace("-", "_"), attributes)
+                    "aws_docdb_event_subscription", subscription["CustSubscriptionId"].replace("-", "_"), attributes, subscription)
 
     def aws_docdb_global_cluster(self):
         logger.debug(f"Processing DocumentDB Global Clusters...")
@@ -309,4 +276,4 @@ class DocDb:
                         "deletion_protection": cluster.get("DeletionProtection", None),
                     }
                     self.hcl.process_resource(
-                        "aws_docdb_global_cluster", cluster["GlobalClusterIdentifier"].replace("-", "_"), attributes)
+                        "aws_docdb_global_cluster", cluster["GlobalClusterIdentifier"].replace("-", "_"), attributes, cluster)
@@ -1,4 +1,6 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import paginate_with_progress, stream_pages
+from botocore.exceptions import ClientError
 import logging
 import inspect
 
@@ -69,65 +71,73 @@ class Dynamodb:
 
         paginator = self.provider_instance.aws_clients.dynamodb_client.get_paginator(
             "list_tables")
-        total = 0
-        for page in paginator.paginate():
-            total += len(page["TableNames"])
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for table_name in page["TableNames"]:
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{table_name}[/]")
-                table_description = self.provider_instance.aws_clients.dynamodb_client.describe_table(
-                    TableName=table_name)["Table"]
-
-                # if table_name != "xxxxx":
-                #     continue
-
-                logger.debug(f"Processing DynamoDB Table: {table_name}")
-                id = table_name
-
-                ftstack = "dynamodb"
-                try:
-                    response = self.provider_instance.aws_clients.dynamodb_client.list_tags_of_resource(
-                        ResourceArn=table_description["TableArn"])
-                    tags = response.get('Tags', [])
-                    for tag in tags:
-                        if tag['Key'] == 'ftstack':
-                            if tag['Value'] != 'dynamodb':
-                                ftstack = "stack_"+tag['Value']
-                            break
-                except Exception as e:
-                    logger.error("Error occurred: ", e)
-
-                attributes = {
-                    "id": id,
-                    "name": table_name,
-                    "read_capacity": table_description["ProvisionedThroughput"]["ReadCapacityUnits"],
-                    "write_capacity": table_description["ProvisionedThroughput"]["WriteCapacityUnits"],
-                }
-
-                if "GlobalSecondaryIndexes" in table_description:
-                    for gsi in table_description["GlobalSecondaryIndexes"]:
-                        index_name = gsi["IndexName"]
-                        index_resource_id = f'table/{table_name}/index/{index_name}'
-                        self.aws_appautoscaling_target(index_resource_id)
-
-                self.hcl.process_resource(
-                    resource_type, table_name.replace("-", "_"), attributes)
-                self.hcl.add_stack(resource_type, id, ftstack)
-
-                target_name = self.dynamodb_aws_dynamodb_target_name(
-                    table_name)
-                if resource_type not in self.hcl.additional_data:
-                    self.hcl.additional_data[resource_type] = {}
-                if id not in self.hcl.additional_data[resource_type]:
-                    self.hcl.additional_data[resource_type][id] = {}
-                self.hcl.additional_data[resource_type][id]["target_name"] = target_name
-
-                self.aws_appautoscaling_target(table_name)
+        for table_name in paginate_with_progress(self, stream_pages(paginator), "TableNames"):
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{table_name}[/]")
+            table_description = self.provider_instance.aws_clients.dynamodb_client.describe_table(
+                TableName=table_name)["Table"]
+
+            # if table_name != "xxxxx":
+            #     continue
+
+            logger.debug(f"Processing DynamoDB Table: {table_name}")
+            id = table_name
+
+            ftstack = "dynamodb"
+            tags = []
+            try:
+                response = self.provider_instance.aws_clients.dynamodb_client.list_tags_of_resource(
+                    ResourceArn=table_description["TableArn"])
+                tags = response.get('Tags', [])
+                for tag in tags:
+                    if tag['Key'] == 'ftstack':
+                        if tag['Value'] != 'dynamodb':
+                            ftstack = "stack_"+tag['Value']
+                        break
+            except Exception as e:
+                logger.error("Error occurred: ", e)
+
+            attributes = {
+                "id": id,
+                "name": table_name,
+                "read_capacity": table_description["ProvisionedThroughput"]["ReadCapacityUnits"],
+                "write_capacity": table_description["ProvisionedThroughput"]["WriteCapacityUnits"],
+            }
+
+            if "GlobalSecondaryIndexes" in table_description:
+                for gsi in table_description["GlobalSecondaryIndexes"]:
+                    index_name = gsi["IndexName"]
+                    index_resource_id = f'table/{table_name}/index/{index_name}'
+                    self.aws_appautoscaling_target(index_resource_id)
+
+            self.hcl.process_resource(
+                resource_type, table_name.replace("-", "_"), attributes,
+                self.table_payload(table_name, table_description, tags))
+            self.hcl.add_stack(resource_type, id, ftstack)
+
+            target_name = self.dynamodb_aws_dynamodb_target_name(
+                table_name)
+            self.hcl.add_additional_data(
+                resource_type, id, "target_name", target_name)
+
+            self.aws_appautoscaling_target(table_name)
+
+    def table_payload(self, table_name, table_description, tags):
+        """
+        What the refreshed state of a table is read from, None (refreshed
+        every run) if part of it cannot be described.
+        """
+        dynamodb_client = self.provider_instance.aws_clients.dynamodb_client
+        try:
+            return {
+                "table": table_description,
+                "tags": tags,
+                "ttl": dynamodb_client.describe_time_to_live(TableName=table_name).get("TimeToLiveDescription"),
+                "backups": dynamodb_client.describe_continuous_backups(TableName=table_name).get("ContinuousBackupsDescription"),
+            }
+        except ClientError as e:
+            logger.debug(f"Could not describe DynamoDB Table {table_name}: {e}")
+            return None
 
     def aws_appautoscaling_target(self, table_name):
         service_namespace = 'dynamodb'
@@ -154,7 +164,7 @@ class Dynamodb:
                     "scalable_dimension": target['ScalableDimension'],
                 }
                 self.hcl.process_resource(
-                    "aws_appautoscaling_target", resource_name, attributes)
+                    "aws_appautoscaling_target", resource_name, attributes, target)
 
                 # Processing scaling policies for the target
                 self.aws_appautoscaling_policy(
@@ -193,7 +203,7 @@ class Dynamodb:
                     "name": policy['PolicyName'],
                 }
                 self.hcl.process_resource(
-                    "aws_appautoscaling_policy", resource_name, attributes)
+                    "aws_appautoscaling_policy", resource_name, attributes, policy)
         except Exception as e:
             logger.error(
                 f"Error processing AppAutoScaling policies for resource: {resource_id} with dimension: {scalable_dimension}: {str(e)}")
@@ -3,6 +3,7 @@ import base64
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.kms import KMS
 from ...providers.aws.iam_role import IAM
+from ...providers.aws.utils import paginate_items, paginate_with_progress, stream_pages, get_subnet, get_subnet_name, get_kms_alias
 import logging
 from botocore.exceptions import ClientError
 import inspect
@@ -54,24 +55,12 @@ class EC2:
         return None
 
     def get_subnet_name_ec2(self, subnet_id):
-        subnet_name = ""
-        response = self.provider_instance.aws_clients.ec2_client.describe_subnets(SubnetIds=[
-            subnet_id])
-
-        # Check if 'Subnets' key exists and it's not empty
-        if not response or 'Subnets' not in response or not response['Subnets']:
+        if not get_subnet(self.provider_instance.aws_clients, subnet_id):
             logger.debug(
                 f"No subnet information found for Subnet ID: {subnet_id}")
             return ""
 
-        # Extract the 'Tags' key safely using get
-        subnet_tags = response['Subnets'][0].get('Tags', [])
-
-        # Extract the subnet name from the tags
-        subnet_name = next(
-            (tag['Value'] for tag in subnet_tags if tag['Key'] == 'Name'), None)
-
-        return subnet_name
+        return get_subnet_name(self.provider_instance.aws_clients, subnet_id)
 
     def ec2_get_device_name(self, volume_id):
         if not volume_id:
@@ -86,20 +75,6 @@ class EC2:
 
         return None
 
-    def get_kms_alias(self, kms_key_id):
-        value = ""
-        response = self.provider_instance.aws_clients.kms_client.list_aliases()
-        aliases = response.get('Aliases', [])
-        while 'NextMarker' in response:
-            response = self.provider_instance.aws_clients.kms_client.list_aliases(
-                Marker=response['NextMarker'])
-            aliases.extend(response.get('Aliases', []))
-        for alias in aliases:
-            if 'TargetKeyId' in alias and alias['TargetKeyId'] == kms_key_id.split('/')[-1]:
-                value = alias['AliasName']
-                break
-        return value
-
     def ec2(self):
         self.hcl.prepare_folder()
 
@@ -115,6 +90,11 @@ class EC2:
             else:
                 self.provider_instance.progress.update(
                     self.task, advance=1, description=f"[orange3]{self.__class__.__name__} [bold]No code generated[/]")
+        elif getattr(self, "task", None) is None:
+            # No instances listed, so no progress task was added
+            self.task = self.provider_instance.progress.add_task(
+                f"[orange3]{self.__class__.__name__} [bold]No resources found[/]", total=1)
+            self.provider_instance.progress.update(self.task, advance=1)
         else:
             self.provider_instance.progress.update(
                 self.task, description=f"[cyan]{self.__class__.__name__} [bold]No resources found[/]", total=self.provider_instance.progress.tasks[self.task].total+1)
@@ -138,7 +118,7 @@ class EC2:
                 "virtualization_type": image["VirtualizationType"],
             }
             self.hcl.process_resource(
-                "aws_ami", image_id.replace("-", "_"), attributes
+                "aws_ami", image_id.replace("-", "_"), attributes, image
             )
 
     def aws_ami_launch_permission(self):
@@ -165,7 +145,7 @@ class EC2:
                 }
                 self.hcl.process_resource(
                     "aws_ami_launch_permission", attributes["id"].replace(
-                        "-", "_"), attributes
+                        "-", "_"), attributes, permission
                 )
 
     def aws_ec2_capacity_reservation(self):
@@ -215,7 +195,7 @@ class EC2:
                 attributes["arn"] = host["Arn"]
 
             self.hcl.process_resource(
-                "aws_ec2_host", host_id.replace("-", "_"), attributes
+                "aws_ec2_host", host_id.replace("-", "_"), attributes, host
             )
 
     def aws_ec2_tag(self):
@@ -238,7 +218,7 @@ class EC2:
                 "value": value,
             }
             self.hcl.process_resource(
-                "aws_ec2_tag", tag_id.replace("-", "_"), attributes)
+                "aws_ec2_tag", tag_id.replace("-", "_"), attributes, resource)
 
     def aws_eip(self, allocation_id):
         logger.debug(f"Processing Elastic IP: {allocation_id}")
@@ -267,7 +247,7 @@ class EC2:
             attributes["private_ip"] = eip["PrivateIpAddress"]
 
         self.hcl.process_resource(
-            "aws_eip", allocation_id.replace("-", "_"), attributes)
+            "aws_eip", allocation_id.replace("-", "_"), attributes, eip)
 
     def aws_eip_association(self):
         logger.debug(f"Processing Elastic IP Associations...")
@@ -294,7 +274,7 @@ class EC2:
                     attributes["private_ip_address"] = eip["PrivateIpAddress"]
 
                 self.hcl.process_resource(
-                    "aws_eip_association", association_id.replace("-", "_"), attributes)
+                    "aws_eip_association", association_id.replace("-", "_"), attributes, eip)
 
     def is_managed_by_auto_scaling_group(self, instance_id):
         response = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_instances(InstanceIds=[
@@ -305,167 +285,143 @@ class EC2:
         resource_type = "aws_instance"
         # logger.debug(f"Processing EC2 Instances...")
 
-        if self.provider_instance.filters:
-            instances = self.provider_instance.aws_clients.ec2_client.describe_instances(
-                Filters=self.provider_instance.filters)
-        else:
-            instances = self.provider_instance.aws_clients.ec2_client.describe_instances()
-        total = 0
-        for reservation in instances["Reservations"]:
-            total += len(reservation["Instances"])
-        self.task = self.provider_instance.progress.add_task(
-            f"[cyan]Processing {self.__class__.__name__}...", total=total)
+        params = {}
+        if self.provider_instance.resource_filter:
+            params["Filters"] = self.provider_instance.resource_filter.ec2_filters()
+        paginator = self.provider_instance.aws_clients.ec2_client.get_paginator(
+            "describe_instances")
 
         instance_name = ""
-        for reservation in instances["Reservations"]:
-            for instance in reservation["Instances"]:
-                instance_id = instance["InstanceId"]
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{instance_id}[/]")
+        for instance in paginate_with_progress(self, stream_pages(paginator, **params), "Reservations[].Instances[]"):
+            instance_id = instance["InstanceId"]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{instance_id}[/]")
 
-                if self.is_managed_by_auto_scaling_group(instance_id):
-                    logger.info(
-                        f"  Skipping EC2 Instance (managed by Auto Scaling group): {instance_id}")
-                    continue
+            if self.is_managed_by_auto_scaling_group(instance_id):
+                logger.info(
+                    f"  Skipping EC2 Instance (managed by Auto Scaling group): {instance_id}")
+                continue
 
-                # Check if the instance has EKS related tags and skip if it does
-                eks_tags = [tag for tag in instance.get(
-                    "Tags", []) if tag["Key"].startswith("kubernetes.io/cluster/")]
-                if eks_tags:
-                    logger.info(
-                        f"  Skipping EC2 Instance (managed by EKS): {instance_id}")
-                    continue
+            # Check if the instance has EKS related tags and skip if it does
+            eks_tags = [tag for tag in instance.get(
+                "Tags", []) if tag["Key"].startswith("kubernetes.io/cluster/")]
+            if eks_tags:
+                logger.info(
+                    f"  Skipping EC2 Instance (managed by EKS): {instance_id}")
+                continue
 
-                # if instance_id != "xxxx``":
-                #     continue
-
-                logger.debug(f"Processing EC2 Instance: {instance_id}")
-                id = instance_id
-
-                ftstack = "ec2"
-                try:
-                    tags_response = self.provider_instance.aws_clients.ec2_client.describe_tags(
-                        Filters=[{'Name': 'resource-id',
-                                  'Values': [instance_id]}]
-                    )
-                    tags = tags_response.get('Tags', [])
-                    for tag in tags:
-                        if tag['Key'] == 'Name':
-                            instance_name = tag['Value']
-                            break
-                        if tag['Key'] == 'ftstack':
-                            if tag['Value'] != 'ec2':
-                                ftstack = "stack_"+tag['Value']
-                            break
-                except Exception as e:
-                    logger.error("Error occurred: ", e)
+            # if instance_id != "xxxx``":
+            #     continue
 
-                attributes = {
-                    "id": id,
-                }
+            logger.debug(f"Processing EC2 Instance: {instance_id}")
+            id = instance_id
 
-                # Call root_block_device.kms_key_id
-                root_device = ""
-                if "RootDeviceName" in instance:
-                    logger.debug(
-                        f" RootDeviceName: {instance['RootDeviceName']}")
-                    root_device = instance["RootDeviceName"]
-                    # Get the KMS key for the root device
-                    response = self.provider_instance.aws_clients.ec2_client.describe_volumes(Filters=[{
-                        'Name': 'attachment.instance-id',
-                        'Values': [instance_id]
-                    }])
-                    for volume in response['Volumes']:
-                        device = volume['Attachments'][0]['Device']
-                        if device == instance["RootDeviceName"]:
-                            if 'KmsKeyId' in volume:
-                                keyArn = volume['KmsKeyId']
-                                type = self.kms_instance.aws_kms_key(
-                                    keyArn, ftstack)
-                                if type == "MANAGED":
-                                    kms_key_alias = self.get_kms_alias(keyArn)
-                                    if kms_key_alias:
-                                        self.hcl.add_additional_data(
-                                            resource_type, id, "kms_key_alias", kms_key_alias)
-
-                if "IamInstanceProfile" in instance:
-                    attributes["iam_instance_profile"] = instance["IamInstanceProfile"]["Arn"]
-                    iam_instance_profile_id = instance["IamInstanceProfile"]["Arn"].split(
-                        "/")[-1]  # Updated this line
-                    self.aws_iam_instance_profile(
-                        iam_instance_profile_id, ftstack)
-
-                if not instance_name:
-                    instance_name = id
-                self.hcl.process_resource(
-                    resource_type, instance_name, attributes)
-                self.hcl.add_stack(resource_type, id, ftstack)
-
-                ec2_get_user_data = self.ec2_get_user_data(instance_id)
-                if ec2_get_user_data:
-                    if resource_type not in self.hcl.additional_data:
-                        self.hcl.additional_data[resource_type] = {}
-                    if id not in self.hcl.additional_data[resource_type]:
-                        self.hcl.additional_data[resource_type][id] = {}
-                    self.hcl.additional_data[resource_type][id]["user_data"] = ec2_get_user_data
-
-                subnet_id = instance.get("SubnetId", "")
-                if subnet_id:
-                    subnet_name = self.get_subnet_name_ec2(subnet_id)
-                    if subnet_name:
-                        if resource_type not in self.hcl.additional_data:
-                            self.hcl.additional_data[resource_type] = {}
-                        if id not in self.hcl.additional_data[resource_type]:
-                            self.hcl.additional_data[resource_type][id] = {}
-                        self.hcl.additional_data[resource_type][id]["subnet_name"] = subnet_name
-
-                # Process all EIPs associated with the instance
-                eips_associated = self.provider_instance.aws_clients.ec2_client.describe_addresses(Filters=[{
-                    'Name': 'instance-id',
+            ftstack = "ec2"
+            for tag in instance.get("Tags", []):
+                if tag['Key'] == 'Name':
+                    instance_name = tag['Value']
+                if tag['Key'] == 'ftstack':
+                    if tag['Value'] != 'ec2':
+                        ftstack = "stack_"+tag['Value']
+
+            attributes = {
+                "id": id,
+            }
+
+            # Call root_block_device.kms_key_id
+            root_device = ""
+            volumes = []
+            if "RootDeviceName" in instance:
+                logger.debug(
+                    f" RootDeviceName: {instance['RootDeviceName']}")
+                root_device = instance["RootDeviceName"]
+                # Get the KMS key for the root device
+                response = self.provider_instance.aws_clients.ec2_client.describe_volumes(Filters=[{
+                    'Name': 'attachment.instance-id',
                     'Values': [instance_id]
                 }])
-                for eip in eips_associated["Addresses"]:
-                    self.aws_eip(eip["AllocationId"])
-
-                # Process all EBS volumes associated with the instance
-                for block_device in instance.get("BlockDeviceMappings", []):
-                    if root_device == block_device["DeviceName"]:
-                        continue
-                    volume_id = block_device["Ebs"]["VolumeId"]
-                    self.aws_ebs_volume(volume_id)
-
-                    # Process the volume attachment for the EBS volume
-                    self.aws_volume_attachment(instance_id, block_device)
-
-                    # Get the KMS key for the volume
-                    response = self.provider_instance.aws_clients.ec2_client.describe_volumes(
-                        VolumeIds=[block_device["Ebs"]["VolumeId"]])
-                    for volume in response['Volumes']:
+                volumes = response['Volumes']
+                for volume in volumes:
+                    device = volume['Attachments'][0]['Device']
+                    if device == instance["RootDeviceName"]:
                         if 'KmsKeyId' in volume:
                             keyArn = volume['KmsKeyId']
                             type = self.kms_instance.aws_kms_key(
                                 keyArn, ftstack)
                             if type == "MANAGED":
-                                kms_key_alias = self.get_kms_alias(keyArn)
+                                kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, keyArn)
                                 if kms_key_alias:
-                                    if "aws_ebs_volume" not in self.hcl.additional_data:
-                                        self.hcl.additional_data["aws_ebs_volume"] = {
-                                        }
-                                    if volume_id not in self.hcl.additional_data["aws_ebs_volume"]:
-                                        self.hcl.additional_data["aws_ebs_volume"][volume_id] = {
-                                        }
-                                    self.hcl.additional_data["aws_ebs_volume"][volume_id]["kms_key_alias"] = kms_key_alias
-
-                for sg in instance.get("SecurityGroups", []):
-                    self.security_group_instance.aws_security_group(
-                        sg["GroupId"], ftstack)
-
-                # disable for now until i know how to handle private and public ips
-                # for ni in instance.get("NetworkInterfaces", []):
-                #     self.aws_network_interface(ni["NetworkInterfaceId"])
-
-                #     # Process the attachment details for the additional network interface
-                #     self.aws_network_interface_attachment(instance_id, ni)
+                                    self.hcl.add_additional_data(
+                                        resource_type, id, "kms_key_alias", kms_key_alias)
+
+            if "IamInstanceProfile" in instance:
+                attributes["iam_instance_profile"] = instance["IamInstanceProfile"]["Arn"]
+                iam_instance_profile_id = instance["IamInstanceProfile"]["Arn"].split(
+                    "/")[-1]  # Updated this line
+                self.aws_iam_instance_profile(
+                    iam_instance_profile_id, ftstack)
+
+            if not instance_name:
+                instance_name = id
+            ec2_get_user_data = self.ec2_get_user_data(instance_id)
+            self.hcl.process_resource(
+                resource_type, instance_name, attributes,
+                {"instance": instance, "volumes": volumes, "user_data": ec2_get_user_data})
+            self.hcl.add_stack(resource_type, id, ftstack)
+
+            if ec2_get_user_data:
+                self.hcl.add_additional_data(
+                    resource_type, id, "user_data", ec2_get_user_data)
+
+            subnet_id = instance.get("SubnetId", "")
+            if subnet_id:
+                subnet_name = self.get_subnet_name_ec2(subnet_id)
+                if subnet_name:
+                    self.hcl.add_additional_data(
+                        resource_type, id, "subnet_name", subnet_name)
+
+            # Process all EIPs associated with the instance
+            eips_associated = self.provider_instance.aws_clients.ec2_client.describe_addresses(Filters=[{
+                'Name': 'instance-id',
+                'Values': [instance_id]
+            }])
+            for eip in eips_associated["Addresses"]:
+                self.aws_eip(eip["AllocationId"])
+
+            # Process all EBS volumes associated with the instance
+            for block_device in instance.get("BlockDeviceMappings", []):
+                if root_device == block_device["DeviceName"]:
+                    continue
+                volume_id = block_device["Ebs"]["VolumeId"]
+                self.aws_ebs_volume(volume_id)
+
+                # Process the volume attachment for the EBS volume
+                self.aws_volume_attachment(instance_id, block_device)
+
+                # Get the KMS key for the volume
+                response = self.provider_instance.aws_clients.ec2_client.describe_volumes(
+                    VolumeIds=[block_device["Ebs"]["VolumeId"]])
+                for volume in response['Volumes']:
+                    if 'KmsKeyId' in volume:
+                        keyArn = volume['KmsKeyId']
+                        type = self.kms_instance.aws_kms_key(
+                            keyArn, ftstack)
+                        if type == "MANAGED":
+                            kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, keyArn)
+                            if kms_key_alias:
+                                self.hcl.add_additional_data(
+                                    "aws_ebs_volume", volume_id, "kms_key_alias", kms_key_alias)
+
+            for sg in instance.get("SecurityGroups", []):
+                self.security_group_instance.aws_security_group(
+                    sg["GroupId"], ftstack)
+
+            # disable for now until i know how to handle private and public ips
+            # for ni in instance.get("NetworkInterfaces", []):
+            #     self.aws_network_interface(ni["NetworkInterfaceId"])
+
+            #     # Process the attachment details for the additional network interface
+            #     self.aws_network_interface_attachment(instance_id, ni)
 
     def aws_iam_instance_profile(self, iam_instance_profile_id, ftstack=None):
         resource_type = "aws_iam_instance_profile"
@@ -518,15 +474,12 @@ class EC2:
             attributes["snapshot_id"] = vol["SnapshotId"]
 
         self.hcl.process_resource(
-            resource_type, volume_id.replace("-", "_"), attributes)
+            resource_type, volume_id.replace("-", "_"), attributes, vol)
 
         device_name = self.ec2_get_device_name(id)
         if device_name:
-            if resource_type not in self.hcl.additional_data:
-                self.hcl.additional_data[resource_type] = {}
-            if id not in self.hcl.additional_data[resource_type]:
-                self.hcl.additional_data[resource_type][id] = {}
-            self.hcl.additional_data[resource_type][id]["device_name"] = device_name
+            self.hcl.add_additional_data(
+                resource_type, id, "device_name", device_name)
 
     def aws_volume_attachment(self, instance_id, block_device):
         device_name = block_device["DeviceName"]
@@ -543,7 +496,7 @@ class EC2:
         }
 
         self.hcl.process_resource(
-            "aws_volume_attachment", volume_id.replace("-", "_"), attributes)
+            "aws_volume_attachment", volume_id.replace("-", "_"), attributes, block_device)
 
     def aws_network_interface(self, network_interface_id):
         logger.debug(f"Processing Network Interface: {network_interface_id}")
@@ -580,7 +533,7 @@ class EC2:
             attributes["public_ip"] = ni["Association"]["PublicIp"]
 
         self.hcl.process_resource(
-            "aws_network_interface", network_interface_id.replace("-", "_"), attributes)
+            "aws_network_interface", network_interface_id.replace("-", "_"), attributes, ni)
 
     def aws_network_interface_attachment(self, instance_id, network_interface):
         logger.debug(
@@ -599,7 +552,7 @@ class EC2:
         }
 
         self.hcl.process_resource(
-            "aws_network_interface_attachment", network_interface["NetworkInterfaceId"].replace("-", "_"), attributes)
+            "aws_network_interface_attachment", network_interface["NetworkInterfaceId"].replace("-", "_"), attributes, network_interface)
 
     def aws_key_pair(self):
         logger.debug(f"Processing EC2 Key Pairs...")
@@ -617,13 +570,13 @@ class EC2:
                 # "fingerprint": key_pair["KeyFingerprint"],
             }
             self.hcl.process_resource(
-                "aws_key_pair", key_pair_name.replace("-", "_"), attributes)
+                "aws_key_pair", key_pair_name.replace("-", "_"), attributes, key_pair)
 
     def aws_launch_template(self):
         logger.debug(f"Processing EC2 Launch Templates...")
 
-        launch_templates = self.provider_instance.aws_clients.ec2_client.describe_launch_templates()[
-            "LaunchTemplates"]
+        launch_templates = paginate_items(
+            self.provider_instance.aws_clients.ec2_client.get_paginator("describe_launch_templates"), "LaunchTemplates")
         for launch_template in launch_templates:
             launch_template_id = launch_template["LaunchTemplateId"]
             logger.debug(f"Processing Launch Template: {launch_template_id}")
@@ -636,7 +589,7 @@ class EC2:
                 "latest_version": launch_template.get("LatestVersionNumber", None),
             }
             self.hcl.process_resource(
-                "aws_launch_template", launch_template_id.replace("-", "_"), attributes)
+                "aws_launch_template", launch_template_id.replace("-", "_"), attributes, launch_template)
 
     def aws_placement_group(self):
         logger.debug(f"Processing EC2 Placement Groups...")
@@ -653,7 +606,7 @@ class EC2:
                 "strategy": placement_group["Strategy"],
             }
             self.hcl.process_resource(
-                "aws_placement_group", placement_group_name.replace("-", "_"), attributes)
+                "aws_placement_group", placement_group_name.replace("-", "_"), attributes, placement_group)
 
     def aws_spot_datafeed_subscription(self):
         logger.debug(f"Processing EC2 Spot Datafeed Subscriptions...")
@@ -671,7 +624,7 @@ class EC2:
                 "prefix": subscription.get("Prefix", ""),
             }
             self.hcl.process_resource(
-                "aws_spot_datafeed_subscription", bucket_id.replace("-", "_"), attributes)
+                "aws_spot_datafeed_subscription", bucket_id.replace("-", "_"), attributes, subscription)
         except self.provider_instance.aws_clients.ec2_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] == "InvalidSpotDatafeed.NotFound":
                 logger.debug(f"  No Spot Datafeed Subscriptions found")
@@ -694,7 +647,7 @@ class EC2:
                 "target_capacity": spot_fleet_request["TargetCapacity"],
             }
             self.hcl.process_resource(
-                "aws_spot_fleet_request", request_id.replace("-", "_"), attributes)
+                "aws_spot_fleet_request", request_id.replace("-", "_"), attributes, spot_fleet_request)
 
     def aws_spot_instance_request(self):
         logger.debug(f"Processing EC2 Spot Instance Requests...")
@@ -712,4 +665,4 @@ class EC2:
                 "availability_zone_group": spot_instance_request.get("AvailabilityZoneGroup", ""),
             }
             self.hcl.process_resource(
-                "aws_spot_instance_request", request_id.replace("-", "_"), attributes)
+                "aws_spot_instance_request", request_id.replace("-", "_"), attributes, spot_instance_request)
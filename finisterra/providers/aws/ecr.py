@@ -1,7 +1,7 @@
-import botocore
 from ...utils.hcl import HCL
 import json
 from ...providers.aws.kms import KMS
+from ...providers.aws.utils import get_kms_alias
 import logging
 import inspect
 
@@ -29,26 +29,6 @@ class ECR:
 
         self.kms_instance = KMS(self.provider_instance, self.hcl)
 
-    def get_kms_alias(self, kms_key_id):
-        try:
-            value = ""
-            response = self.provider_instance.aws_clients.kms_client.list_aliases()
-            aliases = response.get('Aliases', [])
-            while 'NextMarker' in response:
-                response = self.provider_instance.aws_clients.kms_client.list_aliases(
-                    Marker=response['NextMarker'])
-                aliases.extend(response.get('Aliases', []))
-            for alias in aliases:
-                if 'TargetKeyId' in alias and alias['TargetKeyId'] == kms_key_id.split('/')[-1]:
-                    value = alias['AliasName']
-                    break
-            return value
-        except botocore.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'AccessDeniedException':
-                return ""
-            else:
-                raise e
-
     def ecr(self):
         self.hcl.prepare_folder()
 
@@ -100,6 +80,7 @@ class ECR:
             id = repository_name
 
             ftstack = "ecr"
+            tags = []
             try:
                 tags_response = self.provider_instance.aws_clients.ecr_client.list_tags_for_resource(
                     resourceArn=repository_arn)
@@ -117,7 +98,7 @@ class ECR:
                 "arn": repository_arn,
             }
             self.hcl.process_resource(
-                resource_type, repository_name.replace("-", "_"), attributes)
+                resource_type, repository_name.replace("-", "_"), attributes, {"repository": repo, "tags": tags})
 
             encryption_configuration = repo.get("encryptionConfiguration", {})
             if encryption_configuration:
@@ -125,14 +106,10 @@ class ECR:
                 if kmsKey:
                     type = self.kms_instance.aws_kms_key(kmsKey, ftstack)
                     if type == "MANAGED":
-                        kms_key_alias = self.get_kms_alias(kmsKey)
+                        kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, kmsKey)
                         if kms_key_alias:
-                            if resource_type not in self.hcl.additional_data:
-                                self.hcl.additional_data[resource_type] = {}
-                            if id not in self.hcl.additional_data[resource_type]:
-                                self.hcl.additional_data[resource_type][id] = {
-                                }
-                            self.hcl.additional_data[resource_type][id]["kms_key_alias"] = kms_key_alias
+                            self.hcl.add_additional_data(
+                                resource_type, id, "kms_key_alias", kms_key_alias)
 
             self.hcl.add_stack(resource_type, id, ftstack)
 
@@ -160,7 +137,7 @@ class ECR:
             "policy": json.dumps(policy_text, indent=2),
         }
         self.hcl.process_resource(
-            "aws_ecr_repository_policy", f"{repository_name}_policy".replace("-", "_"), attributes)
+            "aws_ecr_repository_policy", f"{repository_name}_policy".replace("-", "_"), attributes, policy)
 
     def aws_ecr_lifecycle_policy(self, repository_name):
         logger.debug(f"Processing ECR Lifecycle Policy for: {repository_name}")
@@ -179,7 +156,7 @@ class ECR:
             "policy": json.dumps(json.loads(lifecycle_policy), indent=2),
         }
         self.hcl.process_resource(
-            "aws_ecr_lifecycle_policy", repository_name.replace("-", "_"), attributes)
+            "aws_ecr_lifecycle_policy", repository_name.replace("-", "_"), attributes, lifecycle_policy)
 
     def aws_ecr_registry_policy(self):
         logger.debug(f"Processing ECR Registry Policies...")
@@ -201,7 +178,7 @@ class ECR:
             "policy": json.dumps(json.loads(registry_policy), indent=2),
         }
         self.hcl.process_resource(
-            resource_type, "ecr_registry_policy", attributes)
+            resource_type, "ecr_registry_policy", attributes, registry_policy)
 
         ftstack = "ecr"
         self.hcl.add_stack(resource_type, id, ftstack)
@@ -234,7 +211,7 @@ class ECR:
                         "rule_priority": rule["rulePriority"],
                     }
                     self.hcl.process_resource(
-                        resource_type, id, attributes)
+                        resource_type, id, attributes, rule)
                     ftstack = "ecr"
                     self.hcl.add_stack(resource_type, id, ftstack)
 
@@ -250,7 +227,7 @@ class ECR:
             "scan_on_push": image_scanning_config["scanOnPush"],
         }
         self.hcl.process_resource(
-            "aws_ecr_registry_scanning_configuration", repository_name.replace("-", "_"), attributes)
+            "aws_ecr_registry_scanning_configuration", repository_name.replace("-", "_"), attributes, image_scanning_config)
 
     def aws_ecr_replication_configuration(self):
         logger.debug(f"Processing ECR Replication Configurations...")
@@ -287,7 +264,7 @@ class ECR:
             # "rule": formatted_rules,
         }
         self.hcl.process_resource(
-            resource_type, registryId, attributes)
+            resource_type, registryId, attributes, replication_configuration)
 
         ftstack = "ecr"
         self.hcl.add_stack(resource_type, registryId, ftstack)
@@ -5,6 +5,7 @@ from ...providers.aws.logs import Logs
 from ...providers.aws.kms import KMS
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.target_group import TargetGroup
+from ...providers.aws.utils import get_subnet, get_subnet_names, get_vpc_name, state_payload, combined_state_payload
 import logging
 import inspect
 
@@ -41,36 +42,13 @@ class ECS:
             awsvpcConfiguration = network_configuration.get(
                 "awsvpcConfiguration")
             subnets = awsvpcConfiguration.get("subnets")
-            subnet_names = []
-            for subnet_id in subnets:
-                response = self.provider_instance.aws_clients.ec2_client.describe_subnets(SubnetIds=[
-                                                                        subnet_id])
-
-                # Check if 'Subnets' key exists and it's not empty
-                if not response or 'Subnets' not in response or not response['Subnets']:
-                    logger.debug(
-                        f"No subnet information found for Subnet ID: {subnet_id}")
-                    continue
-
-                # Extract the 'Tags' key safely using get
-                subnet_tags = response['Subnets'][0].get('Tags', [])
-
-                # Extract the subnet name from the tags
-                subnet_name = next(
-                    (tag['Value'] for tag in subnet_tags if tag['Key'] == 'Name'), None)
-
-                if subnet_name:
-                    subnet_names.append(subnet_name)
-                else:
-                    logger.debug(
-                        f"No 'Name' tag found for Subnet ID: {subnet_id}")
-
+            subnet_names = get_subnet_names(
+                self.provider_instance.aws_clients, subnets)
             if subnet_names:
                 return subnet_names
         return ""
 
     def get_vpc_name(self, network_configuration):
-        vpc_name = None
         vpc_id = None
         if network_configuration:
             awsvpcConfiguration = network_configuration.get(
@@ -79,22 +57,10 @@ class ECS:
             if subnets:
                 # get the vpc id for the first subnet
                 subnet_id = subnets[0]
-                response = self.provider_instance.aws_clients.ec2_client.describe_subnets(SubnetIds=[
-                                                                        subnet_id])
-                vpc_id = response['Subnets'][0]['VpcId']
+                vpc_id = get_subnet(
+                    self.provider_instance.aws_clients, subnet_id)['VpcId']
             if vpc_id:
-                response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[
-                                                                     vpc_id])
-                if not response or 'Vpcs' not in response or not response['Vpcs']:
-                    # Handle this case as required, for example:
-                    logger.debug(
-                        f"No VPC information found for VPC ID: {vpc_id}")
-                    return None
-
-                vpc_tags = response['Vpcs'][0].get('Tags', [])
-                vpc_name = next((tag['Value']
-                                for tag in vpc_tags if tag['Key'] == 'Name'), None)
-                return vpc_name
+                return get_vpc_name(self.provider_instance.aws_clients, vpc_id)
         return ""
 
     def ecs(self):
@@ -160,7 +126,7 @@ class ECS:
                 "name": cluster_name,
             }
             self.hcl.process_resource(
-                resource_type, cluster_name.replace("-", "_"), attributes)
+                resource_type, cluster_name.replace("-", "_"), attributes, self.cluster_payload(cluster_arn))
 
             self.hcl.add_stack(resource_type, id, ftstack)
 
@@ -195,6 +161,17 @@ class ECS:
             self.aws_ecs_capacity_provider(cluster_name)
             self.aws_ecs_service(cluster_name, ftstack)
 
+    def cluster_payload(self, cluster_arn):
+        """The cluster with its configuration, settings and tags, None if it cannot be described."""
+        return state_payload(self.provider_instance.aws_clients.ecs_client.describe_clusters, "clusters[0]",
+                             clusters=[cluster_arn], include=["CONFIGURATIONS", "SETTINGS", "TAGS"])
+
+    def tagged_payload(self, item, arn):
+        """The ECS item with its tags, None if they cannot be listed."""
+        return combined_state_payload(
+            item=item, tags=state_payload(self.provider_instance.aws_clients.ecs_client.list_tags_for_resource,
+                                          "tags", resourceArn=arn))
+
     def aws_ecs_cluster_capacity_providers(self, cluster_name):
         logger.debug(
             "Processing ECS Cluster Capacity Providers for the specified cluster...")
@@ -218,7 +195,8 @@ class ECS:
                         "capacity_provider": provider,
                     }
                     self.hcl.process_resource(
-                        "aws_ecs_cluster_capacity_providers", resource_name.replace("-", "_"), attributes)
+                        "aws_ecs_cluster_capacity_providers", resource_name.replace("-", "_"), attributes,
+                        {key: cluster.get(key) for key in ("capacityProviders", "defaultCapacityProviderStrategy")})
             else:
                 logger.debug(
                     f"Skipping aws_ecs_cluster_capacity_providers: {cluster['clusterName']}")
@@ -252,7 +230,7 @@ class ECS:
                             "auto_scaling_group_arn": auto_scaling_group_provider['autoScalingGroupArn'],
                         }
                         self.hcl.process_resource(
-                            "aws_ecs_capacity_provider", provider_name.replace("-", "_"), attributes)
+                            "aws_ecs_capacity_provider", provider_name.replace("-", "_"), attributes, self.tagged_payload(provider_details, provider_details["capacityProviderArn"]))
                     else:
                         logger.debug(
                             f"Skipping provider: {provider_name} without auto scaling group")
@@ -303,7 +281,7 @@ class ECS:
                             "cluster": cluster_arn,
                         }
                         self.hcl.process_resource(
-                            resource_type, service_name.replace("-", "_"), attributes)
+                            resource_type, service_name.replace("-", "_"), attributes, self.tagged_payload(service, service_arn))
                         self.hcl.add_stack(resource_type, service_arn, ftstack)
 
                         network_configuration = service.get(
@@ -401,7 +379,7 @@ class ECS:
             "family": family,
         }
         self.hcl.process_resource(
-            "aws_ecs_task_definition", family.replace("-", "_")+"_"+str(revision), attributes)
+            "aws_ecs_task_definition", family.replace("-", "_")+"_"+str(revision), attributes, self.tagged_payload(task_definition, task_definition_arn))
 
         if os.environ.get('FT_PROCESS_DEPENDENCIES', 'False') != 'False':
             # Process IAM roles for the task
@@ -440,7 +418,7 @@ class ECS:
                     "scalable_dimension": target['ScalableDimension'],
                 }
                 self.hcl.process_resource(
-                    "aws_appautoscaling_target", resource_name, attributes)
+                    "aws_appautoscaling_target", resource_name, attributes, target)
 
                 # Processing scaling policies for the target
                 self.aws_appautoscaling_policy(
@@ -481,7 +459,7 @@ class ECS:
                     "name": policy['PolicyName'],
                 }
                 self.hcl.process_resource(
-                    "aws_appautoscaling_policy", resource_name, attributes)
+                    "aws_appautoscaling_policy", resource_name, attributes, policy)
         except Exception as e:
             logger.error(
                 f"Error processing AppAutoScaling policies for resource: {resource_id}: {str(e)}")
@@ -510,7 +488,7 @@ class ECS:
                     "name": action['ScheduledActionName'],
                 }
                 self.hcl.process_resource(
-                    "aws_appautoscaling_scheduled_action", resource_name, attributes)
+                    "aws_appautoscaling_scheduled_action", resource_name, attributes, action)
         except Exception as e:
             logger.error(
                 f"Error processing AppAutoScaling scheduled actions for resource: {resource_id}: {str(e)}")
@@ -531,7 +509,7 @@ class ECS:
                 "value": value,
             }
             self.hcl.process_resource(
-                "aws_ecs_account_setting_default", name.replace("-", "_"), attributes)
+                "aws_ecs_account_setting_default", name.replace("-", "_"), attributes, setting)
 
     def aws_ecs_tag(self):
         logger.debug("Processing ECS Tags...")
@@ -589,7 +567,7 @@ class ECS:
                 "value": value,
             }
             self.hcl.process_resource(
-                resource_type, hcl_resource_name.replace("-", "_"), attributes)
+                resource_type, hcl_resource_name.replace("-", "_"), attributes, tag)
 
     def aws_ecs_task_set(self):
         logger.debug("Processing ECS Task Sets...")
@@ -621,7 +599,7 @@ class ECS:
                         "task_definition": task_set["taskDefinition"],
                     }
                     self.hcl.process_resource(
-                        "aws_ecs_task_set", task_set_id.replace("-", "_"), attributes)
+                        "aws_ecs_task_set", task_set_id.replace("-", "_"), attributes, task_set)
 
     def aws_lb_target_group(self, target_group_arn):
         logger.debug(
@@ -644,7 +622,7 @@ class ECS:
             }
 
             self.hcl.process_resource(
-                "aws_lb_target_group", tg_name, attributes)
+                "aws_lb_target_group", tg_name, attributes, self.target_group_instance.target_group_payload(target_group))
             # Call the aws_lb_listener_rule function with the target_group_arn
             self.aws_lb_listener_rule(target_group_arn)
             self.aws_lb_listener(target_group_arn)
@@ -688,7 +666,7 @@ class ECS:
                     }
 
                     self.hcl.process_resource(
-                        "aws_lb_listener_rule", rule_id, attributes)
+                        "aws_lb_listener_rule", rule_id, attributes, rule)
 
     def aws_lb_listener(self, target_group_arn):
         logger.debug("Processing Load Balancer Listeners for Target Group ARN:",
@@ -716,4 +694,4 @@ class ECS:
                             }
 
                             self.hcl.process_resource(
-                                "aws_lb_listener", listener_arn.split("/")[-1], attributes)
+                                "aws_lb_listener", listener_arn.split("/")[-1], attributes, listener)
@@ -4,7 +4,7 @@ from ...providers.aws.kms import KMS
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.logs import Logs
 from ...providers.aws.launchtemplate import LaunchTemplate
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import get_subnet_names, get_vpc_name, state_payload
 import logging
 import inspect
 
@@ -36,23 +36,6 @@ class EKS:
         self.logs_instance = Logs(self.provider_instance, self.hcl)
         self.launchtemplate_instance = LaunchTemplate(self.provider_instance, self.hcl)
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
     def eks(self):
         self.hcl.prepare_folder()
 
@@ -102,13 +85,13 @@ class EKS:
                 "id": id,
             }
             self.hcl.process_resource(
-                resource_type, cluster_name.replace("-", "_"), attributes)
+                resource_type, cluster_name.replace("-", "_"), attributes, cluster)
 
             self.hcl.add_stack(resource_type, id, ftstack)
 
             vpc_id = cluster["resourcesVpcConfig"]["vpcId"]
             if vpc_id:
-                vpc_name = self.get_vpc_name(vpc_id)
+                vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
                 if vpc_name:
                     self.hcl.add_additional_data(
                         resource_type, id, "vpc_name", vpc_name)
@@ -172,7 +155,7 @@ class EKS:
                 "cluster_name": cluster_name,
             }
             self.hcl.process_resource(
-                resource_type, f"{cluster_name}-{addon_name}".replace("-", "_"), attributes)
+                resource_type, f"{cluster_name}-{addon_name}".replace("-", "_"), attributes, addon)
 
             service_account_role_arn = addon.get("serviceAccountRoleArn", "")
             if service_account_role_arn:
@@ -229,7 +212,7 @@ class EKS:
                 ":")[-1].replace(":", "_").replace("-", "_")
 
             self.hcl.process_resource(
-                "aws_iam_openid_connect_provider", resource_type, attributes
+                "aws_iam_openid_connect_provider", resource_type, attributes, oidc_provider
             )
 
     def aws_eks_fargate_profile(self):
@@ -253,7 +236,7 @@ class EKS:
                     "cluster_name": cluster_name,
                 }
                 self.hcl.process_resource(
-                    "aws_eks_fargate_profile", f"{cluster_name}-{profile_name}".replace("-", "_"), attributes)
+                    "aws_eks_fargate_profile", f"{cluster_name}-{profile_name}".replace("-", "_"), attributes, fargate_profile)
 
     def aws_eks_identity_provider_config(self, cluster_name):
         logger.debug(
@@ -274,7 +257,9 @@ class EKS:
                 "cluster_name": cluster_name,
             }
             self.hcl.process_resource(f"aws_eks_{config_type.lower()}_identity_provider_config",
-                                      f"{cluster_name}-{config_name}".replace("-", "_"), attributes)
+                                      f"{cluster_name}-{config_name}".replace("-", "_"), attributes,
+                                      state_payload(self.provider_instance.aws_clients.eks_client.describe_identity_provider_config,
+                                                    "identityProviderConfig", clusterName=cluster_name, identityProviderConfig=config))
 
     def aws_ec2_tag(self, resource_id):
         logger.debug(f"Processing EC2 Tags for Resource ID: {resource_id}")
@@ -310,7 +295,7 @@ class EKS:
             # Process the resource
             self.hcl.process_resource("aws_ec2_tag",
                                       f"{resource_id}-{key}".replace("-", "_"),
-                                      attributes)
+                                      attributes, tag)
 
             logger.debug(
                 f"  Prepared tag for Resource {resource_id} with {key} = {value}")
@@ -341,7 +326,7 @@ class EKS:
                 "cluster_name": cluster_name,
             }
             self.hcl.process_resource(
-                "aws_eks_node_group", f"{cluster_name}-{node_group_name}".replace("-", "_"), attributes)
+                "aws_eks_node_group", f"{cluster_name}-{node_group_name}".replace("-", "_"), attributes, node_group)
 
             subnet_ids = node_group["subnets"]
             if subnet_ids:
@@ -386,7 +371,7 @@ class EKS:
                     # You can add more attributes as needed
                 }
                 self.hcl.process_resource(
-                    "aws_autoscaling_schedule", id, attributes)
+                    "aws_autoscaling_schedule", id, attributes, action)
 
                 self.hcl.add_additional_data(
                     "aws_autoscaling_schedule", id, "node_group_name", node_group_name)
@@ -1,6 +1,6 @@
 from ...utils.hcl import HCL
 from ...providers.aws.security_group import SECURITY_GROUP
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import paginate_with_progress, stream_pages, get_subnet_names, get_vpc_name_by_subnet, state_payload, combined_state_payload, paginated_state_payload
 import logging
 import inspect
 
@@ -28,43 +28,6 @@ class ElasticacheRedis:
 
         self.security_group_instance = SECURITY_GROUP(self.provider_instance, self.hcl)
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
-    def get_vpc_name_by_subnet(self, subnet_ids):
-        vpc_id = ""
-        vpc_name = ""
-        if subnet_ids:
-            subnet_id = subnet_ids[0]
-            # get the vpc id for the subnet_id
-            response = self.provider_instance.aws_clients.ec2_client.describe_subnets(SubnetIds=[
-                                                                    subnet_id])
-            if not response or 'Subnets' not in response or not response['Subnets']:
-                # Handle this case as required, for example:
-                logger.debug(
-                    f"No subnet information found for Subnet ID: {subnet_id}")
-                return None
-            vpc_id = response['Subnets'][0].get('VpcId', None)
-
-            if vpc_id:
-                vpc_name = self.get_vpc_name(vpc_id)
-
-        return vpc_id, vpc_name
-
     def elasticache_redis(self):
         self.hcl.prepare_folder()
         self.aws_elasticache_replication_group()
@@ -90,85 +53,95 @@ class ElasticacheRedis:
 
         paginator = self.provider_instance.aws_clients.elasticache_client.get_paginator(
             "describe_replication_groups")
-        total = 0
-        for page in paginator.paginate():
-            for replication_group in page["ReplicationGroups"]:
-                total += 1
+        for replication_group in paginate_with_progress(self, stream_pages(paginator), "ReplicationGroups"):
+            id = replication_group["ReplicationGroupId"]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{id}[/]")
+            # Skip the groups that are not Redis
+            if "Engine" in replication_group and replication_group["Engine"] != "redis":
+                continue
 
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
+            # if replication_group['ReplicationGroupId'] != "xxxxx":
+            #     continue
 
-        for page in paginator.paginate():
-            for replication_group in page["ReplicationGroups"]:
-                id = replication_group["ReplicationGroupId"]
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{id}[/]")
-                # Skip the groups that are not Redis
-                if "Engine" in replication_group and replication_group["Engine"] != "redis":
-                    continue
-
-                # if replication_group['ReplicationGroupId'] != "xxxxx":
-                #     continue
-
-                logger.debug(
-                    f"Processing ElastiCache Replication Group: {replication_group['ReplicationGroupId']}")
-
-                ftstack = "elasticache_redis"
-                try:
-                    tags_response = self.provider_instance.aws_clients.elasticache_client.list_tags_for_resource(
-                        ResourceName=replication_group["ARN"])
-                    tags = tags_response.get('TagList', [])
-                    for tag in tags:
-                        if tag['Key'] == 'ftstack':
-                            if tag['Value'] != 'elasticache_redis':
-                                ftstack = "stack_"+tag['Value']
-                            break
-                except Exception as e:
-                    logger.error("Error occurred: ", e)
-
-                attributes = {
-                    "id": id,
-                    "replication_group_id": replication_group["ReplicationGroupId"],
-                    "replication_group_description": replication_group["Description"],
-                }
-
-                self.hcl.process_resource(
-                    resource_type, id, attributes)
-
-                self.hcl.add_stack(resource_type, id, ftstack)
-
-                # Process the member Cache Clusters
-                for cache_cluster_id in replication_group["MemberClusters"]:
-                    cache_cluster = self.provider_instance.aws_clients.elasticache_client.describe_cache_clusters(
-                        CacheClusterId=cache_cluster_id)["CacheClusters"][0]
-
-                    # if "CacheSubnetGroupName" in cache_cluster and not cache_cluster["CacheSubnetGroupName"].startswith("default") and cache_cluster["CacheSubnetGroupName"] not in self.processed_subnet_groups:
-                    self.aws_elasticache_subnet_group(
-                        cache_cluster["CacheSubnetGroupName"], ftstack)
-                    # self.processed_subnet_groups.add(
-                    #     cache_cluster["CacheSubnetGroupName"])
-
-                    # if "CacheParameterGroup" in cache_cluster and "CacheParameterGroupName" in cache_cluster["CacheParameterGroup"] and not cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"].startswith("default") and cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"] not in self.processed_parameter_groups:
-                    self.aws_elasticache_parameter_group(
-                        cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"], ftstack)
-                    # self.processed_parameter_groups.add(
-                    #     cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"])
-
-                    # Processing Security Groups
-                    security_group_ids = []
-                    if "SecurityGroups" in cache_cluster:
-                        for sg in cache_cluster["SecurityGroups"]:
-                            sg_name = self.security_group_instance.aws_security_group(
-                                sg['SecurityGroupId'], ftstack)
-                            if sg_name == "default":
-                                security_group_ids.append("default")
-                            else:
-                                security_group_ids.append(
-                                    sg['SecurityGroupId'])
-
-                    self.hcl.add_additional_data(
-                        resource_type, id, "security_group_ids",  security_group_ids)
+            logger.debug(
+                f"Processing ElastiCache Replication Group: {replication_group['ReplicationGroupId']}")
+
+            ftstack = "elasticache_redis"
+            tags = []
+            try:
+                tags_response = self.provider_instance.aws_clients.elasticache_client.list_tags_for_resource(
+                    ResourceName=replication_group["ARN"])
+                tags = tags_response.get('TagList', [])
+                for tag in tags:
+                    if tag['Key'] == 'ftstack':
+                        if tag['Value'] != 'elasticache_redis':
+                            ftstack = "stack_"+tag['Value']
+                        break
+            except Exception as e:
+                logger.error("Error occurred: ", e)
+
+            attributes = {
+                "id": id,
+                "replication_group_id": replication_group["ReplicationGroupId"],
+                "replication_group_description": replication_group["Description"],
+            }
+
+            self.hcl.process_resource(
+                resource_type, id, attributes, self.replication_group_payload(replication_group, tags))
+
+            self.hcl.add_stack(resource_type, id, ftstack)
+
+            # Process the member Cache Clusters
+            for cache_cluster_id in replication_group["MemberClusters"]:
+                cache_cluster = self.provider_instance.aws_clients.elasticache_client.describe_cache_clusters(
+                    CacheClusterId=cache_cluster_id)["CacheClusters"][0]
+
+                # if "CacheSubnetGroupName" in cache_cluster and not cache_cluster["CacheSubnetGroupName"].startswith("default") and cache_cluster["CacheSubnetGroupName"] not in self.processed_subnet_groups:
+                self.aws_elasticache_subnet_group(
+                    cache_cluster["CacheSubnetGroupName"], ftstack)
+                # self.processed_subnet_groups.add(
+                #     cache_cluster["CacheSubnetGroupName"])
+
+                # if "CacheParameterGroup" in cache_cluster and "CacheParameterGroupName" in cache_cluster["CacheParameterGroup"] and not cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"].startswith("default") and cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"] not in self.processed_parameter_groups:
+                self.aws_elasticache_parameter_group(
+                    cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"], ftstack)
+                # self.processed_parameter_groups.add(
+                #     cache_cluster["CacheParameterGroup"]["CacheParameterGroupName"])
+
+                # Processing Security Groups
+                security_group_ids = []
+                if "SecurityGroups" in cache_cluster:
+                    for sg in cache_cluster["SecurityGroups"]:
+                        sg_name = self.security_group_instance.aws_security_group(
+                            sg['SecurityGroupId'], ftstack)
+                        if sg_name == "default":
+                            security_group_ids.append("default")
+                        else:
+                            security_group_ids.append(
+                                sg['SecurityGroupId'])
+
+                self.hcl.add_additional_data(
+                    resource_type, id, "security_group_ids",  security_group_ids)
+
+    def replication_group_payload(self, replication_group, tags):
+        """
+        The replication group, its member clusters and tags, None if the
+        members cannot be described.
+        """
+        clusters = [state_payload(self.provider_instance.aws_clients.elasticache_client.describe_cache_clusters,
+                                  "CacheClusters", CacheClusterId=cache_cluster_id)
+                    for cache_cluster_id in replication_group["MemberClusters"]]
+        if None in clusters:
+            return None
+        return {"replication_group": replication_group, "clusters": clusters, "tags": tags}
+
+    def parameter_group_payload(self, parameter_group):
+        """The parameter group and the parameters set on it, None if they cannot be listed."""
+        parameters = paginated_state_payload(
+            self.provider_instance.aws_clients.elasticache_client.get_paginator("describe_cache_parameters"),
+            "Parameters", CacheParameterGroupName=parameter_group["CacheParameterGroupName"], Source="user")
+        return combined_state_payload(group=parameter_group, parameters=parameters)
 
     def aws_elasticache_parameter_group(self, group_name, ftstack):
         if group_name.startswith("default"):
@@ -196,7 +169,7 @@ class ElasticacheRedis:
                 "description": parameter_group["Description"],
             }
 
-            self.hcl.process_resource(resource_type, id, attributes)
+            self.hcl.process_resource(resource_type, id, attributes, self.parameter_group_payload(parameter_group))
             self.hcl.add_stack(resource_type, id, ftstack)
 
     def aws_elasticache_subnet_group(self, group_name, ftstack):
@@ -222,7 +195,7 @@ class ElasticacheRedis:
             }
 
             self.hcl.process_resource(
-                resource_type, id, attributes)
+                resource_type, id, attributes, subnet_group)
             self.hcl.add_stack(resource_type, id, ftstack)
 
             subnet_ids = [subnet["SubnetIdentifier"]
@@ -232,7 +205,7 @@ class ElasticacheRedis:
                 self.hcl.add_additional_data(
                     resource_type, id, "subnet_names",  subnet_names)
 
-            vpc_id, vpc_name = self.get_vpc_name_by_subnet(subnet_ids)
+            vpc_id, vpc_name = get_vpc_name_by_subnet(self.provider_instance.aws_clients, subnet_ids)
             if vpc_id:
                 self.hcl.add_additional_data(
                     resource_type, id, "vpc_id",  vpc_id)
@@ -1,4 +1,5 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import paginate_items
 import botocore
 import re
 from ...providers.aws.security_group import SECURITY_GROUP
@@ -68,7 +69,7 @@ class ElasticBeanstalk:
                 "description": app.get("Description", ""),
             }
             self.hcl.process_resource(
-                "aws_elastic_beanstalk_application", app_name, attributes)
+                "aws_elastic_beanstalk_application", app_name, attributes, app)
 
     def aws_elastic_beanstalk_application_version(self):
         logger.debug("Processing Elastic Beanstalk Application Versions...")
@@ -104,7 +105,7 @@ class ElasticBeanstalk:
                     "key": key
                 }
                 self.hcl.process_resource(
-                    "aws_elastic_beanstalk_application_version", version_id, attributes)
+                    "aws_elastic_beanstalk_application_version", version_id, attributes, version)
 
     def aws_elastic_beanstalk_configuration_template(self):
         logger.debug("Processing Elastic Beanstalk Configuration Templates...")
@@ -153,7 +154,7 @@ class ElasticBeanstalk:
                         "options": template["options"],
                     }
                     self.hcl.process_resource(
-                        "aws_elastic_beanstalk_configuration_template", template_id, attributes)
+                        "aws_elastic_beanstalk_configuration_template", template_id, attributes, template)
 
     def aws_elastic_beanstalk_environment(self):
         resource_type = "aws_elastic_beanstalk_environment"
@@ -176,6 +177,7 @@ class ElasticBeanstalk:
             id = env_id
 
             ftstack = "beanstalk"
+            tags = []
             try:
                 tags_response = self.provider_instance.aws_clients.elasticbeanstalk_client.list_tags_for_resource(
                     ResourceArn=env["EnvironmentArn"]
@@ -196,7 +198,7 @@ class ElasticBeanstalk:
                 "cname_prefix": env.get("CNAMEPrefix", ""),
             }
             self.hcl.process_resource(
-                resource_type, id, attributes)
+                resource_type, id, attributes, {"environment": env, "tags": tags})
 
             self.hcl.add_stack(resource_type, id, ftstack)
 
@@ -236,9 +238,10 @@ class ElasticBeanstalk:
                 # self.aws_iam_role(ec2_role)
 
             # Identify the Auto Scaling Group associated with the Elastic Beanstalk environment
-            auto_scaling_groups = self.provider_instance.aws_clients.autoscaling_client.describe_auto_scaling_groups()
+            auto_scaling_groups = paginate_items(
+                self.provider_instance.aws_clients.autoscaling_client.get_paginator("describe_auto_scaling_groups"), "AutoScalingGroups")
 
-            for group in auto_scaling_groups['AutoScalingGroups']:
+            for group in auto_scaling_groups:
                 # The Elastic Beanstalk environment name is part of the Auto Scaling Group name
                 if re.search(env_id, group['AutoScalingGroupName']):
                     auto_scaling_group = group
@@ -1,10 +1,9 @@
-import botocore
 from ...utils.hcl import HCL
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.kms import KMS
 from ...providers.aws.acm import ACM
 from ...providers.aws.logs import Logs
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import get_subnet, get_subnet_names, get_vpc_name, get_kms_alias
 import logging
 import inspect
 
@@ -42,42 +41,12 @@ class Elasticsearch:
             if subnets:
                 # get the vpc id for the first subnet
                 subnet_id = subnets[0]
-                response = self.provider_instance.aws_clients.ec2_client.describe_subnets(SubnetIds=[
-                                                                        subnet_id])
-                vpc_id = response['Subnets'][0]['VpcId']
+                vpc_id = get_subnet(
+                    self.provider_instance.aws_clients, subnet_id)['VpcId']
         if vpc_id:
-            response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[
-                                                                 vpc_id])
-            if not response or 'Vpcs' not in response or not response['Vpcs']:
-                # Handle this case as required, for example:
-                logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-                return None
-
-            vpc_tags = response['Vpcs'][0].get('Tags', [])
-            vpc_name = next((tag['Value']
-                            for tag in vpc_tags if tag['Key'] == 'Name'), None)
+            vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
         return vpc_name
 
-    def get_kms_alias(self, kms_key_id):
-        try:
-            value = ""
-            response = self.provider_instance.aws_clients.kms_client.list_aliases()
-            aliases = response.get('Aliases', [])
-            while 'NextMarker' in response:
-                response = self.provider_instance.aws_clients.kms_client.list_aliases(
-                    Marker=response['NextMarker'])
-                aliases.extend(response.get('Aliases', []))
-            for alias in aliases:
-                if 'TargetKeyId' in alias and alias['TargetKeyId'] == kms_key_id.split('/')[-1]:
-                    value = alias['AliasName']
-                    break
-            return value
-        except botocore.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'AccessDeniedException':
-                return ""
-            else:
-                raise e
-
     def elasticsearch(self):
         self.hcl.prepare_folder()
 
@@ -148,7 +117,7 @@ class Elasticsearch:
 
             # Process the domain resource
             self.hcl.process_resource(
-                resource_type, id, attributes)
+                resource_type, id, attributes, {"domain": domain_info, "tags": tags})
 
             self.hcl.add_stack(resource_type, id, ftstack)
 
@@ -179,7 +148,7 @@ class Elasticsearch:
                 kmsKeyId = encrypt_at_rest.get('KmsKeyId', None)
                 if kmsKeyId:
                     self.kms_instance.aws_kms_key(kmsKeyId, ftstack)
-                    kms_key_alias = self.get_kms_alias(kmsKeyId)
+                    kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, kmsKeyId)
                     if kms_key_alias:
                         self.hcl.add_additional_data(
                             resource_type, id, "kms_key_alias", kms_key_alias)
@@ -226,4 +195,4 @@ class Elasticsearch:
 
         # Process the policy resource
         self.hcl.process_resource(
-            "aws_elasticsearch_domain_policy", id, attributes)
+            "aws_elasticsearch_domain_policy", id, attributes, domain_info.get("AccessPolicies"))
@@ -3,7 +3,7 @@ from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.acm import ACM
 from ...providers.aws.s3 import S3
 from ...providers.aws.target_group import TargetGroup
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import get_subnet_names, get_vpc_name, state_payload, combined_state_payload
 import logging
 import inspect
 
@@ -35,23 +35,6 @@ class ELBV2:
         self.s3_instance = S3(self.provider_instance, self.hcl)
         self.target_group_instance = TargetGroup(self.provider_instance, self.hcl)
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
     def elbv2(self):
         self.hcl.prepare_folder()
 
@@ -72,6 +55,14 @@ class ELBV2:
                 f"[orange3]{self.__class__.__name__} [bold]No resources found[/]", total=1)
             self.provider_instance.progress.update(self.task, advance=1)
 
+    def get_lb_tags(self, lb_arn):
+        tags = self.provider_instance.tag_index.tags(lb_arn)
+        if tags is not None:
+            return [{"Key": key, "Value": value} for key, value in tags.items()]
+        tags_response = self.provider_instance.aws_clients.elbv2_client.describe_tags(ResourceArns=[
+                                                                    lb_arn])
+        return tags_response["TagDescriptions"][0]["Tags"]
+
     def aws_lb(self, selected_lb_arn=None, ftstack=None):
         resource_type = "aws_lb"
         logger.debug("Processing Load Balancers...")
@@ -97,9 +88,7 @@ class ELBV2:
             lb_name = lb["LoadBalancerName"]
 
             # Check tags of the load balancer
-            tags_response = self.provider_instance.aws_clients.elbv2_client.describe_tags(ResourceArns=[
-                                                                        lb_arn])
-            tags = tags_response["TagDescriptions"][0]["Tags"]
+            tags = self.get_lb_tags(lb_arn)
 
             # Filter out load balancers created by Elastic Beanstalk or Kubernetes Ingress
             is_ebs_created = any(
@@ -121,9 +110,7 @@ class ELBV2:
             lb_name = lb["LoadBalancerName"]
 
             # Check tags of the load balancer
-            tags_response = self.provider_instance.aws_clients.elbv2_client.describe_tags(ResourceArns=[
-                                                                        lb_arn])
-            tags = tags_response["TagDescriptions"][0]["Tags"]
+            tags = self.get_lb_tags(lb_arn)
 
             # Filter out load balancers created by Elastic Beanstalk or Kubernetes Ingress
             is_ebs_created = any(
@@ -163,7 +150,7 @@ class ELBV2:
                 "id": id,
             }
 
-            self.hcl.process_resource(resource_type, lb_name, attributes)
+            self.hcl.process_resource(resource_type, lb_name, attributes, self.load_balancer_payload(lb, tags))
             self.hcl.add_stack(resource_type, id, ftstack)
 
             AvailabilityZones = lb.get("AvailabilityZones", [])
@@ -171,21 +158,15 @@ class ELBV2:
                 subnets = get_subnet_names(self.provider_instance.aws_clients,
                                            [az["SubnetId"] for az in AvailabilityZones])
                 if subnets:
-                    if resource_type not in self.hcl.additional_data:
-                        self.hcl.additional_data[resource_type] = {}
-                    if id not in self.hcl.additional_data[resource_type]:
-                        self.hcl.additional_data[resource_type][id] = {}
-                    self.hcl.additional_data[resource_type][id]["subnet_names"] = subnets
+                    self.hcl.add_additional_data(
+                        resource_type, id, "subnet_names", subnets)
 
             VpcId = lb.get("VpcId", "")
             if VpcId:
-                vpc_name = self.get_vpc_name(VpcId)
+                vpc_name = get_vpc_name(self.provider_instance.aws_clients, VpcId)
                 if vpc_name:
-                    if resource_type not in self.hcl.additional_data:
-                        self.hcl.additional_data[resource_type] = {}
-                    if id not in self.hcl.additional_data[resource_type]:
-                        self.hcl.additional_data[resource_type][id] = {}
-                    self.hcl.additional_data[resource_type][id]["vpc_name"] = vpc_name
+                    self.hcl.add_additional_data(
+                        resource_type, id, "vpc_name", vpc_name)
 
             # load_balancer_arns.append(lb_arn)
 
@@ -212,6 +193,13 @@ class ELBV2:
                 self.s3_instance.aws_s3_bucket(s3_access_lobs_bucket, ftstack)
             self.aws_lb_listener([lb_arn], ftstack)
 
+    def load_balancer_payload(self, lb, tags):
+        """The load balancer, its attributes and tags, None if the attributes cannot be described."""
+        return combined_state_payload(
+            load_balancer=lb, tags=tags,
+            attributes=state_payload(self.provider_instance.aws_clients.elbv2_client.describe_load_balancer_attributes,
+                                     "Attributes", LoadBalancerArn=lb["LoadBalancerArn"]))
+
     def aws_lb_listener(self, load_balancer_arns, ftstack=None):
         logger.debug("Processing Load Balancer Listeners...")
 
@@ -230,7 +218,7 @@ class ELBV2:
                     }
 
                     self.hcl.process_resource(
-                        "aws_lb_listener", listener_arn.split("/")[-1], attributes)
+                        "aws_lb_listener", listener_arn.split("/")[-1], attributes, listener)
 
                     for certificate in listener.get('Certificates', []):
                         self.acm_instance.aws_acm_certificate(
@@ -270,7 +258,7 @@ class ELBV2:
                     }
 
                     self.hcl.process_resource(
-                        "aws_lb_listener_certificate", id, attributes)
+                        "aws_lb_listener_certificate", id, attributes, cert)
 
                     self.acm_instance.aws_acm_certificate(cert_arn, ftstack)
             else:
@@ -0,0 +1,137 @@
+import re
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger('finisterra')
+
+# --filters key that matches the resource name (bucket name, distribution
+# id, ...) instead of a tag. EC2 resources use their Name tag. '%' is not
+# valid in AWS tag keys, so no tag can be shadowed by it.
+NAME_KEY = "%name"
+
+
+def parse_wildcards(value):
+    """
+    Splits an EC2 filter value into (character, is wildcard) pairs: '*' and
+    '?' are wildcards, a backslash escapes the next character.
+    """
+    tokens = []
+    escaped = False
+    for char in value:
+        if escaped:
+            tokens.append((char, False))
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        else:
+            tokens.append((char, char in '*?'))
+    return tokens
+
+
+@lru_cache(maxsize=None)
+def wildcard_pattern(value):
+    regex = "".join(('.*' if char == '*' else '.') if wildcard else re.escape(char)
+                    for char, wildcard in parse_wildcards(value))
+    return re.compile(regex, re.DOTALL)
+
+
+def wildcard_match(text, value):
+    """Matches text against a filter value the way EC2 filters do."""
+    return wildcard_pattern(value).fullmatch(text) is not None
+
+
+def literal_prefix(value):
+    prefix = []
+    for char, wildcard in parse_wildcards(value):
+        if wildcard:
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+class ResourceFilter:
+    """
+    --filters compiled once per run. Modules ask it for the cheapest way to
+    narrow their listing, before any per-resource call is made:
+
+    - ec2_filters(): server-side Filters for EC2 Describe* calls.
+    - name_prefix() / match_name(): name (or ID) prefix, server-side where
+      the listing call takes one, otherwise on the listing itself.
+    - select(): tags from the run's TagIndex, falling back to one tagging
+      call per remaining resource only for types the index does not cover.
+
+    Values may use EC2 wildcards (``*`` and ``?``, ``\\`` escapes), matched
+    the same way on the client side.
+    """
+
+    def __init__(self, filters=None):
+        self.filters = filters or []
+        self.names = []
+        self.tags = {}
+        for f in self.filters:
+            if f['Name'] == NAME_KEY:
+                self.names.extend(f['Values'])
+            else:
+                self.tags.setdefault(f['Name'].replace(
+                    'tag:', '', 1), []).extend(f['Values'])
+
+    def __bool__(self):
+        return bool(self.filters)
+
+    def ec2_filters(self):
+        return [{'Name': 'tag:Name', 'Values': f['Values']} if f['Name'] == NAME_KEY else f
+                for f in self.filters]
+
+    def name_prefix(self):
+        """Longest literal prefix shared by every name value, or None."""
+        if not self.names:
+            return None
+        prefixes = [literal_prefix(value) for value in self.names]
+        first, last = min(prefixes), max(prefixes)
+        size = 0
+        while size < len(first) and first[size] == last[size]:
+            size += 1
+        return first[:size] or None
+
+    def match_name(self, name):
+        if not self.names:
+            return True
+        return any(wildcard_match(name or "", value) for value in self.names)
+
+    def match_tags(self, tags):
+        # Like EC2 tag filters, only resources carrying the tag can match
+        return all(
+            key in tags and any(wildcard_match(tags[key], value) for value in values)
+            for key, values in self.tags.items()
+        )
+
+    def select(self, resources, name, arn=None, tag_index=None, fetch_tags=None):
+        """
+        Returns [(resource, tags)] for the resources that match. name(resource)
+        and arn(resource) read the listing item; fetch_tags(resource) returns a
+        tags dict, or None to drop the resource, and is only called when the
+        tag index cannot answer. tags is None when no tag lookup was needed.
+        """
+        selected = []
+        indexed = fetched = 0
+        for resource in resources:
+            if not self.match_name(name(resource)):
+                continue
+            tags = None
+            if self.tags:
+                if tag_index is not None and arn is not None:
+                    tags = tag_index.tags(arn(resource))
+                if tags is not None:
+                    indexed += 1
+                else:
+                    tags = fetch_tags(resource)
+                    fetched += 1
+                    if tags is None:
+                        continue
+                if not self.match_tags(tags):
+                    continue
+            selected.append((resource, tags))
+        if self:
+            logger.debug(
+                f"Filters selected {len(selected)} resources ({indexed} tags from index, {fetched} fetched)")
+        return selected
@@ -1,4 +1,5 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import paginate_items, state_payload
 import json
 import logging
 import inspect
@@ -57,7 +58,7 @@ class IAM_POLICY:
                             "create_date": access_key["CreateDate"].isoformat(),
                         }
                         self.hcl.process_resource(
-                            "aws_iam_access_key", access_key_id.replace("-", "_"), attributes)
+                            "aws_iam_access_key", access_key_id.replace("-", "_"), attributes, access_key)
 
     def aws_iam_account_alias(self):
         logger.debug("Processing IAM Account Aliases...")
@@ -73,7 +74,7 @@ class IAM_POLICY:
                     "name": alias,
                 }
                 self.hcl.process_resource(
-                    "aws_iam_account_alias", alias.replace("-", "_"), attributes)
+                    "aws_iam_account_alias", alias.replace("-", "_"), attributes, alias)
 
     def aws_iam_account_password_policy(self):
         logger.debug("Processing IAM Account Password Policy...")
@@ -95,7 +96,7 @@ class IAM_POLICY:
                 "hard_expiry": policy.get("HardExpiry"),
             }
             self.hcl.process_resource(
-                "aws_iam_account_password_policy", "iam_account_password_policy", attributes)
+                "aws_iam_account_password_policy", "iam_account_password_policy", attributes, policy)
             logger.debug("  IAM Account Password Policy processed.")
         except self.provider_instance.aws_clients.iam_client.exceptions.NoSuchEntityException:
             logger.debug("  No IAM Account Password Policy found.")
@@ -117,7 +118,7 @@ class IAM_POLICY:
                     "create_date": group["CreateDate"].isoformat(),
                 }
                 self.hcl.process_resource(
-                    "aws_iam_group", group_name.replace("-", "_"), attributes)
+                    "aws_iam_group", group_name.replace("-", "_"), attributes, group)
 
     def aws_iam_group_policy(self):
         logger.debug("Processing IAM Group Policies...")
@@ -143,7 +144,7 @@ class IAM_POLICY:
                             "policy_document": json.dumps(policy_document["PolicyDocument"]),
                         }
                         self.hcl.process_resource(
-                            "aws_iam_group_policy", f"{group_name}_{policy_name}", attributes)
+                            "aws_iam_group_policy", f"{group_name}_{policy_name}", attributes, policy_document)
 
     def aws_iam_instance_profile(self):
         logger.debug("Processing IAM Instance Profiles...")
@@ -163,7 +164,7 @@ class IAM_POLICY:
                     "role": instance_profile["Roles"][0]["RoleName"] if instance_profile["Roles"] else None,
                 }
                 self.hcl.process_resource(
-                    "aws_iam_instance_profile", instance_profile_name, attributes)
+                    "aws_iam_instance_profile", instance_profile_name, attributes, instance_profile)
 
     def aws_iam_openid_connect_provider(self):
         logger.debug("Processing IAM OpenID Connect Providers...")
@@ -184,7 +185,7 @@ class IAM_POLICY:
                 "url": provider_details["Url"],
             }
             self.hcl.process_resource(
-                "aws_iam_openid_connect_provider", provider_arn.split(':')[-1], attributes)
+                "aws_iam_openid_connect_provider", provider_arn.split(':')[-1], attributes, provider_details)
 
     def aws_iam_policy(self):
         logger.debug("Processing IAM Policies...")
@@ -209,8 +210,10 @@ class IAM_POLICY:
                     "arn": policy_arn,
                     "name": policy_name,
                 }
+                # DefaultVersionId changes with every new policy document
                 self.hcl.process_resource(
-                    "aws_iam_policy", policy_name, attributes)
+                    "aws_iam_policy", policy_name, attributes,
+                    state_payload(self.provider_instance.aws_clients.iam_client.get_policy, "Policy", PolicyArn=policy_arn))
 
     def aws_iam_role_policy(self):
         logger.debug("Processing IAM Role Policies...")
@@ -236,7 +239,7 @@ class IAM_POLICY:
                             "policy": json.dumps(policy_document["PolicyDocument"]),
                         }
                         self.hcl.process_resource(
-                            "aws_iam_role_policy", f"{role_name}_{policy_name}", attributes)
+                            "aws_iam_role_policy", f"{role_name}_{policy_name}", attributes, policy_document)
 
     def aws_iam_saml_provider(self):
         logger.debug("Processing IAM SAML Providers...")
@@ -257,7 +260,7 @@ class IAM_POLICY:
                 "saml_metadata_document": metadata_document,
             }
             self.hcl.process_resource(
-                "aws_iam_saml_provider", provider_name, attributes)
+                "aws_iam_saml_provider", provider_name, attributes, metadata_document)
 
     def aws_iam_server_certificate(self):
         logger.debug("Processing IAM Server Certificates...")
@@ -285,7 +288,7 @@ class IAM_POLICY:
                     attributes["certificate_chain"] = cert_chain
 
                 self.hcl.process_resource(
-                    "aws_iam_server_certificate", cert_name, attributes)
+                    "aws_iam_server_certificate", cert_name, attributes, server_cert)
 
     def aws_iam_service_linked_role(self):
         logger.debug("Processing IAM Service Linked Roles...")
@@ -304,12 +307,13 @@ class IAM_POLICY:
                         "aws_service_name": role["AssumeRolePolicyDocument"]["Statement"][0]["Principal"]["Service"],
                     }
                     self.hcl.process_resource(
-                        "aws_iam_service_linked_role", role_name, attributes)
+                        "aws_iam_service_linked_role", role_name, attributes, role)
 
     def aws_iam_service_specific_credential(self):
         logger.debug("Processing IAM Service Specific Credentials...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
             service_credentials = self.provider_instance.aws_clients.iam_client.list_service_specific_credentials(UserName=user_name)[
@@ -328,12 +332,13 @@ class IAM_POLICY:
                     "service_name": service_name,
                 }
                 self.hcl.process_resource(
-                    "aws_iam_service_specific_credential", credential_id, attributes)
+                    "aws_iam_service_specific_credential", credential_id, attributes, credential)
 
     def aws_iam_signing_certificate(self):
         logger.debug("Processing IAM Signing Certificates...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
             signing_certificates = self.provider_instance.aws_clients.iam_client.list_signing_certificates(
@@ -351,12 +356,13 @@ class IAM_POLICY:
                     "status": certificate["Status"],
                 }
                 self.hcl.process_resource(
-                    "aws_iam_signing_certificate", certificate_id, attributes)
+                    "aws_iam_signing_certificate", certificate_id, attributes, certificate)
 
     def aws_iam_user(self):
         logger.debug("Processing IAM Users...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
             logger.debug(f"Processing IAM User: {user_name}")
@@ -367,12 +373,14 @@ class IAM_POLICY:
                 # "path": user["Path"],
                 # "arn": user["Arn"],
             }
-            self.hcl.process_resource("aws_iam_user", user_name, attributes)
+            self.hcl.process_resource("aws_iam_user", user_name, attributes, state_payload(
+                self.provider_instance.aws_clients.iam_client.get_user, "User", UserName=user_name))
 
     def aws_iam_user_group_membership(self):
         logger.debug("Processing IAM User Group Memberships...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
             groups_for_user = self.provider_instance.aws_clients.iam_client.list_groups_for_user(UserName=user_name)[
@@ -390,12 +398,13 @@ class IAM_POLICY:
                     "groups": [group_name],
                 }
                 self.hcl.process_resource(
-                    "aws_iam_user_group_membership", membership_id, attributes)
+                    "aws_iam_user_group_membership", membership_id, attributes, group)
 
     def aws_iam_user_login_profile(self):
         logger.debug("Processing IAM User Login Profiles...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
 
@@ -410,7 +419,7 @@ class IAM_POLICY:
                     "password_reset_required": login_profile["PasswordResetRequired"],
                 }
                 self.hcl.process_resource(
-                    "aws_iam_user_login_profile", user_name, attributes)
+                    "aws_iam_user_login_profile", user_name, attributes, login_profile)
             except self.provider_instance.aws_clients.iam_client.exceptions.NoSuchEntityException:
                 logger.debug(
                     f"  No login profile found for IAM User: {user_name}")
@@ -418,7 +427,8 @@ class IAM_POLICY:
     def aws_iam_user_policy(self):
         logger.debug("Processing IAM User Policies...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
             user_policies = self.provider_instance.aws_clients.iam_client.list_user_policies(UserName=user_name)[
@@ -439,12 +449,13 @@ class IAM_POLICY:
                     "policy": json.dumps(policy_document),
                 }
                 self.hcl.process_resource(
-                    "aws_iam_user_policy", policy_id, attributes)
+                    "aws_iam_user_policy", policy_id, attributes, policy_document)
 
     def aws_iam_user_policy_attachment(self):
         logger.debug("Processing IAM User Policy Attachments...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
             attached_policies = self.provider_instance.aws_clients.iam_client.list_attached_user_policies(
@@ -463,12 +474,13 @@ class IAM_POLICY:
                     "policy_arn": policy_arn,
                 }
                 self.hcl.process_resource(
-                    "aws_iam_user_policy_attachment", attachment_id, attributes)
+                    "aws_iam_user_policy_attachment", attachment_id, attributes, policy)
 
     def aws_iam_user_ssh_key(self):
         logger.debug("Processing IAM User SSH Keys...")
 
-        users = self.provider_instance.aws_clients.iam_client.list_users()["Users"]
+        users = paginate_items(
+            self.provider_instance.aws_clients.iam_client.get_paginator("list_users"), "Users")
         for user in users:
             user_name = user["UserName"]
             ssh_keys = self.provider_instance.aws_clients.iam_client.list_ssh_public_keys(UserName=user_name)[
@@ -486,7 +498,7 @@ class IAM_POLICY:
                     "fingerprint": ssh_key["Fingerprint"],
                 }
                 self.hcl.process_resource(
-                    "aws_iam_user_ssh_key", ssh_key_id, attributes)
+                    "aws_iam_user_ssh_key", ssh_key_id, attributes, ssh_key)
 
     def aws_iam_virtual_mfa_device(self):
         logger.debug("Processing IAM Virtual MFA Devices...")
@@ -514,7 +526,7 @@ class IAM_POLICY:
                 attributes["user_name"] = user_name
 
             self.hcl.process_resource(
-                "aws_iam_virtual_mfa_device", mfa_device_id, attributes)
+                "aws_iam_virtual_mfa_device", mfa_device_id, attributes, mfa_device)
 
     def aws_iam_group_policy_attachment(self):
         logger.debug("Processing IAM Group Policy Attachments...")
@@ -538,7 +550,7 @@ class IAM_POLICY:
                             "policy_arn": policy_arn,
                         }
                         self.hcl.process_resource(
-                            "aws_iam_group_policy_attachment", f"{group_name}_{policy_arn.split(':')[-1]}", attributes)
+                            "aws_iam_group_policy_attachment", f"{group_name}_{policy_arn.split(':')[-1]}", attributes, policy)
 
     def aws_iam_role_policy_attachment(self):
         logger.debug("Processing IAM Role Policy Attachments...")
@@ -562,4 +574,4 @@ class IAM_POLICY:
                             "policy_arn": policy_arn,
                         }
                         self.hcl.process_resource(
-                            "aws_iam_role_policy_attachment", f"{role_name}_{policy_arn.split(':')[-1]}", attributes)
+                            "aws_iam_role_policy_attachment", f"{role_name}_{policy_arn.split(':')[-1]}", attributes, policy)
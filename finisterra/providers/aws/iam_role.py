@@ -1,4 +1,6 @@
 from ...utils.hcl import HCL
+from ...utils.native_state import native_builder
+from ...providers.aws.utils import paginate_items, paginate_with_progress, stream_pages, get_instance_profile_index, state_payload, combined_state_payload, paginated_state_payload
 import json
 import logging
 import inspect
@@ -6,6 +8,15 @@ import inspect
 logger = logging.getLogger('finisterra')
 
 
+@native_builder("aws_iam_role_policy_attachment")
+def role_policy_attachment_state(attributes, payload):
+    # payload is the ListAttachedRolePolicies entry
+    return {
+        "role": attributes["role"],
+        "policy_arn": payload["PolicyArn"],
+    }
+
+
 class IAM:
     def __init__(self, provider_instance, hcl=None):
         self.provider_instance = provider_instance
@@ -68,17 +79,10 @@ class IAM:
         # Code to process all roles if no specific role_name is provided
         paginator = self.provider_instance.aws_clients.iam_client.get_paginator(
             "list_roles")
-        total = 0
-        for page in paginator.paginate():
-            total += len(page["Roles"])
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for role in page["Roles"]:
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{role['RoleName']}[/]")
-                self.process_iam_role(role, ftstack)
+        for role in paginate_with_progress(self, stream_pages(paginator), "Roles"):
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{role['RoleName']}[/]")
+            self.process_iam_role(role, ftstack)
 
     def process_iam_role(self, role, ftstack=None):
         resource_type = "aws_iam_role"
@@ -98,7 +102,7 @@ class IAM:
             "description": role.get("Description"),
             "path": role_path,
         }
-        self.hcl.process_resource(resource_type, current_role_name, attributes)
+        self.hcl.process_resource(resource_type, current_role_name, attributes, self.role_payload(current_role_name))
         if not ftstack:
             ftstack = "iam"
         self.hcl.add_stack(resource_type, id, ftstack)
@@ -109,32 +113,41 @@ class IAM:
         # Now call aws_iam_instance_profile for the current role_name
         self.aws_iam_instance_profile(current_role_name)
 
+    def role_payload(self, role_name):
+        """
+        The role with its tags, inline policies and attached policies, None
+        if any of them cannot be read.
+        """
+        iam_client = self.provider_instance.aws_clients.iam_client
+        policy_names = paginated_state_payload(
+            iam_client.get_paginator("list_role_policies"), "PolicyNames", RoleName=role_name)
+        return combined_state_payload(
+            role=state_payload(iam_client.get_role, "Role", RoleName=role_name),
+            inline_policies=None if policy_names is None else [
+                state_payload(iam_client.get_role_policy, "PolicyDocument", RoleName=role_name, PolicyName=policy_name)
+                for policy_name in policy_names],
+            attached_policies=paginated_state_payload(
+                iam_client.get_paginator("list_attached_role_policies"), "AttachedPolicies", RoleName=role_name))
+
     def aws_iam_instance_profile(self, role_name):
         logger.debug("Processing IAM Instance Profiles...")
-        paginator = self.provider_instance.aws_clients.iam_client.get_paginator(
-            "list_instance_profiles")
 
-        for page in paginator.paginate():
-            for instance_profile in page["InstanceProfiles"]:
-                # Check if any of the associated roles match the role_name
-                associated_roles = [role["RoleName"]
-                                    for role in instance_profile["Roles"]]
-                if role_name not in associated_roles:
-                    # If the current instance profile's roles do not include the filtered role name, skip it.
-                    continue
-
-                instance_profile_name = instance_profile["InstanceProfileName"]
-                logger.debug(
-                    f"Processing IAM Instance Profile: {instance_profile_name} for role {role_name}")
-
-                attributes = {
-                    "id": instance_profile_name,
-                    "name": instance_profile_name,
-                    "path": instance_profile["Path"],
-                    "role": role_name,
-                }
-                self.hcl.process_resource(
-                    "aws_iam_instance_profile", instance_profile_name, attributes)
+        # Instance profiles are listed once per run, not once per role
+        instance_profiles = get_instance_profile_index(
+            self.provider_instance.aws_clients).by_role(role_name)
+        for instance_profile in instance_profiles:
+            instance_profile_name = instance_profile["InstanceProfileName"]
+            logger.debug(
+                f"Processing IAM Instance Profile: {instance_profile_name} for role {role_name}")
+
+            attributes = {
+                "id": instance_profile_name,
+                "name": instance_profile_name,
+                "path": instance_profile["Path"],
+                "role": role_name,
+            }
+            self.hcl.process_resource(
+                "aws_iam_instance_profile", instance_profile_name, attributes, instance_profile)
 
     def aws_iam_role_policy_attachment(self, role_name, ftstack):
         logger.debug(
@@ -142,24 +155,22 @@ class IAM:
 
         policy_paginator = self.provider_instance.aws_clients.iam_client.get_paginator(
             "list_attached_role_policies")
-
-        for policy_page in policy_paginator.paginate(RoleName=role_name):
-            for policy in policy_page["AttachedPolicies"]:
-                policy_arn = policy["PolicyArn"]
-                logger.debug(
-                    f"Processing IAM Role Policy Attachment: {role_name} - {policy_arn}")
-
-                attributes = {
-                    "id": f"{role_name}/{policy_arn}",
-                    "role": role_name,
-                    "policy_arn": policy_arn,
-                }
-                self.hcl.process_resource(
-                    "aws_iam_role_policy_attachment", f"{role_name}_{policy_arn.split(':')[-1]}", attributes)
-
-                # if not policy_arn.startswith('arn:aws:iam::aws:policy/') and '/service-role/' not in policy_arn:
-                if not policy_arn.startswith('arn:aws:iam::aws:policy/'):
-                    self.aws_iam_policy(policy_arn, ftstack)
+        for policy in paginate_items(policy_paginator, "AttachedPolicies", RoleName=role_name):
+            policy_arn = policy["PolicyArn"]
+            logger.debug(
+                f"Processing IAM Role Policy Attachment: {role_name} - {policy_arn}")
+
+            attributes = {
+                "id": f"{role_name}/{policy_arn}",
+                "role": role_name,
+                "policy_arn": policy_arn,
+            }
+            self.hcl.process_resource(
+                "aws_iam_role_policy_attachment", f"{role_name}_{policy_arn.split(':')[-1]}", attributes, policy)
+
+            # if not policy_arn.startswith('arn:aws:iam::aws:policy/') and '/service-role/' not in policy_arn:
+            if not policy_arn.startswith('arn:aws:iam::aws:policy/'):
+                self.aws_iam_policy(policy_arn, ftstack)
 
     def aws_iam_policy(self, policy_arn, ftstack=None):
         resource_type = "aws_iam_policy"
@@ -179,7 +190,8 @@ class IAM:
             "name": policy_name,
         }
         self.hcl.process_resource(
-            resource_type, policy_name, attributes)
+            resource_type, policy_name, attributes,
+            state_payload(self.provider_instance.aws_clients.iam_client.get_policy, "Policy", PolicyArn=policy_arn))
         if not ftstack:
             ftstack = "iam"
         self.hcl.add_stack(resource_type, id, ftstack)
@@ -225,7 +237,9 @@ class IAM:
         attributes = {
             "id": id,
         }
-        self.hcl.process_resource(resource_type, id, attributes)
+        self.hcl.process_resource(
+            resource_type, id, attributes,
+            state_payload(self.provider_instance.aws_clients.iam_client.get_saml_provider, SAMLProviderArn=provider_arn))
         if not ftstack:
             ftstack = "saml"
         self.hcl.add_stack(resource_type, id, ftstack)
@@ -1,4 +1,5 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import paginate_with_progress, stream_pages, state_payload, combined_state_payload
 import botocore
 import logging
 import inspect
@@ -57,8 +58,7 @@ class KMS:
         if key_arn:
             # Process only the key specified by the ARN
             try:
-                key_metadata = self.provider_instance.aws_clients.kms_client.describe_key(KeyId=key_arn)[
-                    "KeyMetadata"]
+                key_metadata = self.describe_key(key_arn)
                 if key_metadata["KeyManager"] == "CUSTOMER":
                     self.process_key(key_metadata, ftstack)
                 else:
@@ -68,27 +68,31 @@ class KMS:
         else:
             # Process all customer-managed keys
             paginator = self.provider_instance.aws_clients.kms_client.get_paginator("list_keys")
-            total = 0
-            for page in paginator.paginate():
-                for key in page["Keys"]:
-                    total += 1
-
-            if total > 0:
-                self.task = self.provider_instance.progress.add_task(
-                    f"[cyan]Processing {self.__class__.__name__}...", total=total)
-
-            for page in paginator.paginate():
-                for key in page["Keys"]:
-                    key_id = key["KeyId"]
-                    self.provider_instance.progress.update(
-                        self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{key_id}[/]")
-                    try:
-                        key_metadata = self.provider_instance.aws_clients.kms_client.describe_key(KeyId=key_id)[
-                            "KeyMetadata"]
-                        if key_metadata["KeyManager"] == "CUSTOMER":
-                            self.process_key(key_metadata, ftstack)
-                    except botocore.exceptions.ClientError as e:
-                        logger.error(f"  Error processing KMS Key: {e}")
+            for key in paginate_with_progress(self, stream_pages(paginator), "Keys"):
+                key_id = key["KeyId"]
+                self.provider_instance.progress.update(
+                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{key_id}[/]")
+                try:
+                    key_metadata = self.describe_key(key_id)
+                    if key_metadata["KeyManager"] == "CUSTOMER":
+                        self.process_key(key_metadata, ftstack)
+                except botocore.exceptions.ClientError as e:
+                    logger.error(f"  Error processing KMS Key: {e}")
+
+    def describe_key(self, key_id):
+        return self.provider_instance.aws_clients.kms_client.describe_key(KeyId=key_id)[
+            "KeyMetadata"]
+
+    def key_payload(self, key_metadata):
+        """The key with its policy, tags and rotation status, None if any cannot be read."""
+        kms_client = self.provider_instance.aws_clients.kms_client
+        return combined_state_payload(
+            key=key_metadata,
+            policy=state_payload(kms_client.get_key_policy, "Policy",
+                                 KeyId=key_metadata["Arn"], PolicyName="default"),
+            tags=state_payload(kms_client.list_resource_tags, "Tags", KeyId=key_metadata["Arn"]),
+            rotation=state_payload(kms_client.get_key_rotation_status, KeyId=key_metadata["Arn"]),
+        )
 
     def process_key(self, key_metadata, ftstack):
         resource_type = "aws_kms_key"
@@ -107,7 +111,7 @@ class KMS:
             "key_state": key_metadata["KeyState"],
         }
         self.hcl.process_resource(
-            resource_type, key_id.replace("-", "_"), attributes)
+            resource_type, key_id.replace("-", "_"), attributes, self.key_payload(key_metadata))
         self.hcl.add_stack(resource_type, id, ftstack)
 
         self.aws_kms_key_policy(key_metadata["Arn"])
@@ -140,7 +144,7 @@ class KMS:
                     "target_key_id": target_key_id,
                 }
                 self.hcl.process_resource(
-                    "aws_kms_alias", alias_name.replace("-", "_"), attributes)
+                    "aws_kms_alias", alias_name.replace("-", "_"), attributes, alias)
 
         except botocore.exceptions.ClientError as e:
             logger.debug(f"  Error processing KMS Aliases: {e}")
@@ -239,7 +243,7 @@ class KMS:
                     # Additional attributes can be included as needed
                 }
                 self.hcl.process_resource(
-                    "aws_kms_grant", grant_id.replace("-", "_"), attributes)
+                    "aws_kms_grant", grant_id.replace("-", "_"), attributes, grant)
 
         except botocore.exceptions.ClientError as e:
             pass
@@ -260,7 +264,7 @@ class KMS:
                 "policy": policy,
             }
             self.hcl.process_resource(
-                "aws_kms_key_policy", kms_arn.replace("-", "_"), attributes)
+                "aws_kms_key_policy", kms_arn.replace("-", "_"), attributes, policy)
 
         except botocore.exceptions.ClientError as e:
             logger.debug(f"  Error processing KMS Key Policy: {e}")
@@ -272,8 +276,7 @@ class KMS:
         try:
             for page in paginator.paginate():
                 for key in page["Keys"]:
-                    key_metadata = self.provider_instance.aws_clients.kms_client.describe_key(KeyId=key["KeyId"])[
-                        "KeyMetadata"]
+                    key_metadata = self.describe_key(key["KeyId"])
 
                     # Check if the key is multi-region
                     if key_metadata.get("MultiRegion", False):
@@ -300,7 +303,7 @@ class KMS:
                                     # Add more attributes as needed
                                 }
                                 self.hcl.process_resource(
-                                    "aws_kms_replica_key", key_metadata['KeyId'].replace("-", "_"), attributes)
+                                    "aws_kms_replica_key", key_metadata['KeyId'].replace("-", "_"), attributes, self.key_payload(key_metadata))
 
         except botocore.exceptions.ClientError as e:
             logger.error(f"  Error processing KMS Replica Key: {e}")
@@ -312,8 +315,7 @@ class KMS:
             for key in page["Keys"]:
                 try:
                     key_id = key["KeyId"]
-                    key_metadata = self.provider_instance.aws_clients.kms_client.describe_key(KeyId=key_id)[
-                        "KeyMetadata"]
+                    key_metadata = self.describe_key(key_id)
 
                     if key_metadata["Origin"] == "EXTERNAL":
                         logger.debug(f"Processing KMS External Key: {key_id}")
@@ -326,7 +328,7 @@ class KMS:
                             "enabled": key_metadata["Enabled"],
                         }
                         self.hcl.process_resource(
-                            "aws_kms_external_key", key_id.replace("-", "_"), attributes)
+                            "aws_kms_external_key", key_id.replace("-", "_"), attributes, self.key_payload(key_metadata))
 
                 except botocore.exceptions.ClientError as e:
                     logger.error(f"  Error processing KMS Grant: {e}")
@@ -338,8 +340,7 @@ class KMS:
         try:
             for page in paginator.paginate():
                 for key in page["Keys"]:
-                    key_metadata = self.provider_instance.aws_clients.kms_client.describe_key(KeyId=key["KeyId"])[
-                        "KeyMetadata"]
+                    key_metadata = self.describe_key(key["KeyId"])
 
                     # Check if the key's origin is external and it's a multi-region key
                     if key_metadata["Origin"] == "EXTERNAL" and key_metadata.get("MultiRegion", False):
@@ -366,7 +367,7 @@ class KMS:
                                     # Add more attributes as needed
                                 }
                                 self.hcl.process_resource(
-                                    "aws_kms_replica_external_key", key_metadata['KeyId'].replace("-", "_"), attributes)
+                                    "aws_kms_replica_external_key", key_metadata['KeyId'].replace("-", "_"), attributes, self.key_payload(key_metadata))
 
         except botocore.exceptions.ClientError as e:
             logger.error(f"  Error processing KMS Replica External Key: {e}")
@@ -1,5 +1,5 @@
 from ...utils.hcl import HCL
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import paginate_with_progress, stream_pages, get_subnet_names, state_payload, combined_state_payload
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.kms import KMS
 import logging
@@ -53,16 +53,9 @@ class LaunchTemplate:
         logger.debug("Processing AWS Launch Templates...")
         # If launch_template_id is not provided, process all launch templates
         if launch_template_id is None:
-            all_templates_response = self.provider_instance.aws_clients.ec2_client.describe_launch_templates()
-            if 'LaunchTemplates' not in all_templates_response or not all_templates_response['LaunchTemplates']:
-                logger.debug("No launch templates found!")
-                return
-
-            if len(all_templates_response['LaunchTemplates']) > 0:
-                self.task = self.provider_instance.progress.add_task(f"[cyan]Processing {self.__class__.__name__}...", total=len(
-                    all_templates_response['LaunchTemplates']))
-
-            for template in all_templates_response['LaunchTemplates']:
+            paginator = self.provider_instance.aws_clients.ec2_client.get_paginator(
+                "describe_launch_templates")
+            for template in paginate_with_progress(self, stream_pages(paginator), "LaunchTemplates"):
                 self.provider_instance.progress.update(
                     self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{template['LaunchTemplateId']}[/]")
                 self.process_individual_launch_template(
@@ -105,8 +98,12 @@ class LaunchTemplate:
         if not ftstack:
             ftstack = "launchtemplate"
 
+        templates = state_payload(
+            self.provider_instance.aws_clients.ec2_client.describe_launch_templates, "LaunchTemplates",
+            LaunchTemplateIds=[launch_template_id])
         self.hcl.process_resource(
-            resource_type, id, attributes)
+            resource_type, id, attributes,
+            combined_state_payload(template=templates, version=latest_version))
         self.hcl.add_stack(resource_type, id, ftstack)
 
         # security_groups
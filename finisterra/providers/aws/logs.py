@@ -1,4 +1,6 @@
 from ...utils.hcl import HCL
+from ...utils.native_state import native_builder
+from ...providers.aws.utils import paginate_with_progress, stream_pages
 from ...providers.aws.kms import KMS
 import logging
 import inspect
@@ -6,6 +8,30 @@ import inspect
 logger = logging.getLogger('finisterra')
 
 
+def log_group_arn(log_group):
+    # describe_log_groups returns the ARN of the group's streams, ending in :*
+    arn = log_group["arn"]
+    return arn[:-2] if arn.endswith(":*") else arn
+
+
+@native_builder("aws_cloudwatch_log_group")
+def log_group_state(attributes, payload):
+    log_group, tags = payload["log_group"], payload["tags"]
+    if tags is None:
+        return None
+    return {
+        "arn": log_group_arn(log_group),
+        "kms_key_id": log_group.get("kmsKeyId", ""),
+        "log_group_class": log_group.get("logGroupClass", "STANDARD"),
+        "name": log_group["logGroupName"],
+        "name_prefix": "",
+        "retention_in_days": log_group.get("retentionInDays", 0),
+        "skip_destroy": False,
+        "tags": tags,
+        "tags_all": tags,
+    }
+
+
 class Logs:
     def __init__(self, provider_instance, hcl=None):
         self.provider_instance=provider_instance
@@ -64,7 +90,7 @@ class Logs:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudwatch_log_data_protection_policy", policy_name.replace("-", "_"), attributes)
+                    "aws_cloudwatch_log_data_protection_policy", policy_name.replace("-", "_"), attributes, policy)
 
     def aws_cloudwatch_log_destination(self):
         logger.debug("Processing CloudWatch Log Destinations...")
@@ -86,7 +112,7 @@ class Logs:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudwatch_log_destination", destination_name.replace("-", "_"), attributes)
+                    "aws_cloudwatch_log_destination", destination_name.replace("-", "_"), attributes, destination)
 
     def aws_cloudwatch_log_destination_policy(self):
         logger.debug("Processing CloudWatch Log Destination Policies...")
@@ -110,7 +136,7 @@ class Logs:
                     }
 
                     self.hcl.process_resource(
-                        "aws_cloudwatch_log_destination_policy", destination_name.replace("-", "_"), attributes)
+                        "aws_cloudwatch_log_destination_policy", destination_name.replace("-", "_"), attributes, destination_policy)
                 except self.provider_instance.aws_clients.logs_client.exceptions.ResourceNotFoundException:
                     logger.debug(
                         f"  No Destination Policy found for Log Destination: {destination_name}")
@@ -122,31 +148,34 @@ class Logs:
             self.process_single_log_group(specific_log_group_name, ftstack)
             return
 
+        # A "name" filter is pushed down as the listing prefix
+        resource_filter = self.provider_instance.resource_filter
+        params = {}
+        if resource_filter.name_prefix():
+            params["logGroupNamePrefix"] = resource_filter.name_prefix()
+
         paginator = self.provider_instance.aws_clients.logs_client.get_paginator(
             "describe_log_groups")
-        total = 0
-        for page in paginator.paginate():
-            total += len(page["logGroups"])
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for log_group in page["logGroups"]:
-                log_group_name = log_group["logGroupName"]
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{log_group_name}[/]")
-                if log_group_name.startswith("/aws"):
-                    continue
-                self.process_single_log_group(log_group_name, ftstack)
-
-    def process_single_log_group(self, log_group_name, ftstack=None):
+        for log_group in paginate_with_progress(self, stream_pages(paginator, **params), "logGroups"):
+            log_group_name = log_group["logGroupName"]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{log_group_name}[/]")
+            if log_group_name.startswith("/aws"):
+                continue
+            if not resource_filter.match_name(log_group_name):
+                continue
+            self.process_single_log_group(log_group_name, ftstack, log_group)
+
+    def process_single_log_group(self, log_group_name, ftstack=None, log_group=None):
         resource_type = "aws_cloudwatch_log_group"
-        log_group = self.provider_instance.aws_clients.logs_client.describe_log_groups(
-            logGroupNamePrefix=log_group_name)['logGroups']
-        if not log_group:
-            return
-        log_group = log_group[0]
+        if log_group is None:
+            # The name is a prefix to the API, keep the exact match only
+            log_groups = self.provider_instance.aws_clients.logs_client.describe_log_groups(
+                logGroupNamePrefix=log_group_name)['logGroups']
+            log_group = next(
+                (group for group in log_groups if group["logGroupName"] == log_group_name), None)
+            if not log_group:
+                return
         logger.debug(f"Processing CloudWatch Log Group: {log_group_name}")
         id = log_group_name
         attributes = {
@@ -154,18 +183,29 @@ class Logs:
             "name": log_group_name,
         }
 
-        self.hcl.process_resource(resource_type, id, attributes)
+        self.hcl.process_resource(resource_type, id, attributes, {
+            "log_group": log_group,
+            "tags": self.log_group_tags(log_group),
+        })
         if not ftstack:
             ftstack = "logs"
 
-        # Fetch details of the log group for additional information like KMS key
-        log_group = self.provider_instance.aws_clients.logs_client.describe_log_groups(
-            logGroupNamePrefix=log_group_name)["logGroups"][0]
         if "kmsKeyId" in log_group:
             self.kms_instance.aws_kms_key(log_group["kmsKeyId"], ftstack)
 
         self.hcl.add_stack(resource_type, id, ftstack)
 
+    def log_group_tags(self, log_group):
+        arn = log_group_arn(log_group)
+        tags = self.provider_instance.tag_index.tags(arn)
+        if tags is None:
+            try:
+                tags = self.provider_instance.aws_clients.logs_client.list_tags_log_group(
+                    logGroupName=log_group["logGroupName"]).get("tags", {})
+            except Exception as e:
+                logger.debug(f"Could not read tags of {arn}: {e}")
+        return tags
+
     def aws_cloudwatch_log_metric_filter(self):
         logger.debug("Processing CloudWatch Log Metric Filters...")
 
@@ -192,7 +232,7 @@ class Logs:
                         }
 
                         self.hcl.process_resource(
-                            "aws_cloudwatch_log_metric_filter", filter_name.replace("-", "_"), attributes)
+                            "aws_cloudwatch_log_metric_filter", filter_name.replace("-", "_"), attributes, metric_filter)
 
     def aws_cloudwatch_log_resource_policy(self):
         logger.debug("Processing CloudWatch Log Resource Policies...")
@@ -212,7 +252,7 @@ class Logs:
                 }
 
                 self.hcl.process_resource(
-                    "aws_cloudwatch_log_resource_policy", policy_name.replace("-", "_"), attributes)
+                    "aws_cloudwatch_log_resource_policy", policy_name.replace("-", "_"), attributes, resource_policy)
 
     def aws_cloudwatch_log_stream(self):
         logger.debug("Processing CloudWatch Log Streams...")
@@ -238,7 +278,7 @@ class Logs:
                         }
 
                         self.hcl.process_resource(
-                            "aws_cloudwatch_log_stream", stream_name.replace("-", "_"), attributes)
+                            "aws_cloudwatch_log_stream", stream_name.replace("-", "_"), attributes, log_stream)
 
     def aws_cloudwatch_log_subscription_filter(self):
         logger.debug("Processing CloudWatch Log Subscription Filters...")
@@ -267,7 +307,7 @@ class Logs:
                         }
 
                         self.hcl.process_resource(
-                            "aws_cloudwatch_log_subscription_filter", filter_name.replace("-", "_"), attributes)
+                            "aws_cloudwatch_log_subscription_filter", filter_name.replace("-", "_"), attributes, subscription_filter)
 
     def aws_cloudwatch_query_definition(self):
         logger.debug("Processing CloudWatch Query Definitions...")
@@ -289,4 +329,4 @@ class Logs:
                 attributes["log_group_names"] = query_definition["logGroupNames"]
 
             self.hcl.process_resource(
-                "aws_cloudwatch_query_definition", query_definition_id.replace("-", "_"), attributes)
+                "aws_cloudwatch_query_definition", query_definition_id.replace("-", "_"), attributes, query_definition)
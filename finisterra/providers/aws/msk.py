@@ -1,6 +1,6 @@
 from ...utils.hcl import HCL
 from ...providers.aws.security_group import SECURITY_GROUP
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import get_subnet_names, get_vpc_name
 import logging
 import inspect
 
@@ -42,23 +42,6 @@ class MSK:
         vpc_id = response["SecurityGroups"][0]["VpcId"]
         return vpc_id
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
     def msk(self):
         self.hcl.prepare_folder()
 
@@ -104,6 +87,7 @@ class MSK:
                 id = cluster_arn
 
                 ftstack = "msk"
+                tags = {}
                 try:
                     tags_response = self.provider_instance.aws_clients.msk_client.list_tags_for_resource(
                         ResourceArn=cluster_arn)
@@ -120,7 +104,7 @@ class MSK:
                 }
 
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, {"cluster": cluster_info, "tags": tags})
                 self.hcl.add_stack(resource_type, id, ftstack)
 
                 # Extracting the Security Group IDs for the MSK Cluster
@@ -138,7 +122,7 @@ class MSK:
                 if vpc_id:
                     self.hcl.add_additional_data(
                         resource_type, id, "vpc_id", vpc_id)
-                    vpc_name = self.get_vpc_name(vpc_id)
+                    vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
                     if vpc_name:
                         self.hcl.add_additional_data(
                             resource_type, id, "vpc_name", vpc_name)
@@ -176,7 +160,7 @@ class MSK:
             }
 
             self.hcl.process_resource(
-                "aws_msk_scram_secret_association", secret, attributes)
+                "aws_msk_scram_secret_association", secret, attributes, secret)
 
     def aws_appautoscaling_target(self, cluster_arn):
         logger.debug(
@@ -207,7 +191,7 @@ class MSK:
                 }
 
                 self.hcl.process_resource(
-                    "aws_appautoscaling_target", target_id, attributes)
+                    "aws_appautoscaling_target", target_id, attributes, target)
 
     def aws_appautoscaling_policy(self, cluster_arn):
         logger.debug(
@@ -241,7 +225,7 @@ class MSK:
                 }
 
                 self.hcl.process_resource(
-                    "aws_appautoscaling_policy", id, attributes)
+                    "aws_appautoscaling_policy", id, attributes, policy)
 
     def aws_msk_configuration(self, cluster_arn):
         logger.debug(
@@ -273,7 +257,7 @@ class MSK:
         }
 
         self.hcl.process_resource(
-            "aws_msk_configuration", config_name, attributes)
+            "aws_msk_configuration", config_name, attributes, configuration)
 
     # def aws_security_group(self, security_group_ids):
     #     logger.debug("Processing Security Groups...")
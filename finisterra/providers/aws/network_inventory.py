@@ -0,0 +1,296 @@
+import threading
+import logging
+from botocore.exceptions import ClientError
+
+from ...providers.aws.utils import get_index, get_network_index
+
+logger = logging.getLogger('finisterra')
+
+
+def group_by(items, keys_of):
+    groups = {}
+    for item in items:
+        for key in keys_of(item):
+            if key:
+                groups.setdefault(key, []).append(item)
+    return groups
+
+
+class Collection:
+    """One EC2 describe sweep, indexed by ID and VPC."""
+
+    def __init__(self, items, id_key):
+        self.items = items
+        self.by_id = {item[id_key]: item for item in items}
+        self.by_vpc = group_by(items, lambda item: [item.get("VpcId")])
+
+    def list(self, vpc_id=None):
+        if vpc_id is None:
+            return self.items
+        return self.by_vpc.get(vpc_id, [])
+
+
+# Route target ID field and prefix -> kind of egress it gives a subnet
+ROUTE_TARGETS = (
+    ("GatewayId", "igw-", "internet"),
+    ("EgressOnlyInternetGatewayId", "eigw-", "egress_only"),
+    ("NatGatewayId", "nat-", "nat"),
+    ("TransitGatewayId", "tgw-", "transit"),
+)
+
+
+def route_targets(route_table):
+    """Kinds of egress the active routes of a route table point to."""
+    targets = set()
+    for route in route_table.get("Routes", []):
+        if route.get("State") == "blackhole":
+            continue
+        for field, prefix, kind in ROUTE_TARGETS:
+            if route.get(field, "").startswith(prefix):
+                targets.add(kind)
+    return targets
+
+
+class RouteGraph:
+    """
+    Subnet -> route table -> target graph of the snapshot. A subnet uses its
+    explicitly associated route table, or else the main route table of its
+    VPC, and is public when that table routes to an internet gateway.
+    """
+
+    def __init__(self, inventory):
+        self.route_tables = {}
+        self.targets = {}
+        for subnet in inventory.subnets():
+            subnet_id = subnet["SubnetId"]
+            route_table = inventory.subnet_route_table(
+                subnet_id) or inventory.main_route_table(subnet["VpcId"])
+            self.route_tables[subnet_id] = route_table
+            self.targets[subnet_id] = route_targets(
+                route_table) if route_table else set()
+
+    def is_public(self, subnet_id):
+        return "internet" in self.targets.get(subnet_id, set())
+
+    def is_private(self, subnet_id):
+        return not self.is_public(subnet_id)
+
+
+class NetworkInventory:
+    """
+    Run-scoped snapshot of the account's EC2 networking, shared by the vpc,
+    vpc_endpoint, security_group, client_vpn and ec2 modules.
+
+    Each collection is fetched once, fully paginated, the first time it is
+    needed, and indexed by ID, VPC, subnet and attachment. Subnets and VPCs
+    come from the NetworkIndex sweep. Items are shared, callers must not
+    modify them.
+    """
+
+    COLLECTIONS = {
+        "route_tables": ("describe_route_tables", "RouteTables", "RouteTableId"),
+        "network_acls": ("describe_network_acls", "NetworkAcls", "NetworkAclId"),
+        "nat_gateways": ("describe_nat_gateways", "NatGateways", "NatGatewayId"),
+        "internet_gateways": ("describe_internet_gateways", "InternetGateways", "InternetGatewayId"),
+        "vpc_endpoints": ("describe_vpc_endpoints", "VpcEndpoints", "VpcEndpointId"),
+        "security_groups": ("describe_security_groups", "SecurityGroups", "GroupId"),
+        "security_group_rules": ("describe_security_group_rules", "SecurityGroupRules", "SecurityGroupRuleId"),
+    }
+
+    def __init__(self, aws_clients):
+        self.aws_clients = aws_clients
+        self.network_index = get_network_index(aws_clients)
+        self.collections = {}
+        self.indexes = {}
+        self.collection_locks = {}
+        self.lock = threading.Lock()
+
+    def collection(self, name):
+        with self.lock:
+            if name in self.collections:
+                return self.collections[name]
+            # Only requests for the same collection wait for its sweep
+            collection_lock = self.collection_locks.setdefault(
+                name, threading.Lock())
+        with collection_lock:
+            with self.lock:
+                if name in self.collections:
+                    return self.collections[name]
+            operation, key, id_key = self.COLLECTIONS[name]
+            paginator = self.aws_clients.ec2_client.get_paginator(
+                operation)
+            items = [item for page in paginator.paginate()
+                     for item in page[key]]
+            logger.debug(f"Network inventory: {len(items)} {name}")
+            collection = Collection(items, id_key)
+            with self.lock:
+                self.collections[name] = collection
+            return collection
+
+    def lookup(self, name, item_id, describe):
+        """
+        Item of a collection by ID. Items missing from the snapshot (e.g.
+        created since) are fetched with describe(item_id) and remembered,
+        None if not found.
+        """
+        collection = self.collection(name)
+        with self.lock:
+            if item_id in collection.by_id:
+                return collection.by_id[item_id]
+        try:
+            items = describe(item_id)
+        except ClientError as e:
+            logger.debug(f"{name} {item_id} not found: {e}")
+            items = []
+        with self.lock:
+            collection.by_id[item_id] = items[0] if items else None
+            return collection.by_id[item_id]
+
+    def index(self, name, build):
+        """Secondary index `name`, built once by build()."""
+        with self.lock:
+            if name in self.indexes:
+                return self.indexes[name]
+        index = build()
+        with self.lock:
+            return self.indexes.setdefault(name, index)
+
+    # VPCs and subnets
+
+    def vpcs(self):
+        return self.network_index.all_vpcs()
+
+    def subnets(self, vpc_id=None):
+        subnets = self.network_index.all_subnets()
+        if vpc_id is None:
+            return subnets
+        return self.index("subnets_by_vpc", lambda: group_by(
+            subnets, lambda subnet: [subnet["VpcId"]])).get(vpc_id, [])
+
+    def subnet_cidr(self, subnet_id):
+        subnet = self.network_index.subnet(subnet_id)
+        return subnet["CidrBlock"] if subnet else None
+
+    # Route tables
+
+    def route_tables(self, vpc_id=None):
+        return self.collection("route_tables").list(vpc_id)
+
+    def route_table(self, route_table_id):
+        return self.collection("route_tables").by_id.get(route_table_id)
+
+    def main_route_table(self, vpc_id):
+        return self.index("main_route_table_by_vpc", lambda: {
+            rt["VpcId"]: rt for rt in self.route_tables()
+            if any(assoc.get("Main") for assoc in rt.get("Associations", []))
+        }).get(vpc_id)
+
+    def subnet_route_table(self, subnet_id):
+        """Route table explicitly associated with the subnet, if any."""
+        return self.index("route_table_by_subnet", lambda: {
+            assoc["SubnetId"]: rt for rt in self.route_tables()
+            for assoc in rt.get("Associations", []) if assoc.get("SubnetId")
+        }).get(subnet_id)
+
+    def subnet_route_table_associations(self, subnet_id):
+        """[(route_table, association)] of the subnet's explicit, non-main associations."""
+        return self.index("route_table_associations_by_subnet", lambda: group_by(
+            [(rt, assoc) for rt in self.route_tables()
+             for assoc in rt.get("Associations", [])
+             if assoc.get("SubnetId") and not assoc.get("Main")],
+            lambda pair: [pair[1]["SubnetId"]])).get(subnet_id, [])
+
+    def is_main_route_table(self, route_table_id):
+        route_table = self.route_table(route_table_id)
+        return bool(route_table) and any(assoc.get("Main") for assoc in route_table.get("Associations", []))
+
+    def route_graph(self):
+        return self.index("route_graph", lambda: RouteGraph(self))
+
+    def subnet_effective_route_table(self, subnet_id):
+        return self.route_graph().route_tables.get(subnet_id)
+
+    def is_subnet_public(self, subnet_id):
+        return self.route_graph().is_public(subnet_id)
+
+    def is_subnet_private(self, subnet_id):
+        return self.route_graph().is_private(subnet_id)
+
+    # Network ACLs
+
+    def network_acls(self, vpc_id=None):
+        return self.collection("network_acls").list(vpc_id)
+
+    def network_acl(self, network_acl_id):
+        return self.collection("network_acls").by_id.get(network_acl_id)
+
+    def default_network_acl(self, vpc_id):
+        return self.index("default_network_acl_by_vpc", lambda: {
+            acl["VpcId"]: acl for acl in self.network_acls() if acl["IsDefault"]
+        }).get(vpc_id)
+
+    # NAT gateways
+
+    def nat_gateways(self, vpc_id=None):
+        return self.collection("nat_gateways").list(vpc_id)
+
+    def nat_gateway(self, nat_gateway_id):
+        return self.collection("nat_gateways").by_id.get(nat_gateway_id)
+
+    def subnet_nat_gateways(self, subnet_id):
+        return self.index("nat_gateways_by_subnet", lambda: group_by(
+            self.nat_gateways(), lambda ng: [ng.get("SubnetId")])).get(subnet_id, [])
+
+    def allocation_nat_gateway(self, allocation_id):
+        return self.index("nat_gateway_by_allocation", lambda: {
+            address["AllocationId"]: ng for ng in self.nat_gateways()
+            for address in ng.get("NatGatewayAddresses", []) if address.get("AllocationId")
+        }).get(allocation_id)
+
+    # Internet gateways
+
+    def internet_gateways(self, vpc_id=None):
+        if vpc_id is None:
+            return self.collection("internet_gateways").items
+        return self.index("internet_gateways_by_vpc", lambda: group_by(
+            self.internet_gateways(),
+            lambda igw: [attachment["VpcId"] for attachment in igw.get("Attachments", [])])).get(vpc_id, [])
+
+    # VPC endpoints
+
+    def vpc_endpoints(self, vpc_id=None):
+        return self.collection("vpc_endpoints").list(vpc_id)
+
+    def vpc_endpoint(self, vpc_endpoint_id):
+        """VPC endpoint by ID, described on its own if it is not in the snapshot."""
+        return self.lookup("vpc_endpoints", vpc_endpoint_id, lambda item_id:
+                           self.aws_clients.ec2_client.describe_vpc_endpoints(
+                               VpcEndpointIds=[item_id])["VpcEndpoints"])
+
+    # Security groups
+
+    def security_groups(self, vpc_id=None):
+        return self.collection("security_groups").list(vpc_id)
+
+    def security_group(self, group_id):
+        """Security group by ID, described on its own if it is not in the snapshot."""
+        return self.lookup("security_groups", group_id, lambda item_id:
+                           self.aws_clients.ec2_client.describe_security_groups(
+                               GroupIds=[item_id])["SecurityGroups"])
+
+    def security_group_rules(self, group_id=None):
+        """Rules of a group, described on their own if it is not in the snapshot."""
+        if group_id is None:
+            return self.collection("security_group_rules").items
+        rules = self.index("security_group_rules_by_group", lambda: group_by(
+            self.security_group_rules(), lambda rule: [rule["GroupId"]]))
+        if group_id in rules:
+            return rules[group_id]
+        paginator = self.aws_clients.ec2_client.get_paginator(
+            "describe_security_group_rules")
+        return [rule for page in paginator.paginate(Filters=[{'Name': 'group-id', 'Values': [group_id]}])
+                for rule in page["SecurityGroupRules"]]
+
+
+def get_network_inventory(aws_clients):
+    return get_index(aws_clients, NetworkInventory)
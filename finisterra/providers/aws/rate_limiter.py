@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+import logging
+
+from ...providers.aws.api_cache import THROTTLING_ERRORS, error_code
+
+logger = logging.getLogger('finisterra')
+
+
+class TokenBucket:
+    """
+    Token bucket whose refill rate follows AIMD: it is halved (at most once
+    per second) on throttling and grows back additively while requests
+    succeed. The bucket holds one second of requests, and starts full.
+    """
+
+    def __init__(self, name, rate, min_rate, max_rate):
+        self.name = name
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.last_decrease = 0.0
+        self.lock = threading.Lock()
+
+    def refill(self, now):
+        self.tokens = min(self.rate, self.tokens +
+                          (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                self.refill(time.monotonic())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        with self.lock:
+            # +1 request/s for every `rate` successful requests
+            self.rate = min(self.max_rate, self.rate + 1 / self.rate)
+
+    def on_throttle(self):
+        with self.lock:
+            now = time.monotonic()
+            if now - self.last_decrease < 1:
+                return
+            self.last_decrease = now
+            self.rate = max(self.min_rate, self.rate / 2)
+            logger.debug(
+                f"{self.name} throttled, lowering rate to {self.rate:.1f} requests/s")
+
+
+class RateLimiter:
+    """
+    Process-wide request budget, one TokenBucket per AWS service, shared by
+    every client built by AwsClients (and so by all module threads). It sits
+    on botocore's before-send/needs-retry events, so retries are paced too.
+
+    Services start at FT_API_MAX_RATE, so nothing is slowed down until AWS
+    throttles a service for the first time.
+    """
+
+    buckets = {}
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.min_rate = float(os.getenv('FT_API_MIN_RATE', 1))
+        self.max_rate = float(os.getenv('FT_API_MAX_RATE', 100))
+        self.rate = min(self.max_rate, float(
+            os.getenv('FT_API_RATE', self.max_rate)))
+
+    def bucket(self, service_name):
+        with self.lock:
+            if service_name not in self.buckets:
+                self.buckets[service_name] = TokenBucket(
+                    service_name, self.rate, self.min_rate, self.max_rate)
+            return self.buckets[service_name]
+
+    def register(self, client):
+        bucket = self.bucket(client.meta.service_model.service_name)
+        events = client.meta.events
+        events.register('before-send', lambda **kwargs: bucket.acquire())
+        events.register('needs-retry', lambda response=None, **kwargs: self.needs_retry(bucket, response))
+
+    def needs_retry(self, bucket, response):
+        if response is None:
+            return
+        http_response, parsed = response
+        if http_response.status_code == 429 or error_code(parsed) in THROTTLING_ERRORS:
+            bucket.on_throttle()
+        elif http_response.status_code < 300:
+            bucket.on_success()
@@ -3,8 +3,7 @@ from ...providers.aws.iam_role import IAM
 from ...providers.aws.logs import Logs
 from ...providers.aws.security_group import SECURITY_GROUP
 from ...providers.aws.kms import KMS
-from ...providers.aws.utils import get_subnet_names
-import botocore
+from ...providers.aws.utils import paginate_with_progress, stream_pages, get_subnet_names, get_vpc_name_by_subnet, get_kms_alias, paginated_state_payload, combined_state_payload
 import logging
 import inspect
 
@@ -34,63 +33,6 @@ class RDS:
         self.security_group_instance = SECURITY_GROUP(self.provider_instance, self.hcl)
         self.kms_instance = KMS(self.provider_instance, self.hcl)
 
-    def get_kms_alias(self, kms_key_id):
-        try:
-            value = ""
-            response = self.provider_instance.aws_clients.kms_client.list_aliases()
-            aliases = response.get('Aliases', [])
-            while 'NextMarker' in response:
-                response = self.provider_instance.aws_clients.kms_client.list_aliases(
-                    Marker=response['NextMarker'])
-                aliases.extend(response.get('Aliases', []))
-            for alias in aliases:
-                if 'TargetKeyId' in alias and alias['TargetKeyId'] == kms_key_id.split('/')[-1]:
-                    value = alias['AliasName']
-                    break
-            return value
-        except botocore.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'AccessDeniedException':
-                return ""
-            else:
-                raise e
-
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
-    def get_vpc_name_by_subnet(self, subnet_ids):
-        vpc_id = ""
-        vpc_name = ""
-        if subnet_ids:
-            subnet_id = subnet_ids[0]
-            # get the vpc id for the subnet_id
-            response = self.provider_instance.aws_clients.ec2_client.describe_subnets(SubnetIds=[
-                                                                    subnet_id])
-            if not response or 'Subnets' not in response or not response['Subnets']:
-                # Handle this case as required, for example:
-                logger.debug(
-                    f"No subnet information found for Subnet ID: {subnet_id}")
-                return None
-            vpc_id = response['Subnets'][0].get('VpcId', None)
-
-            if vpc_id:
-                vpc_name = self.get_vpc_name(vpc_id)
-
-        return vpc_id, vpc_name
-
     def rds(self):
         self.hcl.prepare_folder()
 
@@ -117,124 +59,109 @@ class RDS:
 
         paginator = self.provider_instance.aws_clients.rds_client.get_paginator(
             "describe_db_instances")
-        total = 0
-        for page in paginator.paginate():
-            for instance in page.get("DBInstances", []):
-                if instance.get("DBClusterIdentifier") is not None:
-                    continue
-
-                if instance.get("Engine", None) not in ["mysql", "postgres"]:
-                    continue
-                total += 1
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for instance in page.get("DBInstances", []):
-                instance_id = instance["DBInstanceIdentifier"]
-                # Skip instances that belong to a cluster
-                if instance.get("DBClusterIdentifier") is not None:
-                    continue
-
-                if instance.get("Engine", None) not in ["mysql", "postgres"]:
-                    continue
-
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{instance_id}[/]")
-
-                logger.debug(f"Processing DB Instance: {instance_id}")
-
-                # if instance_id != "xxx":
-                #     continue
 
-                id = instance_id
+        # Skip instances that belong to a cluster and other engines
+        def standalone(instance):
+            return instance.get("DBClusterIdentifier") is None and instance.get("Engine", None) in ["mysql", "postgres"]
 
-                ftstack = "rds"
-                try:
-                    tags_response = self.provider_instance.aws_clients.rds_client.list_tags_for_resource(
-                        ResourceName=instance["DBInstanceArn"])
-                    tags = tags_response.get('TagList', [])
-                    for tag in tags:
-                        if tag['Key'] == 'ftstack':
-                            if tag['Value'] != 'rds':
-                                ftstack = "stack_" + tag['Value']
-                            break
-                except Exception as e:
-                    logger.error("Error occurred: ", e)
-
-                attributes = {
-                    "id": id,
-                }
-                self.hcl.process_resource(
-                    resource_type, id, attributes)
-                DbiResourceId = instance.get("DbiResourceId", None)
-                self.hcl.add_stack(resource_type, DbiResourceId, ftstack)
-
-                db_option_group_name = instance.get(
-                    'OptionGroupMemberships', [{}])[0].get('OptionGroupName', None)
-                if db_option_group_name is not None:
-                    self.aws_db_option_group(db_option_group_name, ftstack)
-
-                db_parameter_group_name = instance.get(
-                    'DBParameterGroups', [{}])[0].get('DBParameterGroupName', None)
-                if db_parameter_group_name is not None:
-                    self.aws_db_parameter_group(
-                        db_parameter_group_name, ftstack)
-
-                db_subnet_group_name = instance.get(
-                    'DBSubnetGroup', {}).get('DBSubnetGroupName', None)
-                if db_subnet_group_name is not None:
-                    self.aws_db_subnet_group(db_subnet_group_name, ftstack)
-
-                arn = instance.get("DBInstanceArn")
-                self.aws_db_instance_automated_backups_replication(
-                    arn, ftstack)
-
-                # call aws_cloudwatch_log_group function with instance_id and each log export name as parameters
-                for log_export_name in instance.get("EnabledCloudwatchLogsExports", []):
-                    self.logs_instance.aws_cloudwatch_log_group(
-                        f"/aws/rds/instance/{instance_id}/{log_export_name}", ftstack)
-                    # self.aws_cloudwatch_log_group(instance_id, log_export_name)
-
-                monitoring_role_arn = instance.get("MonitoringRoleArn")
-                if monitoring_role_arn:
-                    role_name = monitoring_role_arn.split('/')[-1]
-                    self.iam_role_instance.aws_iam_role(role_name, ftstack)
-                    # self.aws_iam_role(monitoring_role_arn)
-
-                vpc_security_groups = instance.get("VpcSecurityGroups", [])
-                security_group_ids = []
-                for sg in vpc_security_groups:
-                    sg_name = self.security_group_instance.aws_security_group(
-                        sg['VpcSecurityGroupId'], ftstack)
-                    if sg_name == "default":
-                        security_group_ids.append("default")
-                    else:
-                        security_group_ids.append(sg['VpcSecurityGroupId'])
-                self.hcl.add_additional_data(
-                    resource_type, id, "vpc_security_group_ids",  security_group_ids)
-
-                kms_key_id = instance.get("KmsKeyId")
-                if kms_key_id:
-                    type = self.kms_instance.aws_kms_key(kms_key_id, ftstack)
-                    if type == "MANAGED":
-                        kms_key_alias = self.get_kms_alias(kms_key_id)
-                        if kms_key_alias:
-                            self.hcl.add_additional_data(
-                                resource_type, id, "kms_key_alias",  kms_key_alias)
-
-                performance_insights_kms_key_id = instance.get(
-                    "PerformanceInsightsKMSKeyId")
-                if performance_insights_kms_key_id:
-                    type = self.kms_instance.aws_kms_key(
-                        performance_insights_kms_key_id, ftstack)
-                    if type == "MANAGED":
-                        kms_key_alias = self.get_kms_alias(
-                            performance_insights_kms_key_id)
-                        if kms_key_alias:
-                            self.hcl.add_additional_data(
-                                resource_type, id, "performance_insights_kms_key_alias",  kms_key_alias)
+        for instance in paginate_with_progress(self, stream_pages(paginator), "DBInstances", include=standalone):
+            instance_id = instance["DBInstanceIdentifier"]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{instance_id}[/]")
+
+            logger.debug(f"Processing DB Instance: {instance_id}")
+
+            # if instance_id != "xxx":
+            #     continue
+
+            id = instance_id
+
+            ftstack = "rds"
+            tags = []
+            try:
+                tags_response = self.provider_instance.aws_clients.rds_client.list_tags_for_resource(
+                    ResourceName=instance["DBInstanceArn"])
+                tags = tags_response.get('TagList', [])
+                for tag in tags:
+                    if tag['Key'] == 'ftstack':
+                        if tag['Value'] != 'rds':
+                            ftstack = "stack_" + tag['Value']
+                        break
+            except Exception as e:
+                logger.error("Error occurred: ", e)
+
+            attributes = {
+                "id": id,
+            }
+            self.hcl.process_resource(
+                resource_type, id, attributes, {"instance": instance, "tags": tags})
+            DbiResourceId = instance.get("DbiResourceId", None)
+            self.hcl.add_stack(resource_type, DbiResourceId, ftstack)
+
+            db_option_group_name = instance.get(
+                'OptionGroupMemberships', [{}])[0].get('OptionGroupName', None)
+            if db_option_group_name is not None:
+                self.aws_db_option_group(db_option_group_name, ftstack)
+
+            db_parameter_group_name = instance.get(
+                'DBParameterGroups', [{}])[0].get('DBParameterGroupName', None)
+            if db_parameter_group_name is not None:
+                self.aws_db_parameter_group(
+                    db_parameter_group_name, ftstack)
+
+            db_subnet_group_name = instance.get(
+                'DBSubnetGroup', {}).get('DBSubnetGroupName', None)
+            if db_subnet_group_name is not None:
+                self.aws_db_subnet_group(db_subnet_group_name, ftstack)
+
+            arn = instance.get("DBInstanceArn")
+            self.aws_db_instance_automated_backups_replication(
+                arn, ftstack)
+
+            # call aws_cloudwatch_log_group function with instance_id and each log export name as parameters
+            for log_export_name in instance.get("EnabledCloudwatchLogsExports", []):
+                self.logs_instance.aws_cloudwatch_log_group(
+                    f"/aws/rds/instance/{instance_id}/{log_export_name}", ftstack)
+                # self.aws_cloudwatch_log_group(instance_id, log_export_name)
+
+            monitoring_role_arn = instance.get("MonitoringRoleArn")
+            if monitoring_role_arn:
+                role_name = monitoring_role_arn.split('/')[-1]
+                self.iam_role_instance.aws_iam_role(role_name, ftstack)
+                # self.aws_iam_role(monitoring_role_arn)
+
+            vpc_security_groups = instance.get("VpcSecurityGroups", [])
+            security_group_ids = []
+            for sg in vpc_security_groups:
+                sg_name = self.security_group_instance.aws_security_group(
+                    sg['VpcSecurityGroupId'], ftstack)
+                if sg_name == "default":
+                    security_group_ids.append("default")
+                else:
+                    security_group_ids.append(sg['VpcSecurityGroupId'])
+            self.hcl.add_additional_data(
+                resource_type, id, "vpc_security_group_ids",  security_group_ids)
+
+            kms_key_id = instance.get("KmsKeyId")
+            if kms_key_id:
+                type = self.kms_instance.aws_kms_key(kms_key_id, ftstack)
+                if type == "MANAGED":
+                    kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, kms_key_id)
+                    if kms_key_alias:
+                        self.hcl.add_additional_data(
+                            resource_type, id, "kms_key_alias",  kms_key_alias)
+
+            performance_insights_kms_key_id = instance.get(
+                "PerformanceInsightsKMSKeyId")
+            if performance_insights_kms_key_id:
+                type = self.kms_instance.aws_kms_key(
+                    performance_insights_kms_key_id, ftstack)
+                if type == "MANAGED":
+                    kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, 
+                        performance_insights_kms_key_id)
+                    if kms_key_alias:
+                        self.hcl.add_additional_data(
+                            resource_type, id, "performance_insights_kms_key_alias",  kms_key_alias)
 
     def aws_db_option_group(self, option_group_name, ftstack):
         resource_type = "aws_db_option_group"
@@ -261,7 +188,7 @@ class RDS:
                     "option_group_description": option_group["OptionGroupDescription"],
                 }
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, option_group)
                 self.hcl.add_stack(resource_type, id, ftstack)
 
     def aws_db_parameter_group(self, parameter_group_name, ftstack):
@@ -288,9 +215,16 @@ class RDS:
                     "description": parameter_group["Description"],
                 }
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, self.parameter_group_payload(parameter_group))
                 self.hcl.add_stack(resource_type, id, ftstack)
 
+    def parameter_group_payload(self, parameter_group):
+        """The parameter group and the parameters set on it, None if they cannot be listed."""
+        parameters = paginated_state_payload(
+            self.provider_instance.aws_clients.rds_client.get_paginator("describe_db_parameters"),
+            "Parameters", DBParameterGroupName=parameter_group["DBParameterGroupName"], Source="user")
+        return combined_state_payload(group=parameter_group, parameters=parameters)
+
     def aws_db_subnet_group(self, db_subnet_group_name, ftstack):
         resource_type = "aws_db_subnet_group"
         logger.debug(f"Processing DB Subnet Groups {db_subnet_group_name}")
@@ -312,7 +246,7 @@ class RDS:
                     self.hcl.add_additional_data(
                         resource_type, id, "subnet_names",  subnet_names)
 
-                vpc_id, vpc_name = self.get_vpc_name_by_subnet(subnet_ids)
+                vpc_id, vpc_name = get_vpc_name_by_subnet(self.provider_instance.aws_clients, subnet_ids)
                 if vpc_id:
                     self.hcl.add_additional_data(
                         resource_type, id, "vpc_id",  vpc_id)
@@ -333,7 +267,7 @@ class RDS:
                     "id": id,
                 }
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, db_subnet_group)
                 self.hcl.add_stack(resource_type, id, ftstack)
 
     def aws_db_instance_automated_backups_replication(self, source_instance_arn, ftstack):
@@ -368,7 +302,7 @@ class RDS:
                                     "id": automated_backup_arn,
                                 }
                                 self.hcl.process_resource(
-                                    resource_type, id, attributes)
+                                    resource_type, id, attributes, backup)
                                 self.hcl.add_stack(resource_type, id, ftstack)
 
                                 kms_key_id = backup.get("KmsKeyId")
@@ -376,7 +310,7 @@ class RDS:
                                     type = self.kms_instance.aws_kms_key(
                                         kms_key_id, ftstack)
                                     if type == "MANAGED":
-                                        kms_key_alias = self.get_kms_alias(
+                                        kms_key_alias = get_kms_alias(self.provider_instance.aws_clients, 
                                             kms_key_id)
                                         if kms_key_alias:
                                             self.hcl.add_additional_data(
@@ -1,7 +1,7 @@
 from ...utils.hcl import HCL
 from botocore.exceptions import ClientError
-from botocore.exceptions import ClientError
 from ...providers.aws.iam_role import IAM
+from ...utils.parallel import for_each
 import logging
 import inspect
 
@@ -28,6 +28,20 @@ class S3:
 
         self.iam_role_instance = IAM(self.provider_instance, self.hcl)
 
+    def get_bucket_tags(self, bucket_name):
+        tags = self.provider_instance.tag_index.tags_by_id(
+            "s3", "", bucket_name)
+        if tags is not None:
+            return tags
+        try:
+            tag_set = self.provider_instance.aws_clients.s3_client.get_bucket_tagging(
+                Bucket=bucket_name)['TagSet']
+            return {tag['Key']: tag['Value'] for tag in tag_set}
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchTagSet':
+                return {}
+            raise e
+
     def s3(self):
         self.hcl.prepare_folder()
         self.aws_s3_bucket()
@@ -67,38 +81,28 @@ class S3:
         response = self.provider_instance.aws_clients.s3_client.list_buckets()
         all_buckets = response["Buckets"]
 
-        filtered_buckets = []
-        for bucket in all_buckets:
-            bucket_name = bucket["Name"]
+        def fetch_tags(bucket):
             try:
-                # Attempt to fetch tags for each bucket
-                tag_set = self.provider_instance.aws_clients.s3_client.get_bucket_tagging(
-                    Bucket=bucket_name)['TagSet']
-                bucket_tags = {tag['Key']: tag['Value'] for tag in tag_set}
+                return self.get_bucket_tags(bucket["Name"])
             except ClientError as e:
-                if e.response['Error']['Code'] == 'NoSuchTagSet':
-                    bucket_tags = {}
-                elif e.response['Error']['Code'] in ['AccessDenied', 'NoSuchBucket']:
+                if e.response['Error']['Code'] in ['AccessDenied', 'NoSuchBucket']:
                     # Skip buckets that cannot be accessed or don't exist
-                    continue
-                else:
-                    raise e  # Re-raise if it's a different kind of error
-
-            # Check if bucket matches all filter conditions
-            match_all_conditions = all(
-                any(bucket_tags.get(f['Name'].replace(
-                    'tag:', ''), '') == value for value in f['Values'])
-                for f in self.provider_instance.filters
-            ) if self.provider_instance.filters else True
+                    return None
+                raise e  # Re-raise if it's a different kind of error
 
-            if match_all_conditions:
-                filtered_buckets.append(bucket)
+        # Bucket name first, then tags (index or per bucket) of the remaining ones
+        filtered_buckets = [bucket for bucket, _ in self.provider_instance.resource_filter.select(
+            all_buckets,
+            name=lambda bucket: bucket["Name"],
+            arn=lambda bucket: f"arn:aws:s3:::{bucket['Name']}",
+            tag_index=self.provider_instance.tag_index,
+            fetch_tags=fetch_tags)]
 
         if len(filtered_buckets) > 0:
             self.task = self.provider_instance.progress.add_task(
                 f"[cyan]Processing {self.__class__.__name__}...", total=len(filtered_buckets))
 
-        for bucket in filtered_buckets:
+        def process_bucket(bucket):
             bucket_name = bucket["Name"]
             self.provider_instance.progress.update(
                 self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{bucket_name}[/]")
@@ -115,6 +119,8 @@ class S3:
                 # logger.error(f"Access Denied: {e.response['Error']['Message']}")
                 pass
 
+        for_each(process_bucket, filtered_buckets)
+
     def process_single_s3_bucket(self, bucket_name, ftstack=None):
         logger.debug(f"Processing S3 Bucket: {bucket_name}")
         resource_type = "aws_s3_bucket"
@@ -140,20 +146,9 @@ class S3:
         # Describe the bucket and get the tags
         if not ftstack:
             ftstack = "s3"
-            try:
-                response = self.provider_instance.aws_clients.s3_client.get_bucket_tagging(
-                    Bucket=bucket_name)
-                tags = response.get('TagSet', {})
-                for tag in tags:
-                    if tag['Key'] == 'ftstack':
-                        if tag['Value'] != 's3':
-                            ftstack = "stack_" + tag['Value']
-                        break
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'NoSuchTagSet':
-                    pass
-                else:
-                    raise e
+            tags = self.get_bucket_tags(bucket_name)
+            if tags.get('ftstack', 's3') != 's3':
+                ftstack = "stack_" + tags['ftstack']
 
         id = bucket_name
 
@@ -162,7 +157,7 @@ class S3:
             "bucket": bucket_name,
         }
 
-        self.hcl.process_resource(resource_type, bucket_name, attributes)
+        self.hcl.process_resource(resource_type, bucket_name, attributes, self.bucket_payload(bucket_name))
         self.hcl.add_stack(resource_type, id, ftstack)
 
         # Add calls to various aws_s3_bucket_* functions
@@ -188,6 +183,28 @@ class S3:
         self.aws_s3_bucket_versioning(bucket_name)
         self.aws_s3_bucket_website_configuration(bucket_name)
 
+    def bucket_payload(self, bucket_name):
+        """
+        The bucket configurations the refreshed state of a bucket is read
+        from, the error code in place of the ones that are not set.
+        """
+        s3_client = self.provider_instance.aws_clients.s3_client
+        describes = [s3_client.get_bucket_acl, s3_client.get_bucket_cors, s3_client.get_bucket_website,
+                     s3_client.get_bucket_versioning, s3_client.get_bucket_request_payment,
+                     s3_client.get_bucket_logging, s3_client.get_bucket_lifecycle_configuration,
+                     s3_client.get_bucket_replication, s3_client.get_bucket_encryption,
+                     s3_client.get_object_lock_configuration, s3_client.get_bucket_policy,
+                     s3_client.get_bucket_tagging]
+        if "gov" not in self.provider_instance.region:
+            describes.append(s3_client.get_bucket_accelerate_configuration)
+        payload = {}
+        for describe in describes:
+            try:
+                payload[describe.__name__] = describe(Bucket=bucket_name)
+            except ClientError as e:
+                payload[describe.__name__] = e.response["Error"]["Code"]
+        return payload
+
     def aws_s3_bucket_accelerate_configuration(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Accelerate Configurations...")
 
@@ -206,7 +223,7 @@ class S3:
                 }
 
                 self.hcl.process_resource(
-                    "aws_s3_bucket_accelerate_configuration", bucket_name, attributes)
+                    "aws_s3_bucket_accelerate_configuration", bucket_name, attributes, accelerate_config)
             else:
                 logger.debug(
                     f"  No Accelerate Configuration found for S3 Bucket: {bucket_name}")
@@ -256,7 +273,7 @@ class S3:
                 # "acl": acl["Grants"],
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_acl", bucket_name, attributes)
+                "aws_s3_bucket_acl", bucket_name, attributes, {"acl": acl, "object_ownership": object_ownership})
 
     def aws_s3_bucket_analytics_configuration(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Analytics Configurations...")
@@ -282,7 +299,7 @@ class S3:
             self.hcl.process_resource(
                 "aws_s3_bucket_analytics_configuration", f"{bucket_name}-{config_id}".replace(
                     "-", "_"),
-                attributes
+                attributes, config
             )
 
     def aws_s3_bucket_cors_configuration(self, bucket_name):
@@ -300,7 +317,7 @@ class S3:
                 "rule": cors["CORSRules"],
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_cors_configuration", bucket_name, attributes)
+                "aws_s3_bucket_cors_configuration", bucket_name, attributes, cors)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchCORSConfiguration":
                 logger.debug(
@@ -332,7 +349,7 @@ class S3:
                 # "tierings": config["Tierings"],
             }
             self.hcl.process_resource("aws_s3_bucket_intelligent_tiering_configuration",
-                                      f"{bucket_name}-{config_id}".replace("-", "_"), attributes)
+                                      f"{bucket_name}-{config_id}".replace("-", "_"), attributes, config)
 
     def aws_s3_bucket_inventory(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Inventories...")
@@ -359,7 +376,7 @@ class S3:
                 # "filter": config["Filter"] if "Filter" in config else None,
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_inventory", f"{bucket_name}-{config_id}".replace("-", "_"), attributes)
+                "aws_s3_bucket_inventory", f"{bucket_name}-{config_id}".replace("-", "_"), attributes, config)
 
     def aws_s3_bucket_lifecycle_configuration(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Lifecycle Configurations...")
@@ -374,7 +391,7 @@ class S3:
                 "rule": lifecycle["Rules"],
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_lifecycle_configuration", bucket_name, attributes)
+                "aws_s3_bucket_lifecycle_configuration", bucket_name, attributes, lifecycle)
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchLifecycleConfiguration':
                 logger.debug(
@@ -397,7 +414,7 @@ class S3:
                 "target_prefix": target_prefix,
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_logging", bucket_name, attributes)
+                "aws_s3_bucket_logging", bucket_name, attributes, logging)
 
     def aws_s3_bucket_metric(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Metrics...")
@@ -416,7 +433,7 @@ class S3:
                 "filter": metric["Filter"] if "Filter" in metric else None,
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_metric", f"{bucket_name}-{metric_id}".replace("-", "_"), attributes)
+                "aws_s3_bucket_metric", f"{bucket_name}-{metric_id}".replace("-", "_"), attributes, metric)
 
     def aws_s3_bucket_notification(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Notifications...")
@@ -432,7 +449,7 @@ class S3:
                     "notification_configuration": {event: notifications[event]},
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_notification", bucket_name, attributes)
+                    "aws_s3_bucket_notification", bucket_name, attributes, notifications)
 
     def aws_s3_bucket_object(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Objects...")
@@ -448,7 +465,7 @@ class S3:
                 "key": key,
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_object", f"{bucket_name}-{key}".replace("-", "_"), attributes)
+                "aws_s3_bucket_object", f"{bucket_name}-{key}".replace("-", "_"), attributes, obj)
 
     def aws_s3_bucket_object_lock_configuration(self, bucket_name):
         logger.debug(f"Processing S3 Bucket Object Lock Configurations...")
@@ -466,7 +483,7 @@ class S3:
                     "object_lock_configuration": config,
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_object_lock_configuration", bucket_name, attributes)
+                    "aws_s3_bucket_object_lock_configuration", bucket_name, attributes, config)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] != "ObjectLockConfigurationNotFoundError":
                 raise
@@ -489,7 +506,7 @@ class S3:
                     "ownership_controls": controls,
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_ownership_controls", bucket_name, attributes)
+                    "aws_s3_bucket_ownership_controls", bucket_name, attributes, controls)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] != "OwnershipControlsNotFoundError":
                 raise
@@ -511,7 +528,7 @@ class S3:
                     "policy": policy,
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_policy", bucket_name, attributes)
+                    "aws_s3_bucket_policy", bucket_name, attributes, policy)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] != "NoSuchBucketPolicy":
                 raise
@@ -535,7 +552,7 @@ class S3:
                     "restrict_public_buckets": block_config["RestrictPublicBuckets"],
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_public_access_block", bucket_name, attributes)
+                    "aws_s3_bucket_public_access_block", bucket_name, attributes, block_config)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] != "NoSuchPublicAccessBlockConfiguration":
                 raise
@@ -558,7 +575,7 @@ class S3:
                     "replication_configuration": config,
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_replication_configuration", bucket_name, attributes)
+                    "aws_s3_bucket_replication_configuration", bucket_name, attributes, config)
 
                 role = config.get("Role")
                 if role:
@@ -584,7 +601,7 @@ class S3:
                     "payer": config,
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_request_payment_configuration", bucket_name, attributes)
+                    "aws_s3_bucket_request_payment_configuration", bucket_name, attributes, config)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] != "NoSuchRequestPaymentConfiguration":
                 raise
@@ -606,7 +623,7 @@ class S3:
                     "server_side_encryption_configuration": config,
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_server_side_encryption_configuration", bucket_name, attributes)
+                    "aws_s3_bucket_server_side_encryption_configuration", bucket_name, attributes, config)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] != "ServerSideEncryptionConfigurationNotFoundError":
                 raise
@@ -629,7 +646,7 @@ class S3:
                     "status": config,
                 }
                 self.hcl.process_resource(
-                    "aws_s3_bucket_versioning", bucket_name, attributes)
+                    "aws_s3_bucket_versioning", bucket_name, attributes, versioning_configuration)
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] != "NoSuchVersioningConfiguration":
                 raise
@@ -647,7 +664,7 @@ class S3:
                 "id": bucket_name,
             }
             self.hcl.process_resource(
-                "aws_s3_bucket_website_configuration", bucket_name, attributes)
+                "aws_s3_bucket_website_configuration", bucket_name, attributes, website_config)
 
         except self.provider_instance.aws_clients.s3_client.exceptions.ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchWebsiteConfiguration":
@@ -1,10 +1,43 @@
 from ...utils.hcl import HCL
+from ...utils.native_state import native_builder, tags_dict
+from ...providers.aws.utils import get_vpc_name
 import logging
 import inspect
 
 logger = logging.getLogger('finisterra')
 
 
+@native_builder("aws_vpc_security_group_ingress_rule")
+@native_builder("aws_vpc_security_group_egress_rule")
+def security_group_rule_state(attributes, payload):
+    # payload is the DescribeSecurityGroupRules rule plus the run's region and account
+    rule, account_id = payload["rule"], payload["account_id"]
+    referenced_security_group_id = None
+    if 'ReferencedGroupInfo' in rule:
+        referenced = rule['ReferencedGroupInfo']
+        referenced_security_group_id = referenced['GroupId']
+        if referenced.get('UserId', account_id) != account_id:
+            referenced_security_group_id = f"{referenced['UserId']}/{referenced['GroupId']}"
+    # All protocols have no ports
+    all_protocols = rule['IpProtocol'] == "-1"
+    tags = tags_dict(rule.get('Tags'))
+    return {
+        "arn": f"arn:aws:ec2:{payload['region']}:{account_id}:security-group-rule/{rule['SecurityGroupRuleId']}",
+        "cidr_ipv4": rule.get('CidrIpv4'),
+        "cidr_ipv6": rule.get('CidrIpv6'),
+        "description": rule.get('Description'),
+        "from_port": None if all_protocols else rule.get('FromPort'),
+        "ip_protocol": rule['IpProtocol'],
+        "prefix_list_id": rule.get('PrefixListId'),
+        "referenced_security_group_id": referenced_security_group_id,
+        "security_group_id": rule['GroupId'],
+        "security_group_rule_id": rule['SecurityGroupRuleId'],
+        "tags": tags,
+        "tags_all": tags,
+        "to_port": None if all_protocols else rule.get('ToPort'),
+    }
+
+
 class SECURITY_GROUP:
     def __init__(self, provider_instance, hcl=None):
         self.provider_instance=provider_instance
@@ -24,19 +57,6 @@ class SECURITY_GROUP:
         self.hcl.account_name = self.provider_instance.account_name
 
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        # Check if 'Tags' key exists and if it has any tags
-        if 'Tags' in response['Vpcs'][0] and response['Vpcs'][0]['Tags']:
-            vpc_name = next(
-                (tag['Value'] for tag in response['Vpcs'][0]['Tags'] if tag['Key'] == 'Name'), None)
-        else:
-            # If 'Tags' key doesn't exist or is empty, set vpc_name to None or a default value
-            vpc_name = None
-
-        return vpc_name
-
     def security_group(self):
         self.hcl.prepare_folder()
 
@@ -67,23 +87,21 @@ class SECURITY_GROUP:
                     f"  Skipping Security Group: {security_group_id} - already processed")
                 return
 
-            try:
-                response = self.provider_instance.aws_clients.ec2_client.describe_security_groups(GroupIds=[
-                                                                                security_group_id])
-                for security_group in response["SecurityGroups"]:
-                    self.process_security_group(security_group, ftstack)
-                    return security_group["GroupName"]
-            except Exception as e:
+            security_group = self.provider_instance.network_inventory.security_group(
+                security_group_id)
+            if not security_group:
                 logger.error(
-                    f"Error fetching Security Group {security_group_id}: {e}")
-            return
+                    f"Error fetching Security Group {security_group_id}: not found")
+                return
+            self.process_security_group(security_group, ftstack)
+            return security_group["GroupName"]
 
         logger.debug("Processing Security Groups...")
-        response = self.provider_instance.aws_clients.ec2_client.describe_security_groups()
-        if len(response["SecurityGroups"]) > 0:
+        security_groups = self.provider_instance.network_inventory.security_groups()
+        if len(security_groups) > 0:
             self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=len(response["SecurityGroups"]))
-        for security_group in response["SecurityGroups"]:
+                f"[cyan]Processing {self.__class__.__name__}...", total=len(security_groups))
+        for security_group in security_groups:
             self.process_security_group(security_group, ftstack)
             self.provider_instance.progress.update(
                 self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{security_group['GroupName']}[/]")
@@ -117,12 +135,12 @@ class SECURITY_GROUP:
         }
 
         self.hcl.process_resource(
-            resource_type, security_group["GroupId"].replace("-", "_"), attributes)
+            resource_type, security_group["GroupId"].replace("-", "_"), attributes, security_group)
         if not ftstack:
             ftstack = "security_group"
         self.hcl.add_stack(resource_type, id, ftstack)
 
-        vpc_name = self.get_vpc_name(vpc_id)
+        vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
         if vpc_name:
             self.hcl.add_additional_data(
                 resource_type, id, "vpc_name", vpc_name)
@@ -132,14 +150,20 @@ class SECURITY_GROUP:
         self.aws_vpc_security_group_egress_rule(
             security_group["GroupId"], ftstack)
 
+    def rule_payload(self, rule):
+        return {
+            "rule": rule,
+            "region": self.provider_instance.region,
+            "account_id": self.provider_instance.aws_account_id,
+        }
+
     def aws_vpc_security_group_ingress_rule(self, security_group_id, ftstack=None):
         # Fetch security group rules
-        response = self.provider_instance.aws_clients.ec2_client.describe_security_group_rules(
-            Filters=[{'Name': 'group-id', 'Values': [security_group_id]}]
-        )
+        rules = self.provider_instance.network_inventory.security_group_rules(
+            security_group_id)
 
         # Process each ingress rule
-        for rule in response.get('SecurityGroupRules', []):
+        for rule in rules:
             # Filter for ingress rules
             if not rule.get('IsEgress', False):
                 rule_id = rule['SecurityGroupRuleId']
@@ -152,7 +176,7 @@ class SECURITY_GROUP:
 
                 # Process the rule as needed, e.g., storing attributes or creating resources
                 self.hcl.process_resource(
-                    "aws_vpc_security_group_ingress_rule", rule_id, attributes)
+                    "aws_vpc_security_group_ingress_rule", rule_id, attributes, self.rule_payload(rule))
 
                 if 'ReferencedGroupInfo' in rule:
                     referenced_security_group_id = rule['ReferencedGroupInfo']['GroupId']
@@ -161,12 +185,11 @@ class SECURITY_GROUP:
 
     def aws_vpc_security_group_egress_rule(self, security_group_id, ftstack=None):
         # Fetch security group rules
-        response = self.provider_instance.aws_clients.ec2_client.describe_security_group_rules(
-            Filters=[{'Name': 'group-id', 'Values': [security_group_id]}]
-        )
+        rules = self.provider_instance.network_inventory.security_group_rules(
+            security_group_id)
 
         # Process each egress rule
-        for rule in response.get('SecurityGroupRules', []):
+        for rule in rules:
             # Filter for egress rules
             if rule.get('IsEgress', True):
                 rule_id = rule['SecurityGroupRuleId']
@@ -179,7 +202,7 @@ class SECURITY_GROUP:
 
                 # Process the rule as needed, e.g., storing attributes or creating resources
                 self.hcl.process_resource(
-                    "aws_vpc_security_group_egress_rule", rule_id, attributes)
+                    "aws_vpc_security_group_egress_rule", rule_id, attributes, self.rule_payload(rule))
 
                 if 'ReferencedGroupInfo' in rule:
                     referenced_security_group_id = rule['ReferencedGroupInfo']['GroupId']
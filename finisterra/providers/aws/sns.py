@@ -1,4 +1,5 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import paginate_with_progress, stream_pages, state_payload
 import logging
 import inspect
 
@@ -59,7 +60,7 @@ class SNS:
                     "name": name,
                 }
                 self.hcl.process_resource(
-                    "aws_sns_platform_application", name.replace("-", "_"), attributes)
+                    "aws_sns_platform_application", name.replace("-", "_"), attributes, platform_application)
 
     def aws_sns_sms_preferences(self):
         logger.debug("Processing SNS SMS Preferences...")
@@ -70,7 +71,7 @@ class SNS:
             attributes = {key: value for key, value in preferences.items()}
 
             self.hcl.process_resource(
-                "aws_sns_sms_preferences", "sns_sms_preferences", attributes)
+                "aws_sns_sms_preferences", "sns_sms_preferences", attributes, preferences)
         except Exception as e:
             logger.error(f"Error retrieving SNS SMS Preferences: {str(e)}")
 
@@ -79,49 +80,49 @@ class SNS:
         logger.debug("Processing SNS Topics...")
 
         paginator = self.provider_instance.aws_clients.sns_client.get_paginator("list_topics")
-        total = 0
-        for page in paginator.paginate():
-            total += len(page.get("Topics", []))
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for topic in page.get("Topics", []):
-                arn = topic["TopicArn"]
-                name = arn.split(":")[-1]
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{name}[/]")
-
-                # if name != 'xxxxx':
-                #     continue
-
-                logger.debug(f"Processing SNS Topic: {name}")
-                id = arn
-
-                ftstack = "sns"
-                try:
-                    tags_response = self.provider_instance.aws_clients.sns_client.list_tags_for_resource(
-                        ResourceArn=arn)
-                    tags = tags_response.get('Tags', [])
-                    for tag in tags:
-                        if tag['Key'] == 'ftstack':
-                            if tag['Value'] != 'sns':
-                                ftstack = "stack_"+tag['Value']
-                            break
-                except Exception as e:
-                    logger.error("Error occurred: ", e)
+        for topic in paginate_with_progress(self, stream_pages(paginator), "Topics"):
+            arn = topic["TopicArn"]
+            name = arn.split(":")[-1]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{name}[/]")
+
+            # if name != 'xxxxx':
+            #     continue
+
+            logger.debug(f"Processing SNS Topic: {name}")
+            id = arn
+
+            ftstack = "sns"
+            tags = []
+            try:
+                tags_response = self.provider_instance.aws_clients.sns_client.list_tags_for_resource(
+                    ResourceArn=arn)
+                tags = tags_response.get('Tags', [])
+                for tag in tags:
+                    if tag['Key'] == 'ftstack':
+                        if tag['Value'] != 'sns':
+                            ftstack = "stack_"+tag['Value']
+                        break
+            except Exception as e:
+                logger.error("Error occurred: ", e)
+
+            attributes = {
+                "id": id,
+                "name": name,
+            }
+            self.hcl.process_resource(
+                resource_type, id, attributes, self.topic_payload(arn, tags))
+            self.hcl.add_stack(resource_type, id, ftstack)
 
-                attributes = {
-                    "id": id,
-                    "name": name,
-                }
-                self.hcl.process_resource(
-                    resource_type, id, attributes)
-                self.hcl.add_stack(resource_type, id, ftstack)
+            self.aws_sns_topic_policy(arn)
+            self.aws_sns_topic_data_protection_policy(arn)
+            self.aws_sns_topic_subscription(arn)
 
-                self.aws_sns_topic_policy(arn)
-                self.aws_sns_topic_data_protection_policy(arn)
-                self.aws_sns_topic_subscription(arn)
+    def topic_payload(self, arn, tags):
+        """What the refreshed state of a topic is read from."""
+        attributes = state_payload(
+            self.provider_instance.aws_clients.sns_client.get_topic_attributes, "Attributes", TopicArn=arn)
+        return {"attributes": attributes, "tags": tags} if attributes is not None else None
 
     def aws_sns_topic_policy(self, arn):
         logger.debug("Processing SNS Topic Policies...")
@@ -138,7 +139,7 @@ class SNS:
                     "policy": policy,
                 }
                 self.hcl.process_resource(
-                    "aws_sns_topic_policy", f"{name}_policy".replace("-", "_"), attributes)
+                    "aws_sns_topic_policy", f"{name}_policy".replace("-", "_"), attributes, policy)
         except Exception as e:
             logger.error(
                 f"Error retrieving SNS Topic Policy for {name}: {str(e)}")
@@ -158,7 +159,7 @@ class SNS:
                     "data_protection_policy": policy,
                 }
                 self.hcl.process_resource(
-                    "aws_sns_topic_data_protection_policy", f"{name}_data_protection_policy".replace("-", "_"), attributes)
+                    "aws_sns_topic_data_protection_policy", f"{name}_data_protection_policy".replace("-", "_"), attributes, policy)
         except Exception as e:
             logger.error(
                 f"Error retrieving SNS Topic Data Protection Policy for {name}: {str(e)}")
@@ -190,4 +191,6 @@ class SNS:
                         attributes["filter_policy"] = subscription["FilterPolicy"]
 
                     self.hcl.process_resource(
-                        "aws_sns_topic_subscription", name.replace("-", "_"), attributes)
+                        "aws_sns_topic_subscription", name.replace("-", "_"), attributes,
+                        state_payload(self.provider_instance.aws_clients.sns_client.get_subscription_attributes,
+                                      "Attributes", SubscriptionArn=arn))
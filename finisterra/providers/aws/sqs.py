@@ -1,4 +1,6 @@
 from ...utils.hcl import HCL
+from ...utils.native_state import native_builder
+from ...providers.aws.utils import paginate_with_progress, stream_pages
 import json
 import logging
 import inspect
@@ -6,6 +8,37 @@ import inspect
 logger = logging.getLogger('finisterra')
 
 
+@native_builder("aws_sqs_queue")
+def queue_state(attributes, payload):
+    # payload holds the queue url, its GetQueueAttributes (All) and tags
+    queue_attributes, tags = payload["attributes"], payload["tags"]
+    if tags is None:
+        return None
+    return {
+        "arn": queue_attributes["QueueArn"],
+        "content_based_deduplication": queue_attributes.get("ContentBasedDeduplication") == "true",
+        "deduplication_scope": queue_attributes.get("DeduplicationScope", ""),
+        "delay_seconds": int(queue_attributes["DelaySeconds"]),
+        "fifo_queue": queue_attributes.get("FifoQueue") == "true",
+        "fifo_throughput_limit": queue_attributes.get("FifoThroughputLimit", ""),
+        "kms_data_key_reuse_period_seconds": int(queue_attributes.get("KmsDataKeyReusePeriodSeconds", 300)),
+        "kms_master_key_id": queue_attributes.get("KmsMasterKeyId", ""),
+        "max_message_size": int(queue_attributes["MaximumMessageSize"]),
+        "message_retention_seconds": int(queue_attributes["MessageRetentionPeriod"]),
+        "name": payload["url"].split("/")[-1],
+        "name_prefix": "",
+        "policy": queue_attributes.get("Policy", ""),
+        "receive_wait_time_seconds": int(queue_attributes["ReceiveMessageWaitTimeSeconds"]),
+        "redrive_allow_policy": queue_attributes.get("RedriveAllowPolicy", ""),
+        "redrive_policy": queue_attributes.get("RedrivePolicy", ""),
+        "sqs_managed_sse_enabled": queue_attributes.get("SqsManagedSseEnabled") == "true",
+        "tags": tags,
+        "tags_all": tags,
+        "url": payload["url"],
+        "visibility_timeout_seconds": int(queue_attributes["VisibilityTimeout"]),
+    }
+
+
 class SQS:
     def __init__(self, provider_instance, hcl=None):
         self.provider_instance = provider_instance
@@ -50,73 +83,73 @@ class SQS:
 
         paginator = self.provider_instance.aws_clients.sqs_client.get_paginator(
             "list_queues")
-        total = 0
-        for page in paginator.paginate():
-            total += len(page.get("QueueUrls", []))
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for queue_url in page.get("QueueUrls", []):
-                queue_name = queue_url.split("/")[-1]
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{queue_name}[/]")
+        for queue_url in paginate_with_progress(self, stream_pages(paginator), "QueueUrls"):
+            queue_name = queue_url.split("/")[-1]
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{queue_name}[/]")
 
-                # if queue_name != 'xxxxx':
-                #     continue
+            # if queue_name != 'xxxxx':
+            #     continue
 
-                logger.debug(f"Processing SQS Queue: {queue_name}")
-                id = queue_url
+            logger.debug(f"Processing SQS Queue: {queue_name}")
+            id = queue_url
 
-                fstack = "sqs"
-                try:
+            fstack = "sqs"
+            tags = None
+            try:
+                tags = self.provider_instance.tag_index.tags_by_id(
+                    "sqs", "", queue_name)
+                if tags is None:
                     tags_response = self.provider_instance.aws_clients.sqs_client.list_queue_tags(
                         QueueUrl=queue_url)
                     tags = tags_response.get('Tags', {})
-                    if tags.get('ftstack', 'sqs') != 'sqs':
-                        fstack = "stack_"+tags.get('ftstack', 'sqs')
-                except Exception as e:
-                    logger.error("Error occurred: ", e)
-
-                attributes = {
-                    "id": id,
-                }
-                self.hcl.process_resource(
-                    resource_type, id, attributes)
-                self.hcl.add_stack(resource_type, id, fstack)
-
-                # Call aws_sqs_queue_policy with the queue_url as an argument
-                self.aws_sqs_queue_policy(queue_url)
-
-                # Get the redrive policy for the queue
-                response = self.provider_instance.aws_clients.sqs_client.get_queue_attributes(
-                    QueueUrl=queue_url,
-                    AttributeNames=['RedrivePolicy']
-                )
-
-                # If a RedrivePolicy exists, extract and add the DLQ ARN to dlq_list
-                if 'Attributes' in response and 'RedrivePolicy' in response['Attributes']:
-                    redrive_policy = json.loads(
-                        response['Attributes']['RedrivePolicy'])
-                    if 'deadLetterTargetArn' in redrive_policy:
-                        # get the url of the DLQ by the arn
-                        deadLetterTargetArn = redrive_policy['deadLetterTargetArn'].split(
-                            ":")[-1]
-                        try:
-                            dlq_url = self.provider_instance.aws_clients.sqs_client.get_queue_url(
-                                QueueName=redrive_policy['deadLetterTargetArn'].split(":")[-1])
-                            self.hcl.add_additional_data(
-                                resource_type, dlq_url['QueueUrl'], "parent_url", queue_url)
-                            self.hcl.add_additional_data(
-                                resource_type, dlq_url['QueueUrl'], "is_dlq", True)
-                        except Exception as e:
-                            logger.error("Error occurred: ", e)
-                            continue
-
-                # Call aws_sqs_queue_redrive_policy with the queue_url as an argument
-                self.aws_sqs_queue_redrive_policy(queue_url)
-                self.aws_sqs_queue_redrive_allow_policy(queue_url)
+                if tags.get('ftstack', 'sqs') != 'sqs':
+                    fstack = "stack_"+tags.get('ftstack', 'sqs')
+            except Exception as e:
+                logger.error("Error occurred: ", e)
+
+            # All the attributes, for the queue state and its redrive policy
+            response = self.provider_instance.aws_clients.sqs_client.get_queue_attributes(
+                QueueUrl=queue_url,
+                AttributeNames=['All']
+            )
+
+            attributes = {
+                "id": id,
+            }
+            self.hcl.process_resource(
+                resource_type, id, attributes, {
+                    "url": queue_url,
+                    "attributes": response.get('Attributes', {}),
+                    "tags": tags,
+                })
+            self.hcl.add_stack(resource_type, id, fstack)
+
+            # Call aws_sqs_queue_policy with the queue_url as an argument
+            self.aws_sqs_queue_policy(queue_url)
+
+            # If a RedrivePolicy exists, extract and add the DLQ ARN to dlq_list
+            if 'Attributes' in response and 'RedrivePolicy' in response['Attributes']:
+                redrive_policy = json.loads(
+                    response['Attributes']['RedrivePolicy'])
+                if 'deadLetterTargetArn' in redrive_policy:
+                    # get the url of the DLQ by the arn
+                    deadLetterTargetArn = redrive_policy['deadLetterTargetArn'].split(
+                        ":")[-1]
+                    try:
+                        dlq_url = self.provider_instance.aws_clients.sqs_client.get_queue_url(
+                            QueueName=redrive_policy['deadLetterTargetArn'].split(":")[-1])
+                        self.hcl.add_additional_data(
+                            resource_type, dlq_url['QueueUrl'], "parent_url", queue_url)
+                        self.hcl.add_additional_data(
+                            resource_type, dlq_url['QueueUrl'], "is_dlq", True)
+                    except Exception as e:
+                        logger.error("Error occurred: ", e)
+                        continue
+
+            # Call aws_sqs_queue_redrive_policy with the queue_url as an argument
+            self.aws_sqs_queue_redrive_policy(queue_url)
+            self.aws_sqs_queue_redrive_allow_policy(queue_url)
 
     def aws_sqs_queue_policy(self, queue_url):
         logger.debug("Processing SQS Queue Policies...")
@@ -135,7 +168,7 @@ class SQS:
                 "policy": policy,
             }
             self.hcl.process_resource(
-                "aws_sqs_queue_policy", queue_name.replace("-", "_"), attributes)
+                "aws_sqs_queue_policy", queue_name.replace("-", "_"), attributes, policy)
         else:
             logger.debug(f"  No policy found for SQS Queue: {queue_name}")
 
@@ -159,7 +192,7 @@ class SQS:
                 "redrive_policy": redrive_policy,
             }
             self.hcl.process_resource(
-                "aws_sqs_queue_redrive_policy", queue_name.replace("-", "_"), attributes)
+                "aws_sqs_queue_redrive_policy", queue_name.replace("-", "_"), attributes, redrive_policy)
         else:
             logger.debug(
                 f"  No redrive policy found for SQS Queue: {queue_name}")
@@ -185,7 +218,7 @@ class SQS:
                 "redrive_allow_policy": redrive_allow_policy,
             }
             self.hcl.process_resource(
-                "aws_sqs_queue_redrive_allow_policy", queue_name.replace("-", "_"), attributes)
+                "aws_sqs_queue_redrive_allow_policy", queue_name.replace("-", "_"), attributes, redrive_allow_policy)
         else:
             logger.debug(
                 f"  No allow policy found for SQS Queue: {queue_name}")
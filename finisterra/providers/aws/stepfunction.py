@@ -1,4 +1,5 @@
 from ...utils.hcl import HCL
+from ...providers.aws.utils import paginate_with_progress, stream_pages
 from ...providers.aws.iam_role import IAM
 from ...providers.aws.logs import Logs
 import logging
@@ -57,74 +58,67 @@ class StepFunction:
 
         paginator = self.provider_instance.aws_clients.sfn_client.get_paginator(
             "list_state_machines")
-        total = 0
-        for page in paginator.paginate():
-            total += len(page.get("stateMachines", []))
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for page in paginator.paginate():
-            for state_machine_summary in page["stateMachines"]:
+        for state_machine_summary in paginate_with_progress(self, stream_pages(paginator), "stateMachines"):
+            logger.debug(
+                f"Processing State Machine: {state_machine_summary['name']}")
+            self.provider_instance.progress.update(
+                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{state_machine_summary['name']}[/]")
+
+            # if state_machine_summary['name'] != 'xxxxx':
+            #     continue
+
+            # Call describe_state_machine to get detailed info, including roleArn
+            state_machine = self.provider_instance.aws_clients.sfn_client.describe_state_machine(
+                stateMachineArn=state_machine_summary['stateMachineArn']
+            )
+
+            role_arn = state_machine.get('roleArn', None)
+            state_machine_arn = state_machine["stateMachineArn"]
+
+            ftstack = "stepfunction"
+            tags = []
+            try:
+                tags_response = self.provider_instance.aws_clients.sfn_client.list_tags_for_resource(
+                    resourceArn=state_machine_arn)
+                tags = tags_response.get('tags', [])
+                for tag in tags:
+                    if tag['key'] == 'ftstack':
+                        if tag['value'] != 'stepfunction':
+                            ftstack = "stack_"+tag['value']
+                        break
+            except Exception as e:
+                logger.error("Error occurred: ", e)
+
+            attributes = {
+                "id": state_machine_arn,
+                "name": state_machine["name"],
+                "definition": state_machine["definition"],
+                "role_arn": role_arn,
+            }
+
+            self.hcl.process_resource(
+                resource_type, state_machine_arn, attributes, {"state_machine": state_machine, "tags": tags})
+
+            self.hcl.add_stack(resource_type, state_machine_arn, ftstack)
+
+            # Check if roleArn exists before proceeding
+            if role_arn:
+                # Call aws_iam_role with state_machine as an argument
+                role_name = role_arn.split('/')[-1]
+                self.iam_role_instance.aws_iam_role(role_name, ftstack)
+            else:
                 logger.debug(
-                    f"Processing State Machine: {state_machine_summary['name']}")
-                self.provider_instance.progress.update(
-                    self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{state_machine_summary['name']}[/]")
-
-                # if state_machine_summary['name'] != 'xxxxx':
-                #     continue
-
-                # Call describe_state_machine to get detailed info, including roleArn
-                state_machine = self.provider_instance.aws_clients.sfn_client.describe_state_machine(
-                    stateMachineArn=state_machine_summary['stateMachineArn']
-                )
-
-                role_arn = state_machine.get('roleArn', None)
-                state_machine_arn = state_machine["stateMachineArn"]
-
-                ftstack = "stepfunction"
-                try:
-                    tags_response = self.provider_instance.aws_clients.sfn_client.list_tags_for_resource(
-                        resourceArn=state_machine_arn)
-                    tags = tags_response.get('tags', [])
-                    for tag in tags:
-                        if tag['key'] == 'ftstack':
-                            if tag['value'] != 'stepfunction':
-                                ftstack = "stack_"+tag['value']
-                            break
-                except Exception as e:
-                    logger.error("Error occurred: ", e)
-
-                attributes = {
-                    "id": state_machine_arn,
-                    "name": state_machine["name"],
-                    "definition": state_machine["definition"],
-                    "role_arn": role_arn,
-                }
-
-                self.hcl.process_resource(
-                    resource_type, state_machine_arn, attributes)
-
-                self.hcl.add_stack(resource_type, state_machine_arn, ftstack)
-
-                # Check if roleArn exists before proceeding
-                if role_arn:
-                    # Call aws_iam_role with state_machine as an argument
-                    role_name = role_arn.split('/')[-1]
-                    self.iam_role_instance.aws_iam_role(role_name, ftstack)
-                else:
-                    logger.debug(
-                        f"No IAM role associated with State Machine: {state_machine['name']}")
-
-                # Process CloudWatch Log Group
-                logging_configuration = state_machine.get(
-                    'loggingConfiguration', {})
-                if logging_configuration:
-                    destinations = logging_configuration.get(
-                        'destinations', [])
-                    for destination in destinations:
-                        if destination['cloudWatchLogsLogGroup']:
-                            logGroupArn = destination['cloudWatchLogsLogGroup']['logGroupArn']
-                            log_group = logGroupArn.split(':')[-2]
-                            self.logs_instance.aws_cloudwatch_log_group(
-                                log_group, ftstack)
+                    f"No IAM role associated with State Machine: {state_machine['name']}")
+
+            # Process CloudWatch Log Group
+            logging_configuration = state_machine.get(
+                'loggingConfiguration', {})
+            if logging_configuration:
+                destinations = logging_configuration.get(
+                    'destinations', [])
+                for destination in destinations:
+                    if destination['cloudWatchLogsLogGroup']:
+                        logGroupArn = destination['cloudWatchLogsLogGroup']['logGroupArn']
+                        log_group = logGroupArn.split(':')[-2]
+                        self.logs_instance.aws_cloudwatch_log_group(
+                            log_group, ftstack)
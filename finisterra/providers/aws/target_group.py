@@ -1,5 +1,6 @@
 from ...utils.hcl import HCL
 from ...providers.aws.acm import ACM
+from ...providers.aws.utils import get_vpc_name, state_payload, combined_state_payload
 # from ...providers.aws.elbv2 import ELBV2
 import logging
 import inspect
@@ -32,23 +33,6 @@ class TargetGroup:
         self.load_balancers = None
         self.listeners = {}
 
-    def get_vpc_name(self, vpc_id):
-        try:
-            response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[
-                                                                 vpc_id])
-            if not response or 'Vpcs' not in response or not response['Vpcs']:
-                # Handle this case as required, for example:
-                logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-                return None
-
-            vpc_tags = response['Vpcs'][0].get('Tags', [])
-            vpc_name = next((tag['Value']
-                            for tag in vpc_tags if tag['Key'] == 'Name'), None)
-            return vpc_name
-        except Exception as e:
-            logger.error(f"Error in get_vpc_name: {e}")
-            return None
-
     def target_group(self):
         self.hcl.prepare_folder()
 
@@ -118,13 +102,13 @@ class TargetGroup:
                                 ftstack = tag["Value"]
                                 break
                 self.hcl.process_resource(
-                    resource_type, id, attributes)
+                    resource_type, id, attributes, self.target_group_payload(target_group))
 
                 self.hcl.add_stack(resource_type, id, ftstack)
 
                 vpc_id = target_group["VpcId"]
                 if vpc_id:
-                    vpc_name = self.get_vpc_name(vpc_id)
+                    vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
                     if vpc_name:
                         self.hcl.add_additional_data(
                             resource_type, id, "vpc_name", vpc_name)
@@ -191,7 +175,7 @@ class TargetGroup:
                     }
 
                     self.hcl.process_resource(
-                        "aws_lb_listener_rule", rule_id, attributes)
+                        "aws_lb_listener_rule", rule_id, attributes, rule)
 
                     # get the load balancer arn from the listener arn
                     load_balancer_arn = listener['LoadBalancerArn']
@@ -200,6 +184,16 @@ class TargetGroup:
 
                     # self.aws_lb_listener(listener_arn, ftstack)
 
+    def target_group_payload(self, target_group):
+        """The target group, its attributes and tags, None if they cannot be described."""
+        elbv2_client = self.provider_instance.aws_clients.elbv2_client
+        tg_arn = target_group["TargetGroupArn"]
+        return combined_state_payload(
+            target_group=target_group,
+            attributes=state_payload(elbv2_client.describe_target_group_attributes,
+                                     "Attributes", TargetGroupArn=tg_arn),
+            tags=state_payload(elbv2_client.describe_tags, "TagDescriptions[0].Tags", ResourceArns=[tg_arn]))
+
     def aws_lb_listener(self, listener_arn, ftstack):
         logger.debug(f"Processing Load Balancer Listener: {listener_arn}")
 
@@ -208,7 +202,9 @@ class TargetGroup:
         }
 
         self.hcl.process_resource(
-            "aws_lb_listener", listener_arn.split("/")[-1], attributes)
+            "aws_lb_listener", listener_arn.split("/")[-1], attributes,
+            state_payload(self.provider_instance.aws_clients.elbv2_client.describe_listeners,
+                          "Listeners", ListenerArns=[listener_arn]))
 
         # describe the listener and get me the list of all the acm arns used in the listener
         listener = self.provider_instance.aws_clients.elbv2_client.describe_listeners(
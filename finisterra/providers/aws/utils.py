@@ -1,54 +1,345 @@
+import os
+import queue
 import logging
+import threading
+import weakref
+import jmespath
 from botocore.exceptions import ClientError
+from ...providers.aws.filters import NAME_KEY
+from ...utils.api_metrics import get_current_module, set_current_module
 
 logger = logging.getLogger('finisterra')
 
+# describe_vpcs/describe_subnets accept at most 200 values per filter
+FILTER_BATCH_SIZE = 200
 
-def get_vpc_name(aws_clients, vpc_id):
-    response = aws_clients.ec2_client.describe_vpcs(VpcIds=[
-        vpc_id])
+# Pages stream_pages fetches ahead of the code consuming them
+PAGE_PREFETCH = int(os.getenv('FT_PAGE_PREFETCH', 2))
 
-    if not response or 'Vpcs' not in response or not response['Vpcs']:
-        # Handle this case as required, for example:
-        logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-        return None
 
-    vpc_tags = response['Vpcs'][0].get('Tags', [])
-    vpc_name = next((tag['Value']
-                    for tag in vpc_tags if tag['Key'] == 'Name'), None)
+def get_name_tag(item):
+    return next((tag['Value'] for tag in item.get('Tags', []) if tag['Key'] == 'Name'), None)
 
-    if vpc_name is None:
-        logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
 
-    return vpc_name
+class NetworkIndex:
+    """
+    Run-scoped index of the account's VPCs and subnets by ID.
 
+    Each collection is loaded with one paginated describe call the first time
+    it is needed. IDs missing from it (e.g. created since) are looked up in
+    batches with an ID filter, and remembered even when they do not exist.
+    IDs whose lookup failed (e.g. access denied) resolve to None.
+    """
 
-def get_subnet_names(aws_clients, subnet_ids):
-    subnet_names = []
-    for subnet_id in subnet_ids:
+    def __init__(self, aws_clients):
+        self.aws_clients = aws_clients
+        self.vpcs = None
+        self.subnets = None
+        self.lock = threading.Lock()
+
+    def load(self, operation, key, id_key):
+        items = {}
         try:
-            response = aws_clients.ec2_client.describe_subnets(SubnetIds=[
-                subnet_id])
+            paginator = self.aws_clients.ec2_client.get_paginator(operation)
+            for page in paginator.paginate():
+                for item in page[key]:
+                    items[item[id_key]] = item
         except ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidSubnetID.NotFound':
-                logger.info(f"The subnet ID '{subnet_id}' does not exist.")
-            else:
+            logger.error(f"An unexpected error occurred: {e}")
+        return items
+
+    def fetch(self, items, operation, key, id_key, filter_name, ids):
+        missing = [id for id in dict.fromkeys(ids) if id not in items]
+        for i in range(0, len(missing), FILTER_BATCH_SIZE):
+            batch = missing[i:i + FILTER_BATCH_SIZE]
+            try:
+                response = getattr(self.aws_clients.ec2_client, operation)(
+                    Filters=[{'Name': filter_name, 'Values': batch}])
+            except ClientError as e:
                 logger.error(f"An unexpected error occurred: {e}")
-            continue
+                continue
+            for item in response.get(key, []):
+                items[item[id_key]] = item
+            for id in batch:
+                if id not in items:
+                    logger.debug(f"No information found for ID: {id}")
+                    items[id] = None
+
+    def resolve_vpcs(self, vpc_ids):
+        with self.lock:
+            if self.vpcs is None:
+                self.vpcs = self.load("describe_vpcs", "Vpcs", "VpcId")
+            self.fetch(self.vpcs, "describe_vpcs", "Vpcs",
+                       "VpcId", "vpc-id", vpc_ids)
+            return {vpc_id: self.vpcs.get(vpc_id) for vpc_id in vpc_ids}
+
+    def resolve_subnets(self, subnet_ids):
+        with self.lock:
+            if self.subnets is None:
+                self.subnets = self.load(
+                    "describe_subnets", "Subnets", "SubnetId")
+            self.fetch(self.subnets, "describe_subnets", "Subnets",
+                       "SubnetId", "subnet-id", subnet_ids)
+            return {subnet_id: self.subnets.get(subnet_id) for subnet_id in subnet_ids}
+
+    def all_vpcs(self):
+        with self.lock:
+            if self.vpcs is None:
+                self.vpcs = self.load("describe_vpcs", "Vpcs", "VpcId")
+            return [vpc for vpc in self.vpcs.values() if vpc]
+
+    def all_subnets(self):
+        with self.lock:
+            if self.subnets is None:
+                self.subnets = self.load(
+                    "describe_subnets", "Subnets", "SubnetId")
+            return [subnet for subnet in self.subnets.values() if subnet]
+
+    def vpc(self, vpc_id):
+        if not vpc_id:
+            return None
+        return self.resolve_vpcs([vpc_id])[vpc_id]
+
+    def subnet(self, subnet_id):
+        if not subnet_id:
+            return None
+        return self.resolve_subnets([subnet_id])[subnet_id]
+
+    def vpc_name(self, vpc_id):
+        vpc = self.vpc(vpc_id)
+        if not vpc:
+            return None
+        return get_name_tag(vpc)
+
+    def subnet_name(self, subnet_id):
+        subnet = self.subnet(subnet_id)
+        if not subnet:
+            return None
+        return get_name_tag(subnet)
+
+
+class KmsAliasIndex:
+    """
+    Run-scoped KeyId -> alias name index, built from one paginated
+    list_aliases sweep the first time an alias is looked up.
+    """
+
+    def __init__(self, aws_clients):
+        self.aws_clients = aws_clients
+        self.aliases = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        aliases = {}
+        try:
+            paginator = self.aws_clients.kms_client.get_paginator(
+                "list_aliases")
+            for page in paginator.paginate():
+                for alias in page.get('Aliases', []):
+                    # Keep the first alias of each key, as listed by KMS
+                    if 'TargetKeyId' in alias and alias['TargetKeyId'] not in aliases:
+                        aliases[alias['TargetKeyId']] = alias['AliasName']
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AccessDeniedException':
+                raise e
+        return aliases
+
+    def alias(self, kms_key_id):
+        if not kms_key_id:
+            return ""
+        with self.lock:
+            if self.aliases is None:
+                self.aliases = self.load()
+        return self.aliases.get(kms_key_id.split('/')[-1], "")
+
+
+class InstanceProfileIndex:
+    """
+    Run-scoped role name -> instance profiles index, built from one
+    paginated list_instance_profiles sweep the first time it is needed.
+    """
+
+    def __init__(self, aws_clients):
+        self.aws_clients = aws_clients
+        self.profiles = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        profiles = {}
+        paginator = self.aws_clients.iam_client.get_paginator(
+            "list_instance_profiles")
+        for instance_profile in paginate_items(paginator, "InstanceProfiles"):
+            for role in instance_profile["Roles"]:
+                profiles.setdefault(role["RoleName"], []).append(
+                    instance_profile)
+        return profiles
+
+    def by_role(self, role_name):
+        with self.lock:
+            if self.profiles is None:
+                self.profiles = self.load()
+        return self.profiles.get(role_name, [])
+
+
+def parse_arn(arn):
+    """
+    Splits an ARN into (service, resource type, resource id), e.g.
+    arn:aws:ec2:us-east-1:123:vpc/vpc-1 -> ("ec2", "vpc", "vpc-1") and
+    arn:aws:s3:::bucket -> ("s3", "", "bucket").
+    """
+    parts = arn.split(':', 5)
+    if len(parts) < 6:
+        return None, "", arn
+    service, resource = parts[2], parts[5].lstrip('/')
+    for separator in ('/', ':'):
+        if separator in resource:
+            resource_type, resource_id = resource.split(separator, 1)
+            return service, resource_type, resource_id
+    return service, "", resource
+
+
+class TagIndex:
+    """
+    Run-scoped tags of the account's resources, from one paginated
+    Resource Groups Tagging API GetResources sweep over RESOURCE_TYPES.
+
+    Lookups return the resource tags as a dict (empty when untagged), or
+    None when the type is not covered or the API is not available, in which
+    case callers fall back to the service's own tagging call.
+    """
+
+    RESOURCE_TYPES = [
+        "ec2:vpc",
+        "ec2:instance",
+        "s3",
+        "lambda:function",
+        "sqs",
+        "elasticloadbalancing:loadbalancer",
+        "apigateway:restapis",
+        "logs:log-group",
+    ]
+
+    def __init__(self, aws_clients):
+        self.aws_clients = aws_clients
+        self.loaded = False
+        self.by_arn = None
+        self.by_id = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        self.loaded = True
+        self.by_arn = {}
+        self.by_id = {}
+        try:
+            paginator = self.aws_clients.resourcegroupstaggingapi_client.get_paginator(
+                "get_resources")
+            for page in paginator.paginate(ResourceTypeFilters=self.RESOURCE_TYPES):
+                for resource in page.get("ResourceTagMappingList", []):
+                    tags = {tag['Key']: tag['Value']
+                            for tag in resource.get('Tags', [])}
+                    arn = resource['ResourceARN']
+                    self.by_arn[arn] = tags
+                    self.by_id[parse_arn(arn)] = tags
+        except ClientError as e:
+            logger.debug(f"Tag index not available: {e}")
+            self.by_arn = self.by_id = None
+
+    def covered(self, service, resource_type):
+        if resource_type:
+            return f"{service}:{resource_type}" in self.RESOURCE_TYPES
+        return service in self.RESOURCE_TYPES
+
+    def lookup(self, index_key, service, resource_type, key):
+        if not self.covered(service, resource_type):
+            return None
+        with self.lock:
+            if not self.loaded:
+                self.load()
+            index = getattr(self, index_key)
+        if index is None:
+            return None
+        return index.get(key, {})
+
+    def tags(self, arn):
+        service, resource_type, _ = parse_arn(arn)
+        return self.lookup("by_arn", service, resource_type, arn)
+
+    def tags_by_id(self, service, resource_type, resource_id):
+        return self.lookup("by_id", service, resource_type, (service, resource_type, resource_id))
+
+
+# Run-scoped indexes, per AwsClients and then per index class
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_index(aws_clients, index_class):
+    with _indexes_lock:
+        indexes = _indexes.setdefault(aws_clients, {})
+        if index_class not in indexes:
+            indexes[index_class] = index_class(aws_clients)
+        return indexes[index_class]
+
 
-        # Check if 'Subnets' key exists and it's not empty
-        if not response or 'Subnets' not in response or not response['Subnets']:
+def get_network_index(aws_clients):
+    return get_index(aws_clients, NetworkIndex)
+
+
+def get_kms_alias_index(aws_clients):
+    return get_index(aws_clients, KmsAliasIndex)
+
+
+def get_instance_profile_index(aws_clients):
+    return get_index(aws_clients, InstanceProfileIndex)
+
+
+def get_tag_index(aws_clients):
+    return get_index(aws_clients, TagIndex)
+
+
+def get_kms_alias(aws_clients, kms_key_id):
+    return get_kms_alias_index(aws_clients).alias(kms_key_id)
+
+
+def get_vpc_name(aws_clients, vpc_id):
+    vpc_name = get_network_index(aws_clients).vpc_name(vpc_id)
+
+    if vpc_name is None:
+        logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
+
+    return vpc_name
+
+
+def get_vpc_name_by_subnet(aws_clients, subnet_ids):
+    vpc_id = ""
+    vpc_name = ""
+    if subnet_ids:
+        subnet_id = subnet_ids[0]
+        # get the vpc id for the subnet_id
+        subnet = get_subnet(aws_clients, subnet_id)
+        if not subnet:
             logger.debug(
                 f"No subnet information found for Subnet ID: {subnet_id}")
-            continue
+            return None
+        vpc_id = subnet.get('VpcId', None)
 
-        # Extract the 'Tags' key safely using get
-        subnet_tags = response['Subnets'][0].get('Tags', [])
+        if vpc_id:
+            vpc_name = get_vpc_name(aws_clients, vpc_id)
 
-        # Extract the subnet name from the tags
-        subnet_name = next(
-            (tag['Value'] for tag in subnet_tags if tag['Key'] == 'Name'), None)
+    return vpc_id, vpc_name
 
+
+def get_subnet(aws_clients, subnet_id):
+    return get_network_index(aws_clients).subnet(subnet_id)
+
+
+def get_subnet_names(aws_clients, subnet_ids):
+    index = get_network_index(aws_clients)
+    index.resolve_subnets(subnet_ids)
+
+    subnet_names = []
+    for subnet_id in subnet_ids:
+        subnet_name = index.subnet_name(subnet_id)
         if subnet_name:
             subnet_names.append(subnet_name)
         else:
@@ -58,17 +349,7 @@ def get_subnet_names(aws_clients, subnet_ids):
 
 
 def get_subnet_name(aws_clients, subnet_id):
-    response = aws_clients.ec2_client.describe_subnets(SubnetIds=[
-        subnet_id])
-
-    if not response or 'Subnets' not in response or not response['Subnets']:
-        # Handle this case as required, for example:
-        logger.debug(f"No subnet information found for Subnet ID: {subnet_id}")
-        return None
-
-    subnet_tags = response['Subnets'][0].get('Tags', [])
-    subnet_name = next(
-        (tag['Value'] for tag in subnet_tags if tag['Key'] == 'Name'), None)
+    subnet_name = get_network_index(aws_clients).subnet_name(subnet_id)
 
     if subnet_name is None:
         logger.debug(f"No 'Name' tag found for Subnet ID: {subnet_id}")
@@ -76,17 +357,134 @@ def get_subnet_name(aws_clients, subnet_id):
     return subnet_name
 
 
+def stream_pages(paginator, **params):
+    """
+    Lazily yields the pages of paginator.paginate(**params). A background
+    thread fetches up to PAGE_PREFETCH pages ahead, so the next request
+    overlaps with processing while at most that many pages are held.
+    """
+    pages = paginator.paginate(**params)
+    if PAGE_PREFETCH <= 0:
+        yield from pages
+        return
+
+    buffer = queue.Queue(maxsize=PAGE_PREFETCH)
+    stop = threading.Event()
+    done = object()
+    module = get_current_module()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        set_current_module(module)
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except Exception as e:
+            put((None, e))
+            return
+        put((done, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is done:
+                return
+            yield page
+    finally:
+        # The consumer stopped early or failed, let the producer go
+        stop.set()
+
+
+def page_items(page, key):
+    """Items of a page, `key` being a JMESPath such as Reservations[].Instances[]."""
+    return jmespath.search(key, page) or []
+
+
+def paginate_items(paginator, key, **params):
+    for page in stream_pages(paginator, **params):
+        yield from page_items(page, key)
+
+
+def paginate_with_progress(module, pages, key, include=None):
+    """
+    Yields the `key` items of each page as it arrives, so a listing is only
+    paginated once. The module's progress task is added with the first
+    item and its total grows page by page; `include` limits the items that
+    are yielded and counted.
+    """
+    progress = module.provider_instance.progress
+    total = 0
+    for page in pages:
+        items = [item for item in page_items(page, key)
+                 if include is None or include(item)]
+        if not items:
+            continue
+        if total == 0:
+            module.task = progress.add_task(
+                f"[cyan]Processing {module.__class__.__name__}...", total=len(items))
+        else:
+            progress.update(module.task, total=total + len(items))
+        total += len(items)
+        yield from items
+
+
+def state_payload(describe, key=None, **params):
+    """
+    describe(**params), or its `key` JMESPath, as the payload a resource's
+    refreshed state is cached by (see HCL.process_resource). None, so the
+    resource is refreshed every run, when the call fails.
+    """
+    try:
+        response = describe(**params)
+    except ClientError as e:
+        logger.debug(f"No state payload from {describe.__name__}: {e}")
+        return None
+    return page_items(response, key) if key else response
+
+
+def combined_state_payload(**parts):
+    """The state payloads `parts` as one, None if any of them is."""
+    return None if None in parts.values() else parts
+
+
+def paginated_state_payload(paginator, key, **params):
+    """
+    Every `key` item of paginator.paginate(**params) as a state payload (see
+    state_payload), None when the listing fails.
+    """
+    try:
+        return list(paginate_items(paginator, key, **params))
+    except ClientError as e:
+        logger.debug(f"No state payload from the {key} listing: {e}")
+        return None
+
+
 def parse_filters(filters_str):
     """
     Parses a filter string formatted as "key=value,key=value" into a list of
     dictionaries suitable for use with Boto3's describe_instances() method.
+    The NAME_KEY ("%name") key filters on the resource name, any other key
+    on the tag of that name (see filters.ResourceFilter).
     """
     filters = []
     if filters_str:
         for filter_part in filters_str.split(','):
             key, value = filter_part.split('=')
             filters.append({
-                'Name': f'tag:{key}',  # Format the name as 'tag:key'
+                # Format the name as 'tag:key'
+                'Name': key if key == NAME_KEY else f'tag:{key}',
                 'Values': [value]      # Values must be a list
             })
     return filters
@@ -1,13 +1,44 @@
 from ...utils.hcl import HCL
+from ...utils.native_state import native_builder
 from ...providers.aws.iam_role import IAM
 from ...providers.aws.s3 import S3
 from ...providers.aws.logs import Logs
+from ...providers.aws.utils import get_name_tag, state_payload, combined_state_payload
+from ...utils.parallel import for_each
+import copy
 import logging
 import inspect
 
 logger = logging.getLogger('finisterra')
 
 
+@native_builder("aws_route")
+def route_state(attributes, payload):
+    # payload is the DescribeRouteTables route, VPC endpoints come as GatewayId
+    gateway_id = payload.get("GatewayId", "")
+    vpc_endpoint_id = gateway_id if gateway_id.startswith("vpce-") else ""
+    return {
+        "route_table_id": attributes["route_table_id"],
+        "carrier_gateway_id": payload.get("CarrierGatewayId", ""),
+        "core_network_arn": payload.get("CoreNetworkArn", ""),
+        "destination_cidr_block": payload.get("DestinationCidrBlock", ""),
+        "destination_ipv6_cidr_block": payload.get("DestinationIpv6CidrBlock", ""),
+        "destination_prefix_list_id": payload.get("DestinationPrefixListId", ""),
+        "egress_only_gateway_id": payload.get("EgressOnlyInternetGatewayId", ""),
+        "gateway_id": "" if vpc_endpoint_id else gateway_id,
+        "instance_id": payload.get("InstanceId", ""),
+        "instance_owner_id": payload.get("InstanceOwnerId", ""),
+        "local_gateway_id": payload.get("LocalGatewayId", ""),
+        "nat_gateway_id": payload.get("NatGatewayId", ""),
+        "network_interface_id": payload.get("NetworkInterfaceId", ""),
+        "origin": payload.get("Origin", ""),
+        "state": payload.get("State", ""),
+        "transit_gateway_id": payload.get("TransitGatewayId", ""),
+        "vpc_endpoint_id": vpc_endpoint_id,
+        "vpc_peering_connection_id": payload.get("VpcPeeringConnectionId", ""),
+    }
+
+
 class VPC:
     def __init__(self, provider_instance, hcl=None):
         self.provider_instance=provider_instance
@@ -42,22 +73,10 @@ class VPC:
         self.logs_instance = Logs(self.provider_instance, self.hcl)
 
     def is_subnet_public(self, subnet_id):
-        route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables(
-            Filters=[{'Name': 'association.subnet-id', 'Values': [subnet_id]}])
-        for route_table in route_tables['RouteTables']:
-            for route in route_table['Routes']:
-                if route.get('GatewayId', '').startswith('igw-'):
-                    return True
-        return False
+        return self.provider_instance.network_inventory.is_subnet_public(subnet_id)
 
     def is_subnet_private(self, subnet_id):
-        route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables(
-            Filters=[{'Name': 'association.subnet-id', 'Values': [subnet_id]}])
-        for route_table in route_tables['RouteTables']:
-            for route in route_table['Routes']:
-                if route.get('GatewayId', '').startswith('igw-'):
-                    return False
-        return True
+        return self.provider_instance.network_inventory.is_subnet_private(subnet_id)
 
     def vpc(self):
         self.hcl.prepare_folder()
@@ -79,94 +98,96 @@ class VPC:
             self.provider_instance.progress.update(self.task, advance=1)
 
     def aws_vpc(self):
-        resource_type = "aws_vpc"
         logger.debug("Processing VPCs...")
-        vpcs = self.provider_instance.aws_clients.ec2_client.describe_vpcs()["Vpcs"]
+        vpcs = self.provider_instance.network_inventory.vpcs()
         if len(vpcs) > 0:
             self.task = self.provider_instance.progress.add_task(
                 f"[cyan]Processing {self.__class__.__name__}...", total=len(vpcs))
-        for vpc in vpcs:
-            self.provider_instance.progress.update(
-                self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{vpc['VpcId']}[/]")
-            is_default = vpc.get("IsDefault", False)
-            if not is_default:
-                vpc_id = vpc["VpcId"]
-                # if vpc_id != "xxxx":
-                #     continue
-                logger.debug(f"Processing VPC: {vpc_id}")
-                id = vpc_id
-
-                ftstack = "vpc"
-                try:
-                    tags_response = self.provider_instance.aws_clients.ec2_client.describe_tags(
-                        Filters=[{'Name': 'resource-id', 'Values': [vpc_id]}]
-                    )
-                    tags = tags_response.get('Tags', [])
-                    for tag in tags:
-                        if tag['Key'] == 'ftstack':
-                            if tag['Value'] != "vpc":
-                                ftstack = "stack_"+tag['Value']
-                            break
-                except Exception as e:
-                    logger.debug(f"Error occurred: {e}")
+        for_each(self.process_vpc, vpcs)
 
-                attributes = {
-                    "id": id,
-                }
-                self.hcl.process_resource(
-                    resource_type, id, attributes)
-
-                self.hcl.add_stack(resource_type, id, ftstack)
-
-                self.aws_subnet(vpc)  # pass the vpc
-                self.aws_internet_gateway(vpc_id)  # pass the vpc_id
-                self.aws_route_table(vpc_id)
-                # call aws_default_route_table with vpc_id
-                self.aws_default_route_table(vpc_id)
-                # call aws_default_network_acl with vpc_id
-                self.aws_default_network_acl(vpc_id)
-                # call aws_default_security_group with vpc_id
-                self.aws_default_security_group(vpc_id)
-                # call aws_network_acl with vpc_id
-                self.aws_network_acl(vpc_id)
-                # call aws_flow_log with vpc_id
-                self.aws_flow_log(vpc_id, ftstack)
-                # call aws_vpc_dhcp_options with vpc_id
-                self.aws_vpc_dhcp_options_association(vpc_id)
-                # Nat Gateway
-                self.aws_nat_gateway(vpc_id)
+    def process_vpc(self, vpc):
+        resource_type = "aws_vpc"
+        self.provider_instance.progress.update(
+            self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{vpc['VpcId']}[/]")
+        is_default = vpc.get("IsDefault", False)
+        if not is_default:
+            vpc_id = vpc["VpcId"]
+            # if vpc_id != "xxxx":
+            #     continue
+            logger.debug(f"Processing VPC: {vpc_id}")
+            id = vpc_id
+
+            ftstack = "vpc"
+            for tag in vpc.get('Tags', []):
+                if tag['Key'] == 'ftstack':
+                    if tag['Value'] != "vpc":
+                        ftstack = "stack_"+tag['Value']
+                    break
+
+            attributes = {
+                "id": id,
+            }
+            self.hcl.process_resource(
+                resource_type, id, attributes, self.vpc_payload(vpc))
+
+            self.hcl.add_stack(resource_type, id, ftstack)
+
+            self.aws_subnet(vpc)  # pass the vpc
+            self.aws_internet_gateway(vpc_id)  # pass the vpc_id
+            self.aws_route_table(vpc_id)
+            # call aws_default_route_table with vpc_id
+            self.aws_default_route_table(vpc_id)
+            # call aws_default_network_acl with vpc_id
+            self.aws_default_network_acl(vpc_id)
+            # call aws_default_security_group with vpc_id
+            self.aws_default_security_group(vpc_id)
+            # call aws_network_acl with vpc_id
+            self.aws_network_acl(vpc_id)
+            # call aws_flow_log with vpc_id
+            self.aws_flow_log(vpc_id, ftstack)
+            # call aws_vpc_dhcp_options with vpc_id
+            self.aws_vpc_dhcp_options_association(vpc_id)
+            # Nat Gateway
+            self.aws_nat_gateway(vpc_id)
+
+    def vpc_payload(self, vpc):
+        """The VPC with its DNS and metrics attributes, None if they cannot be read."""
+        return combined_state_payload(vpc=vpc, **{
+            attribute: state_payload(self.provider_instance.aws_clients.ec2_client.describe_vpc_attribute,
+                                     VpcId=vpc["VpcId"], Attribute=attribute)
+            for attribute in ("enableDnsSupport", "enableDnsHostnames", "enableNetworkAddressUsageMetrics")
+        })
 
     def aws_subnet(self, vpc):
         logger.debug("Processing Subnets...")
 
         vpc_id = vpc["VpcId"]
 
-        subnets = self.provider_instance.aws_clients.ec2_client.describe_subnets()["Subnets"]
+        subnets = self.provider_instance.network_inventory.subnets(vpc_id)
         for subnet in subnets:
-            if subnet["VpcId"] == vpc_id:
-                subnet_id = subnet["SubnetId"]
-                logger.debug(f"    Processing Subnet: {subnet_id}")
-                attributes = {
-                    "id": subnet_id,
-                    "vpc_id": vpc_id,
-                    "cidr_block": subnet["CidrBlock"],
-                    "availability_zone": subnet["AvailabilityZone"],
-                }
-                self.hcl.process_resource(
-                    "aws_subnet", subnet_id.replace("-", "_"), attributes)
+            subnet_id = subnet["SubnetId"]
+            logger.debug(f"    Processing Subnet: {subnet_id}")
+            attributes = {
+                "id": subnet_id,
+                "vpc_id": vpc_id,
+                "cidr_block": subnet["CidrBlock"],
+                "availability_zone": subnet["AvailabilityZone"],
+            }
+            self.hcl.process_resource(
+                "aws_subnet", subnet_id.replace("-", "_"), attributes, subnet)
 
-                self.aws_route_table_association(subnet_id)
-                is_public = self.is_subnet_public(subnet_id)
-                self.hcl.add_additional_data(
-                    "aws_subnet", subnet_id, "is_public", is_public)
-                is_private = self.is_subnet_private(subnet_id)
-                self.hcl.add_additional_data(
-                    "aws_subnet", subnet_id, "is_private", is_private)
+            self.aws_route_table_association(subnet_id)
+            is_public = self.is_subnet_public(subnet_id)
+            self.hcl.add_additional_data(
+                "aws_subnet", subnet_id, "is_public", is_public)
+            is_private = self.is_subnet_private(subnet_id)
+            self.hcl.add_additional_data(
+                "aws_subnet", subnet_id, "is_private", is_private)
 
     def aws_internet_gateway(self, vpc_id):
         logger.debug("Processing Internet Gateways...")
-        internet_gateways = self.provider_instance.aws_clients.ec2_client.describe_internet_gateways()[
-            "InternetGateways"]
+        internet_gateways = self.provider_instance.network_inventory.internet_gateways(
+            vpc_id)
 
         for igw in internet_gateways:
             igw_id = igw["InternetGatewayId"]
@@ -180,10 +201,10 @@ class VPC:
                     "vpc_id": attached_vpc_id,
                 }
                 self.hcl.process_resource(
-                    "aws_internet_gateway", igw_id.replace("-", "_"), attributes)
+                    "aws_internet_gateway", igw_id.replace("-", "_"), attributes, igw)
 
-                route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables()[
-                    "RouteTables"]
+                route_tables = self.provider_instance.network_inventory.route_tables(
+                    vpc_id)
 
                 for rt in route_tables:
                     for route in rt["Routes"]:
@@ -193,10 +214,11 @@ class VPC:
 
     def aws_default_route_table(self, vpc_id):
         logger.debug("Processing Default Route Tables...")
-        route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables(
-            Filters=[{"Name": "association.main", "Values": ["true"]},
-                     {"Name": "vpc-id", "Values": [vpc_id]}]  # Filter for the given vpc_id
-        )["RouteTables"]
+        main_route_table = self.provider_instance.network_inventory.main_route_table(
+            vpc_id)
+        # Copied, the routes below are edited and the snapshot is shared
+        route_tables = [copy.deepcopy(main_route_table)
+                        ] if main_route_table else []
 
         for route_table in route_tables:
             route_table_id = route_table["RouteTableId"]
@@ -214,14 +236,13 @@ class VPC:
                 "vpc_id": vpc_id,
             }
             self.hcl.process_resource(
-                "aws_default_route_table", route_table_id.replace("-", "_"), attributes)
+                "aws_default_route_table", route_table_id.replace("-", "_"), attributes, main_route_table)
 
     def aws_default_network_acl(self, vpc_id):
         logger.debug("Processing Default Network ACLs...")
-        network_acls = self.provider_instance.aws_clients.ec2_client.describe_network_acls(
-            Filters=[{"Name": "default", "Values": ["true"]},
-                     {"Name": "vpc-id", "Values": [vpc_id]}]  # Filter for the given vpc_id
-        )["NetworkAcls"]
+        default_network_acl = self.provider_instance.network_inventory.default_network_acl(
+            vpc_id)
+        network_acls = [default_network_acl] if default_network_acl else []
         for network_acl in network_acls:
             network_acl_id = network_acl["NetworkAclId"]
             default_network_acl_id = network_acl["NetworkAclId"]
@@ -234,14 +255,12 @@ class VPC:
                 "default_network_acl_id": default_network_acl_id,
             }
             self.hcl.process_resource(
-                "aws_default_network_acl", network_acl_id.replace("-", "_"), attributes)
+                "aws_default_network_acl", network_acl_id.replace("-", "_"), attributes, network_acl)
 
     def aws_default_security_group(self, vpc_id):
         logger.debug("Processing Default Security Groups...")
-        security_groups = self.provider_instance.aws_clients.ec2_client.describe_security_groups(
-            Filters=[{"Name": "group-name", "Values": ["default"]},
-                     {"Name": "vpc-id", "Values": [vpc_id]}]  # Filter for the given vpc_id
-        )["SecurityGroups"]
+        security_groups = [sg for sg in self.provider_instance.network_inventory.security_groups(vpc_id)
+                           if sg["GroupName"] == "default"]
 
         for security_group in security_groups:
             security_group_id = security_group["GroupId"]
@@ -253,13 +272,12 @@ class VPC:
                 "vpc_id": vpc_id,
             }
             self.hcl.process_resource(
-                "aws_default_security_group", security_group_id.replace("-", "_"), attributes)
+                "aws_default_security_group", security_group_id.replace("-", "_"), attributes, security_group)
 
     def aws_default_subnet(self):
         logger.debug("Processing Default Subnets...")
-        subnets = self.provider_instance.aws_clients.ec2_client.describe_subnets(
-            Filters=[{"Name": "default-for-az", "Values": ["true"]}]
-        )["Subnets"]
+        subnets = [subnet for subnet in self.provider_instance.network_inventory.subnets()
+                   if subnet.get("DefaultForAz")]
 
         for subnet in subnets:
             vpc_id = subnet["VpcId"]
@@ -274,7 +292,7 @@ class VPC:
                 "availability_zone": subnet["AvailabilityZone"],
             }
             self.hcl.process_resource(
-                "aws_default_subnet", subnet_id.replace("-", "_"), attributes)
+                "aws_default_subnet", subnet_id.replace("-", "_"), attributes, subnet)
 
     def aws_default_vpc(self):
         logger.debug("Processing Default VPCs...")
@@ -290,7 +308,7 @@ class VPC:
                 "id": vpc_id,
             }
             self.hcl.process_resource(
-                "aws_default_vpc", vpc_id.replace("-", "_"), attributes)
+                "aws_default_vpc", vpc_id.replace("-", "_"), attributes, self.vpc_payload(vpc))
 
     def aws_default_vpc_dhcp_options(self):
         logger.debug("Processing Default VPC DHCP Options...")
@@ -307,7 +325,7 @@ class VPC:
                 "id": dhcp_options_id,
             }
             self.hcl.process_resource(
-                "aws_default_vpc_dhcp_options", dhcp_options_id.replace("-", "_"), attributes)
+                "aws_default_vpc_dhcp_options", dhcp_options_id.replace("-", "_"), attributes, dhcp_option)
 
     def aws_ec2_managed_prefix_list(self):
         logger.debug("Processing EC2 Managed Prefix Lists...")
@@ -337,7 +355,8 @@ class VPC:
                 "entries": entry_attributes,
             }
             self.hcl.process_resource(
-                "aws_ec2_managed_prefix_list", prefix_list_id.replace("-", "_"), attributes)
+                "aws_ec2_managed_prefix_list", prefix_list_id.replace("-", "_"), attributes,
+                {"prefix_list": prefix_list, "entries": entries})
 
     def aws_ec2_network_insights_analysis(self):
         logger.debug("Processing EC2 Network Insights Analysis...")
@@ -356,7 +375,7 @@ class VPC:
                 "status_message": analysis.get("StatusMessage", ""),
             }
             self.hcl.process_resource(
-                "aws_ec2_network_insights_analysis", analysis_id.replace("-", "_"), attributes)
+                "aws_ec2_network_insights_analysis", analysis_id.replace("-", "_"), attributes, analysis)
 
     def aws_ec2_network_insights_path(self):
         logger.debug("Processing EC2 Network Insights Paths...")
@@ -374,11 +393,11 @@ class VPC:
                 "protocol": path.get("Protocol", ""),
             }
             self.hcl.process_resource(
-                "aws_ec2_network_insights_path", path_id.replace("-", "_"), attributes)
+                "aws_ec2_network_insights_path", path_id.replace("-", "_"), attributes, path)
 
     def aws_ec2_subnet_cidr_reservation(self):
         logger.debug("Processing Subnet CIDR Reservations...")
-        subnets = self.provider_instance.aws_clients.ec2_client.describe_subnets()["Subnets"]
+        subnets = self.provider_instance.network_inventory.subnets()
 
         for subnet in subnets:
             subnet_id = subnet["SubnetId"]
@@ -398,7 +417,7 @@ class VPC:
                     "cidr_block": cidr_reservation["Cidr"],
                 }
                 self.hcl.process_resource(
-                    "aws_ec2_subnet_cidr_reservation", reservation_id.replace("-", "_"), attributes)
+                    "aws_ec2_subnet_cidr_reservation", reservation_id.replace("-", "_"), attributes, cidr_reservation)
 
             # Process IPv6 CIDR reservations
             ipv6_cidr_reservations = cidr_reservations_response["SubnetIpv6CidrReservations"]
@@ -413,7 +432,7 @@ class VPC:
                     "cidr_block": cidr_reservation["Cidr"],
                 }
                 self.hcl.process_resource(
-                    "aws_ec2_subnet_cidr_reservation", reservation_id.replace("-", "_"), attributes)
+                    "aws_ec2_subnet_cidr_reservation", reservation_id.replace("-", "_"), attributes, cidr_reservation)
 
     def aws_ec2_traffic_mirror_filter(self):
         logger.debug("Processing EC2 Traffic Mirror Filters...")
@@ -430,7 +449,7 @@ class VPC:
                 "description": tm_filter.get("Description", ""),
             }
             self.hcl.process_resource(
-                "aws_ec2_traffic_mirror_filter", tm_filter_id.replace("-", "_"), attributes)
+                "aws_ec2_traffic_mirror_filter", tm_filter_id.replace("-", "_"), attributes, tm_filter)
 
     def aws_ec2_traffic_mirror_filter_rule(self):
         logger.debug("Processing EC2 Traffic Mirror Filter Rules...")
@@ -473,7 +492,7 @@ class VPC:
                     "rule_number": rule["RuleNumber"],
                 }
                 self.hcl.process_resource(
-                    "aws_ec2_traffic_mirror_filter_rule", rule_id.replace("-", "_"), attributes)
+                    "aws_ec2_traffic_mirror_filter_rule", rule_id.replace("-", "_"), attributes, rule)
 
     def aws_ec2_traffic_mirror_session(self):
         logger.debug("Processing EC2 Traffic Mirror Sessions...")
@@ -495,7 +514,7 @@ class VPC:
                 "description": tm_session.get("Description", ""),
             }
             self.hcl.process_resource(
-                "aws_ec2_traffic_mirror_session", tm_session_id.replace("-", "_"), attributes)
+                "aws_ec2_traffic_mirror_session", tm_session_id.replace("-", "_"), attributes, tm_session)
 
     def aws_ec2_traffic_mirror_target(self):
         logger.debug("Processing EC2 Traffic Mirror Targets...")
@@ -514,7 +533,7 @@ class VPC:
                 "network_interface_id": tm_target.get("NetworkInterfaceId", ""),
             }
             self.hcl.process_resource(
-                "aws_ec2_traffic_mirror_target", tm_target_id.replace("-", "_"), attributes)
+                "aws_ec2_traffic_mirror_target", tm_target_id.replace("-", "_"), attributes, tm_target)
 
     def aws_egress_only_internet_gateway(self):
         logger.debug("Processing Egress Only Internet Gateways...")
@@ -534,7 +553,7 @@ class VPC:
                 "vpc_id": vpc_id,
             }
             self.hcl.process_resource(
-                "aws_egress_only_internet_gateway", egress_only_igw_id.replace("-", "_"), attributes)
+                "aws_egress_only_internet_gateway", egress_only_igw_id.replace("-", "_"), attributes, egress_only_igw)
 
     def aws_flow_log(self, vpc_id, ftstack):
         logger.debug("Processing Flow Logs...")
@@ -558,7 +577,7 @@ class VPC:
                     "max_aggregation_interval": flow_log.get("MaxAggregationInterval", ""),
                 }
                 self.hcl.process_resource(
-                    "aws_flow_log", flow_log_id.replace("-", "_"), attributes)
+                    "aws_flow_log", flow_log_id.replace("-", "_"), attributes, flow_log)
                 # Check if the log destination type is 'cloudwatch-logs'
                 if attributes["log_destination_type"] == "cloud-watch-logs":
                     # If so, process a CloudWatch Log Group
@@ -595,15 +614,17 @@ class VPC:
                     }
 
                     self.hcl.process_resource(
-                        "aws_cloudwatch_log_group", log_group_name.replace("-", "_"), attributes)
+                        "aws_cloudwatch_log_group", log_group_name.replace("-", "_"), attributes, {
+                            "log_group": log_group,
+                            "tags": self.logs_instance.log_group_tags(log_group),
+                        })
                     return
 
         logger.debug(f"  Log group: {log_group_name} does not exist.")
 
     def aws_internet_gateway_attachment(self):
         logger.debug("Processing Internet Gateway Attachments...")
-        internet_gateways = self.provider_instance.aws_clients.ec2_client.describe_internet_gateways()[
-            "InternetGateways"]
+        internet_gateways = self.provider_instance.network_inventory.internet_gateways()
 
         for igw in internet_gateways:
             igw_id = igw["InternetGatewayId"]
@@ -619,12 +640,11 @@ class VPC:
                     "vpc_id": vpc_id,
                 }
                 self.hcl.process_resource(
-                    "aws_internet_gateway_attachment", f"{igw_id.replace('-', '_')}-{vpc_id.replace('-', '_')}", attributes)
+                    "aws_internet_gateway_attachment", f"{igw_id.replace('-', '_')}-{vpc_id.replace('-', '_')}", attributes, igw)
 
     def aws_main_route_table_association(self):
         logger.debug("Processing Main Route Table Associations...")
-        route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables()[
-            "RouteTables"]
+        route_tables = self.provider_instance.network_inventory.route_tables()
 
         for rt in route_tables:
             rt_id = rt["RouteTableId"]
@@ -642,20 +662,18 @@ class VPC:
                         "route_table_id": rt_id,
                     }
                     self.hcl.process_resource(
-                        "aws_main_route_table_association", assoc_id.replace("-", "_"), attributes)
+                        "aws_main_route_table_association", assoc_id.replace("-", "_"), attributes, rt)
 
     def aws_nat_gateway(self, vpc_id):
         logger.debug(f"Processing NAT Gateways for VPC: {vpc_id}")
 
-        # Describe all subnets for the given VPC
-        subnets = self.provider_instance.aws_clients.ec2_client.describe_subnets(
-            Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])['Subnets']
+        inventory = self.provider_instance.network_inventory
+        subnets = inventory.subnets(vpc_id)
 
         # Process NAT gateways for each subnet
         for subnet in subnets:
             subnet_id = subnet['SubnetId']
-            nat_gateways = self.provider_instance.aws_clients.ec2_client.describe_nat_gateways(
-                Filters=[{'Name': 'subnet-id', 'Values': [subnet_id]}])["NatGateways"]
+            nat_gateways = inventory.subnet_nat_gateways(subnet_id)
 
             # Sort the NAT gateways by CreateTime
             nat_gateways = sorted(
@@ -678,14 +696,13 @@ class VPC:
                     }
 
                     self.hcl.process_resource(
-                        "aws_nat_gateway", nat_gw_id.replace("-", "_"), attributes)
+                        "aws_nat_gateway", nat_gw_id.replace("-", "_"), attributes, nat_gw)
 
                     # Process associated EIPs
                     for address in nat_gw["NatGatewayAddresses"]:
                         self.aws_eip(address["AllocationId"])
 
-                    route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables()[
-                        "RouteTables"]
+                    route_tables = inventory.route_tables(vpc_id)
 
                     for rt in route_tables:
                         for route in rt["Routes"]:
@@ -694,8 +711,7 @@ class VPC:
                                 # pass the route_table_id and the route
                                 self.aws_route(rt["RouteTableId"], route)
 
-                    subnet_cidr = self.provider_instance.aws_clients.ec2_client.describe_subnets(
-                        SubnetIds=[nat_gw["SubnetId"]])['Subnets'][0]['CidrBlock']
+                    subnet_cidr = inventory.subnet_cidr(nat_gw["SubnetId"])
                     if subnet_cidr:
                         self.hcl.add_additional_data(
                             "aws_nat_gateway", nat_gw_id, "subnet_cidr", subnet_cidr)
@@ -720,17 +736,11 @@ class VPC:
             attributes["private_ip"] = eip["PrivateIpAddress"]
 
         self.hcl.process_resource(
-            "aws_eip", allocation_id.replace("-", "_"), attributes)
+            "aws_eip", allocation_id.replace("-", "_"), attributes, eip)
 
         # Get the natgateway using this EIP
-        ngs = self.provider_instance.aws_clients.ec2_client.describe_nat_gateways()
-        nat_gateway = None
-
-        for ng in ngs["NatGateways"]:
-            for address in ng["NatGatewayAddresses"]:
-                if address["AllocationId"] == allocation_id:
-                    nat_gateway = ng
-                    break
+        nat_gateway = self.provider_instance.network_inventory.allocation_nat_gateway(
+            allocation_id)
         if nat_gateway:
             # Get the name from the tags
             nat_gateway_name = ""
@@ -745,11 +755,11 @@ class VPC:
 
     def aws_network_acl(self, vpc_id):
         logger.debug("Processing Network ACLs...")
-        network_acls = self.provider_instance.aws_clients.ec2_client.describe_network_acls()[
-            "NetworkAcls"]
+        network_acls = self.provider_instance.network_inventory.network_acls(
+            vpc_id)
 
         for network_acl in network_acls:
-            if not network_acl["IsDefault"] and network_acl["VpcId"] == vpc_id:
+            if not network_acl["IsDefault"]:
                 network_acl_id = network_acl["NetworkAclId"]
                 logger.debug(
                     f"Processing Network ACL: {network_acl_id} for VPC: {vpc_id}")
@@ -759,7 +769,7 @@ class VPC:
                     "vpc_id": vpc_id,
                 }
                 self.hcl.process_resource(
-                    "aws_network_acl", network_acl_id.replace("-", "_"), attributes)
+                    "aws_network_acl", network_acl_id.replace("-", "_"), attributes, network_acl)
 
                 # call aws_network_acl_association with network_acl_id
                 # self.aws_network_acl_association(network_acl_id)
@@ -767,58 +777,56 @@ class VPC:
 
     def aws_network_acl_association(self, network_acl_id):
         logger.debug("Processing Network ACL Associations...")
-        network_acls = self.provider_instance.aws_clients.ec2_client.describe_network_acls()[
-            "NetworkAcls"]
+        network_acl = self.provider_instance.network_inventory.network_acl(
+            network_acl_id)
 
-        for network_acl in network_acls:
-            if network_acl["NetworkAclId"] == network_acl_id:
-                for assoc in network_acl["Associations"]:
-                    assoc_id = assoc["NetworkAclAssociationId"]
-                    subnet_id = assoc["SubnetId"]
-                    logger.debug(
-                        f"Processing Network ACL Association: {assoc_id} for Subnet: {subnet_id}")
+        if network_acl:
+            for assoc in network_acl["Associations"]:
+                assoc_id = assoc["NetworkAclAssociationId"]
+                subnet_id = assoc["SubnetId"]
+                logger.debug(
+                    f"Processing Network ACL Association: {assoc_id} for Subnet: {subnet_id}")
 
-                    attributes = {
-                        "id": assoc_id,
-                        "network_acl_id": network_acl_id,
-                        "subnet_id": subnet_id,
-                    }
-                    self.hcl.process_resource(
-                        "aws_network_acl_association", assoc_id.replace("-", "_"), attributes)
+                attributes = {
+                    "id": assoc_id,
+                    "network_acl_id": network_acl_id,
+                    "subnet_id": subnet_id,
+                }
+                self.hcl.process_resource(
+                    "aws_network_acl_association", assoc_id.replace("-", "_"), attributes, assoc)
 
-                # call aws_network_acl_rule with network_acl_id
+            # call aws_network_acl_rule with network_acl_id
 
     def aws_network_acl_rule(self, network_acl_id):
         logger.debug("Processing Network ACL Rules...")
-        network_acls = self.provider_instance.aws_clients.ec2_client.describe_network_acls()[
-            "NetworkAcls"]
+        network_acl = self.provider_instance.network_inventory.network_acl(
+            network_acl_id)
 
-        for network_acl in network_acls:
-            if network_acl["NetworkAclId"] == network_acl_id:
-                for entry in network_acl["Entries"]:
-                    rule_number = entry["RuleNumber"]
-                    if rule_number == 32767:
-                        continue
-                    rule_action = entry["RuleAction"]
-                    rule_egress = entry["Egress"]
-                    logger.debug(
-                        f"Processing Network ACL Rule: {rule_number} for Network ACL: {network_acl_id}")
+        if network_acl:
+            for entry in network_acl["Entries"]:
+                rule_number = entry["RuleNumber"]
+                if rule_number == 32767:
+                    continue
+                rule_action = entry["RuleAction"]
+                rule_egress = entry["Egress"]
+                logger.debug(
+                    f"Processing Network ACL Rule: {rule_number} for Network ACL: {network_acl_id}")
 
-                    attributes = {
-                        "id": f"{network_acl_id}-{rule_number}",
-                        "network_acl_id": network_acl_id,
-                        "rule_number": rule_number,
-                        "protocol": entry["Protocol"],
-                        "rule_action": rule_action,
-                        "egress": rule_egress,
-                        "cidr_block": entry.get("CidrBlock", ""),
-                        "ipv6_cidr_block": entry.get("Ipv6CidrBlock", ""),
-                    }
-                    type = "egress"
-                    if not rule_egress:
-                        type = "ingress"
-                    self.hcl.process_resource(
-                        "aws_network_acl_rule", f"{network_acl_id.replace('-', '_')}-{rule_number}-{type}", attributes)
+                attributes = {
+                    "id": f"{network_acl_id}-{rule_number}",
+                    "network_acl_id": network_acl_id,
+                    "rule_number": rule_number,
+                    "protocol": entry["Protocol"],
+                    "rule_action": rule_action,
+                    "egress": rule_egress,
+                    "cidr_block": entry.get("CidrBlock", ""),
+                    "ipv6_cidr_block": entry.get("Ipv6CidrBlock", ""),
+                }
+                type = "egress"
+                if not rule_egress:
+                    type = "ingress"
+                self.hcl.process_resource(
+                    "aws_network_acl_rule", f"{network_acl_id.replace('-', '_')}-{rule_number}-{type}", attributes, entry)
 
     def aws_network_interface(self, network_interface_id):
         logger.debug(f"Processing Network Interface: {network_interface_id}")
@@ -841,7 +849,7 @@ class VPC:
             }
 
             self.hcl.process_resource(
-                "aws_network_interface", eni_id.replace("-", "_"), attributes)
+                "aws_network_interface", eni_id.replace("-", "_"), attributes, network_interface)
 
     def aws_network_interface_attachment(self, network_interfaces):
         logger.debug("Processing Network Interface Attachments...")
@@ -863,7 +871,7 @@ class VPC:
                     "device_index": device_index,
                 }
                 self.hcl.process_resource(
-                    "aws_network_interface_attachment", attachment_id.replace("-", "_"), attributes)
+                    "aws_network_interface_attachment", attachment_id.replace("-", "_"), attributes, attachment)
 
     def aws_network_interface_sg_attachment(self, network_interfaces):
         logger.debug(
@@ -883,46 +891,42 @@ class VPC:
                     "security_group_id": sg_id,
                 }
                 self.hcl.process_resource("aws_network_interface_sg_attachment",
-                                          f"{eni_id.replace('-', '_')}-{sg_id.replace('-', '_')}", attributes)
+                                          f"{eni_id.replace('-', '_')}-{sg_id.replace('-', '_')}", attributes, sg)
 
     def aws_route_table(self, vpc_id):
         logger.debug("Processing Route Tables...")
-        route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables()[
-            "RouteTables"]
+        route_tables = self.provider_instance.network_inventory.route_tables(
+            vpc_id)
 
         # Sort the route_tables list based on CreationTime
-        route_tables.sort(key=lambda rt: rt.get('CreateTime', ''))
+        route_tables = sorted(
+            route_tables, key=lambda rt: rt.get('CreateTime', ''))
 
         for rt in route_tables:
-            if rt['VpcId'] == vpc_id:
-                # Ignore if it's the default route table
-                associations = rt.get('Associations', [])
-                if any(assoc.get('Main', False) for assoc in associations):
-                    continue
+            # Ignore if it's the default route table
+            associations = rt.get('Associations', [])
+            if any(assoc.get('Main', False) for assoc in associations):
+                continue
 
-                route_table_id = rt["RouteTableId"]
-                logger.debug(
-                    f"Processing Route Table: {route_table_id} for VPC: {vpc_id}")
+            route_table_id = rt["RouteTableId"]
+            logger.debug(
+                f"Processing Route Table: {route_table_id} for VPC: {vpc_id}")
 
-                attributes = {
-                    "id": route_table_id,
-                    "vpc_id": vpc_id,
-                }
-                self.hcl.process_resource(
-                    "aws_route_table", route_table_id.replace("-", "_"), attributes)
+            attributes = {
+                "id": route_table_id,
+                "vpc_id": vpc_id,
+            }
+            self.hcl.process_resource(
+                "aws_route_table", route_table_id.replace("-", "_"), attributes, rt)
 
-                # self.aws_route(route_table_id)  # pass the route_table_id
+            # self.aws_route(route_table_id)  # pass the route_table_id
 
     def aws_route(self, route_table_id, route):
-        # Describe the route table
-        response = self.provider_instance.aws_clients.ec2_client.describe_route_tables(
-            RouteTableIds=[route_table_id])
+        inventory = self.provider_instance.network_inventory
+        route_table = inventory.route_table(route_table_id)
 
-        # Check if it's the main route table
-        is_main_route_table = any(assoc.get('Main', False) for rt in response.get(
-            'RouteTables', []) for assoc in rt.get('Associations', []))
-
-        if is_main_route_table:
+        # Routes of the main route table belong to aws_default_route_table
+        if not route_table or inventory.is_main_route_table(route_table_id):
             return
 
         destination = route.get("DestinationCidrBlock",
@@ -954,78 +958,54 @@ class VPC:
         }
 
         self.hcl.process_resource(
-            "aws_route", id, attributes)
-
-        tags = response['RouteTables'][0].get('Tags', [])
-        route_table_name = ""
-        for tag in tags:
-            if tag['Key'] == 'Name':
-                route_table_name = tag['Value']
-                break
+            "aws_route", id, attributes, route)
+
+        route_table_name = get_name_tag(route_table)
         if route_table_name:
             self.hcl.add_additional_data(
                 "aws_route", id, "route_table_name", route_table_name)
 
-        # using boto3 describe the nat_gateway_id and get the name
         if route.get("NatGatewayId", ""):
-            nat_gateway_name = ""
-            nat_gateway = self.provider_instance.aws_clients.ec2_client.describe_nat_gateways(
-                NatGatewayIds=[route.get("NatGatewayId", "")])["NatGateways"][0]
-            for tag in nat_gateway.get('Tags', []):
-                if tag['Key'] == 'Name':
-                    nat_gateway_name = tag['Value']
-                    break
+            nat_gateway = inventory.nat_gateway(route["NatGatewayId"])
+            nat_gateway_name = get_name_tag(nat_gateway) if nat_gateway else None
             if nat_gateway_name:
                 self.hcl.add_additional_data(
                     "aws_route", id, "nat_gateway_name", nat_gateway_name)
 
     def aws_route_table_association(self, subnet_id):
         logger.debug("Processing Route Table Associations...")
-        route_tables = self.provider_instance.aws_clients.ec2_client.describe_route_tables()[
-            "RouteTables"]
-
-        for rt in route_tables:
-            # Check if this is a default route table
-            if any(assoc.get("Main") for assoc in rt["Associations"]):
-                continue  # Skip this route table if it's the default one
+        inventory = self.provider_instance.network_inventory
+        subnet_cidr = inventory.subnet_cidr(subnet_id)
 
+        for rt, assoc in inventory.subnet_route_table_associations(subnet_id):
             route_table_id = rt["RouteTableId"]
+            # Skip the default route table
+            if inventory.is_main_route_table(route_table_id):
+                continue
 
-            for assoc in rt["Associations"]:
-                # check the subnet_id and ensure this isn't a main association
-                if not assoc.get("Main") and assoc["SubnetId"] == subnet_id:
-                    assoc_id = assoc["RouteTableAssociationId"]
-                    logger.debug(
-                        f"Processing Route Table Association: {assoc_id} for Route Table: {route_table_id}")
+            assoc_id = assoc["RouteTableAssociationId"]
+            logger.debug(
+                f"Processing Route Table Association: {assoc_id} for Route Table: {route_table_id}")
 
-                    attributes = {
-                        "id": assoc_id,
-                        "route_table_id": route_table_id,
-                        "subnet_id": subnet_id,
-                    }
-                    self.hcl.process_resource(
-                        "aws_route_table_association", assoc_id.replace("-", "_"), attributes)
-
-                    # get the Name tag for the route table
-                    route_table_name = ""
-                    for tag in rt['Tags']:
-                        if tag['Key'] == 'Name':
-                            route_table_name = tag['Value']
-                            break
-                    if route_table_name:
-                        self.hcl.add_additional_data(
-                            "aws_route_table_association", assoc_id, "route_table_name", route_table_name)
-                    # get the cidr for the subnet_id
-                    subnet_cidr = self.provider_instance.aws_clients.ec2_client.describe_subnets(
-                        SubnetIds=[subnet_id])['Subnets'][0]['CidrBlock']
-                    if subnet_cidr:
-                        self.hcl.add_additional_data(
-                            "aws_route_table_association", assoc_id, "subnet_cidr", subnet_cidr)
+            attributes = {
+                "id": assoc_id,
+                "route_table_id": route_table_id,
+                "subnet_id": subnet_id,
+            }
+            self.hcl.process_resource(
+                "aws_route_table_association", assoc_id.replace("-", "_"), attributes, assoc)
+
+            route_table_name = get_name_tag(rt)
+            if route_table_name:
+                self.hcl.add_additional_data(
+                    "aws_route_table_association", assoc_id, "route_table_name", route_table_name)
+            if subnet_cidr:
+                self.hcl.add_additional_data(
+                    "aws_route_table_association", assoc_id, "subnet_cidr", subnet_cidr)
 
     def aws_security_group(self):
         logger.debug("Processing Security Groups...")
-        security_groups = self.provider_instance.aws_clients.ec2_client.describe_security_groups()[
-            "SecurityGroups"]
+        security_groups = self.provider_instance.network_inventory.security_groups()
 
         for sg in security_groups:
             sg_id = sg["GroupId"]
@@ -1048,7 +1028,7 @@ class VPC:
                 "description": sg.get("Description", ""),
             }
             self.hcl.process_resource(
-                "aws_security_group", sg_id.replace("-", "_"), attributes)
+                "aws_security_group", sg_id.replace("-", "_"), attributes, sg)
 
     def aws_vpc_dhcp_options(self, dhcp_options_id):
         logger.debug("Processing VPC DHCP Options...")
@@ -1067,7 +1047,7 @@ class VPC:
             attributes[key.lower()] = values
 
         self.hcl.process_resource(
-            "aws_vpc_dhcp_options", dhcp_options_id.replace("-", "_"), attributes)
+            "aws_vpc_dhcp_options", dhcp_options_id.replace("-", "_"), attributes, dhcp_options)
 
     def aws_vpc_dhcp_options_association(self, vpc_id):
         logger.debug("Processing VPC DHCP Options Associations...")
@@ -1085,7 +1065,7 @@ class VPC:
                 "dhcp_options_id": dhcp_options_id,
             }
             self.hcl.process_resource(
-                "aws_vpc_dhcp_options_association", assoc_id.replace("-", "_"), attributes)
+                "aws_vpc_dhcp_options_association", assoc_id.replace("-", "_"), attributes, vpc)
 
             # Get the DHCP options details
             dhcp_options = self.provider_instance.aws_clients.ec2_client.describe_dhcp_options(
@@ -1101,8 +1081,7 @@ class VPC:
 
     def aws_vpc_endpoint(self):
         logger.debug("Processing VPC Endpoints...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -1120,12 +1099,11 @@ class VPC:
                 "policy": endpoint["PolicyDocument"],
             }
             self.hcl.process_resource(
-                "aws_vpc_endpoint", endpoint_id.replace("-", "_"), attributes)
+                "aws_vpc_endpoint", endpoint_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_connection_accepter(self):
         logger.debug("Processing VPC Endpoint Connection Accepters...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             if endpoint["State"] == "pendingAcceptance":
@@ -1143,7 +1121,7 @@ class VPC:
                     "service_name": service_name,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_connection_accepter", accepter_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_connection_accepter", accepter_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_connection_notification(self):
         logger.debug("Processing VPC Endpoint Connection Notifications...")
@@ -1167,12 +1145,11 @@ class VPC:
                 "state": notification["ConnectionNotificationState"],
             }
             self.hcl.process_resource(
-                "aws_vpc_endpoint_connection_notification", notification_id.replace("-", "_"), attributes)
+                "aws_vpc_endpoint_connection_notification", notification_id.replace("-", "_"), attributes, notification)
 
     def aws_vpc_endpoint_policy(self):
         logger.debug("Processing VPC Endpoint Policies...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -1188,12 +1165,11 @@ class VPC:
                 "policy": policy_document,
             }
             self.hcl.process_resource(
-                "aws_vpc_endpoint_policy", endpoint_id.replace("-", "_"), attributes)
+                "aws_vpc_endpoint_policy", endpoint_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_route_table_association(self):
         logger.debug("Processing VPC Endpoint Route Table Associations...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -1210,12 +1186,11 @@ class VPC:
                     "route_table_id": route_table_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_route_table_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_route_table_association", assoc_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_security_group_association(self):
         logger.debug("Processing VPC Endpoint Security Group Associations...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -1233,7 +1208,7 @@ class VPC:
                     "security_group_id": security_group_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_security_group_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_security_group_association", assoc_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_service(self):
         logger.debug("Processing VPC Endpoint Services...")
@@ -1260,7 +1235,7 @@ class VPC:
                 "service_type": service["ServiceType"][0]["ServiceType"],
             }
             self.hcl.process_resource(
-                "aws_vpc_endpoint_service", service_id.replace("-", "_"), attributes)
+                "aws_vpc_endpoint_service", service_id.replace("-", "_"), attributes, service)
 
     def aws_vpc_endpoint_service_allowed_principal(self):
         logger.debug("Processing VPC Endpoint Service Allowed Principals...")
@@ -1282,12 +1257,11 @@ class VPC:
                     "principal_arn": principal,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_service_allowed_principal", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_service_allowed_principal", assoc_id.replace("-", "_"), attributes, service)
 
     def aws_vpc_endpoint_subnet_association(self):
         logger.debug("Processing VPC Endpoint Subnet Associations...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -1304,11 +1278,11 @@ class VPC:
                     "subnet_id": subnet_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_subnet_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_subnet_association", assoc_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_ipv4_cidr_block_association(self):
         logger.debug("Processing VPC IPv4 CIDR Block Associations...")
-        vpcs = self.provider_instance.aws_clients.ec2_client.describe_vpcs()["Vpcs"]
+        vpcs = self.provider_instance.network_inventory.vpcs()
 
         for vpc in vpcs:
             vpc_id = vpc["VpcId"]
@@ -1325,11 +1299,11 @@ class VPC:
                     "cidr_block": cidr_block["CidrBlock"],
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_ipv4_cidr_block_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_ipv4_cidr_block_association", assoc_id.replace("-", "_"), attributes, cidr_block)
 
     def aws_vpc_ipv6_cidr_block_association(self):
         logger.debug("Processing VPC IPv6 CIDR Block Associations...")
-        vpcs = self.provider_instance.aws_clients.ec2_client.describe_vpcs()["Vpcs"]
+        vpcs = self.provider_instance.network_inventory.vpcs()
 
         for vpc in vpcs:
             vpc_id = vpc["VpcId"]
@@ -1350,7 +1324,7 @@ class VPC:
                     attributes["ipv6_ipam_pool_id"] = ipv6_cidr_block["Ipv6Pool"]
 
                 self.hcl.process_resource(
-                    "aws_vpc_ipv6_cidr_block_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_ipv6_cidr_block_association", assoc_id.replace("-", "_"), attributes, ipv6_cidr_block)
 
     def aws_vpc_peering_connection(self):
         logger.debug("Processing VPC Peering Connections...")
@@ -1370,7 +1344,7 @@ class VPC:
                 "peer_region": peering_connection["AccepterVpcInfo"]["Region"],
             }
             self.hcl.process_resource(
-                "aws_vpc_peering_connection", peering_connection_id.replace("-", "_"), attributes)
+                "aws_vpc_peering_connection", peering_connection_id.replace("-", "_"), attributes, peering_connection)
 
     def aws_vpc_peering_connection_accepter(self):
         logger.debug("Processing VPC Peering Connection Accepters...")
@@ -1391,7 +1365,7 @@ class VPC:
                 "auto_accept": True,
             }
             self.hcl.process_resource(
-                "aws_vpc_peering_connection_accepter", peering_connection_id.replace("-", "_"), attributes)
+                "aws_vpc_peering_connection_accepter", peering_connection_id.replace("-", "_"), attributes, peering_connection)
 
     def aws_vpc_peering_connection_options(self):
         logger.debug("Processing VPC Peering Connection Options...")
@@ -1407,12 +1381,11 @@ class VPC:
                 "vpc_peering_connection_id": peering_connection_id,
             }
             self.hcl.process_resource(
-                "aws_vpc_peering_connection_options", peering_connection_id.replace("-", "_"), attributes)
+                "aws_vpc_peering_connection_options", peering_connection_id.replace("-", "_"), attributes, peering_connection)
 
     def aws_vpc_security_group_egress_rule(self):
         logger.debug("Processing VPC Security Group Egress Rules...")
-        security_group_rules = self.provider_instance.aws_clients.ec2_client.describe_security_group_rules()[
-            "SecurityGroupRules"]
+        security_group_rules = self.provider_instance.network_inventory.security_group_rules()
 
         for rule in security_group_rules:
             rule_id = rule["SecurityGroupRuleId"]
@@ -1422,12 +1395,11 @@ class VPC:
                     "id": rule_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_security_group_egress_rule", rule_id.replace("-", "_"), attributes)
+                    "aws_vpc_security_group_egress_rule", rule_id.replace("-", "_"), attributes, rule)
 
     def aws_vpc_security_group_ingress_rule(self):
         logger.debug("Processing VPC Security Group Ingress Rules...")
-        security_group_rules = self.provider_instance.aws_clients.ec2_client.describe_security_group_rules()[
-            "SecurityGroupRules"]
+        security_group_rules = self.provider_instance.network_inventory.security_group_rules()
 
         for rule in security_group_rules:
             rule_id = rule["SecurityGroupRuleId"]
@@ -1437,4 +1409,4 @@ class VPC:
                     "id": rule_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_security_group_ingress_rule", rule_id.replace("-", "_"), attributes)
+                    "aws_vpc_security_group_ingress_rule", rule_id.replace("-", "_"), attributes, rule)
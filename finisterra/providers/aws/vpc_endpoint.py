@@ -1,6 +1,6 @@
 from ...utils.hcl import HCL
 from ...providers.aws.security_group import SECURITY_GROUP
-from ...providers.aws.utils import get_subnet_names
+from ...providers.aws.utils import get_subnet_names, get_vpc_name
 import logging
 import inspect
 
@@ -27,23 +27,6 @@ class VPCEndPoint:
 
         self.security_group_instance = SECURITY_GROUP(self.provider_instance, self.hcl)
 
-    def get_vpc_name(self, vpc_id):
-        response = self.provider_instance.aws_clients.ec2_client.describe_vpcs(VpcIds=[vpc_id])
-
-        if not response or 'Vpcs' not in response or not response['Vpcs']:
-            # Handle this case as required, for example:
-            logger.debug(f"No VPC information found for VPC ID: {vpc_id}")
-            return None
-
-        vpc_tags = response['Vpcs'][0].get('Tags', [])
-        vpc_name = next((tag['Value']
-                        for tag in vpc_tags if tag['Key'] == 'Name'), None)
-
-        if vpc_name is None:
-            logger.debug(f"No 'Name' tag found for VPC ID: {vpc_id}")
-
-        return vpc_name
-
     def vpc_endpoint(self):
         self.hcl.prepare_folder()
 
@@ -73,12 +56,16 @@ class VPCEndPoint:
                     logger.debug(
                         f"  Skipping VPC Endpoint: {vpce_id} - already processed")
                     return
+            inventory = self.provider_instance.network_inventory
             if vpce_id is None:
-                endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-                    "VpcEndpoints"]
+                endpoints = inventory.vpc_endpoints()
             else:
-                endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints(
-                    VpcEndpointIds=[vpce_id])["VpcEndpoints"]
+                endpoint = inventory.vpc_endpoint(vpce_id)
+                if not endpoint:
+                    logger.info(
+                        f"The VPC Endpoint ID does not exist {vpce_id}")
+                    return
+                endpoints = [endpoint]
 
             if len(endpoints) > 0 and not vpce_id:
                 self.task = self.provider_instance.progress.add_task(
@@ -106,7 +93,7 @@ class VPCEndPoint:
                             break
 
                 self.hcl.process_resource(
-                    resource_type, endpoint_id, attributes)
+                    resource_type, endpoint_id, attributes, endpoint)
                 self.hcl.add_stack(resource_type, endpoint_id, ftstack)
 
                 security_groups = endpoint.get("Groups", [])
@@ -117,7 +104,7 @@ class VPCEndPoint:
 
                 vpc_id = endpoint["VpcId"]
                 if vpc_id:
-                    vpc_name = self.get_vpc_name(vpc_id)
+                    vpc_name = get_vpc_name(self.provider_instance.aws_clients, vpc_id)
                     if vpc_name:
                         self.hcl.add_additional_data(
                             resource_type, endpoint_id, "vpc_name", vpc_name)
@@ -144,8 +131,7 @@ class VPCEndPoint:
 
     def aws_vpc_endpoint_connection_accepter(self):
         logger.debug("Processing VPC Endpoint Connection Accepters...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             if endpoint["State"] == "pendingAcceptance":
@@ -163,7 +149,7 @@ class VPCEndPoint:
                     "service_name": service_name,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_connection_accepter", accepter_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_connection_accepter", accepter_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_connection_notification(self):
         logger.debug("Processing VPC Endpoint Connection Notifications...")
@@ -187,12 +173,11 @@ class VPCEndPoint:
                 "state": notification["ConnectionNotificationState"],
             }
             self.hcl.process_resource(
-                "aws_vpc_endpoint_connection_notification", notification_id.replace("-", "_"), attributes)
+                "aws_vpc_endpoint_connection_notification", notification_id.replace("-", "_"), attributes, notification)
 
     def aws_vpc_endpoint_policy(self):
         logger.debug("Processing VPC Endpoint Policies...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -208,12 +193,11 @@ class VPCEndPoint:
                 "policy": policy_document,
             }
             self.hcl.process_resource(
-                "aws_vpc_endpoint_policy", endpoint_id.replace("-", "_"), attributes)
+                "aws_vpc_endpoint_policy", endpoint_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_route_table_association(self):
         logger.debug("Processing VPC Endpoint Route Table Associations...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -230,12 +214,11 @@ class VPCEndPoint:
                     "route_table_id": route_table_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_route_table_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_route_table_association", assoc_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_security_group_association(self):
         logger.debug("Processing VPC Endpoint Security Group Associations...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -253,7 +236,7 @@ class VPCEndPoint:
                     "security_group_id": security_group_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_security_group_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_security_group_association", assoc_id.replace("-", "_"), attributes, endpoint)
 
     def aws_vpc_endpoint_service(self):
         logger.debug("Processing VPC Endpoint Services...")
@@ -280,7 +263,7 @@ class VPCEndPoint:
                 "service_type": service["ServiceType"][0]["ServiceType"],
             }
             self.hcl.process_resource(
-                "aws_vpc_endpoint_service", service_id.replace("-", "_"), attributes)
+                "aws_vpc_endpoint_service", service_id.replace("-", "_"), attributes, service)
 
     def aws_vpc_endpoint_service_allowed_principal(self):
         logger.debug("Processing VPC Endpoint Service Allowed Principals...")
@@ -302,12 +285,11 @@ class VPCEndPoint:
                     "principal_arn": principal,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_service_allowed_principal", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_service_allowed_principal", assoc_id.replace("-", "_"), attributes, service)
 
     def aws_vpc_endpoint_subnet_association(self):
         logger.debug("Processing VPC Endpoint Subnet Associations...")
-        vpc_endpoints = self.provider_instance.aws_clients.ec2_client.describe_vpc_endpoints()[
-            "VpcEndpoints"]
+        vpc_endpoints = self.provider_instance.network_inventory.vpc_endpoints()
 
         for endpoint in vpc_endpoints:
             endpoint_id = endpoint["VpcEndpointId"]
@@ -324,4 +306,4 @@ class VPCEndPoint:
                     "subnet_id": subnet_id,
                 }
                 self.hcl.process_resource(
-                    "aws_vpc_endpoint_subnet_association", assoc_id.replace("-", "_"), attributes)
+                    "aws_vpc_endpoint_subnet_association", assoc_id.replace("-", "_"), attributes, endpoint)
@@ -1,6 +1,7 @@
 from ...utils.hcl import HCL
 from ...providers.aws.s3 import S3
 from ...providers.aws.logs import Logs
+from ...providers.aws.utils import state_payload, combined_state_payload
 from botocore.exceptions import ClientError
 import logging
 import inspect
@@ -74,7 +75,7 @@ class Wafv2:
                     "scope": scope,
                 }
                 self.hcl.process_resource(
-                    "aws_wafv2_ip_set", ip_set_name, attributes)
+                    "aws_wafv2_ip_set", ip_set_name, attributes, self.tagged_payload(ip_set, ip_set["ARN"]))
 
     # def aws_wafv2_regex_pattern_set(self):
     #     logger.debug("Processing WAFv2 Regex Pattern Sets...")
@@ -99,6 +100,12 @@ class Wafv2:
     #         self.hcl.process_resource(
     #             "aws_wafv2_regex_pattern_set", regex_pattern_set_id.replace("-", "_"), attributes)
 
+    def tagged_payload(self, item, arn):
+        """The WAFv2 item with its tags, None if they cannot be listed."""
+        return combined_state_payload(
+            item=item, tags=state_payload(self.provider_instance.aws_clients.wafv2_client.list_tags_for_resource,
+                                          "TagInfoForResource.TagList", ResourceARN=arn))
+
     def aws_wafv2_rule_group(self, rule_group_arn):
         scope = rule_group_arn.split(":")[5]
         rule_group_id = rule_group_arn.split("/")[-1]
@@ -114,7 +121,7 @@ class Wafv2:
             "scope": scope,
         }
         self.hcl.process_resource(
-            "aws_wafv2_rule_group", rule_group_name, attributes)
+            "aws_wafv2_rule_group", rule_group_name, attributes, self.tagged_payload(rule_group_info, rule_group_info["ARN"]))
 
     def aws_wafv2_web_acl(self, web_acl_id=None, ftstack=None):
         logger.debug("Processing WAFv2 Web ACLs...")
@@ -185,7 +192,7 @@ class Wafv2:
             "scope": scope,
         }
         self.hcl.process_resource(
-            resource_type, id, attributes)
+            resource_type, id, attributes, self.tagged_payload(web_acl_info, web_acl_info["ARN"]))
         self.hcl.add_stack(resource_type, id, ftstack)
 
         # call the other functions with appropriate arguments
@@ -219,7 +226,7 @@ class Wafv2:
                             "resource_arn": resource_arn,
                         }
                         self.hcl.process_resource(
-                            "aws_wafv2_web_acl_association", association_id.replace("-", "_"), attributes)
+                            "aws_wafv2_web_acl_association", association_id.replace("-", "_"), attributes, association)
                 except Exception as e:
                     if e.response['Error']['Code'] == 'WAFNonexistentItemException':
                         pass
@@ -254,7 +261,7 @@ class Wafv2:
                     "id": web_acl_arn,
                 }
                 self.hcl.process_resource(
-                    "aws_wafv2_web_acl_logging_configuration", config_id.replace("-", "_"), attributes)
+                    "aws_wafv2_web_acl_logging_configuration", config_id.replace("-", "_"), attributes, logging_config)
         except self.provider_instance.aws_clients.wafv2_client.exceptions.WAFNonexistentItemException:
             logger.debug(
                 f"  No logging configuration found for Web ACL: {web_acl_id}")
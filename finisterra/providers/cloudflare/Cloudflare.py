@@ -13,7 +13,7 @@ logger = logging.getLogger('finisterra')
 
 
 class Cloudflare:
-    def __init__(self, progress, script_dir, output_dir, filters):
+    def __init__(self, progress, script_dir, output_dir, filters, cassette=None):
         self.progress = progress
         self.output_dir = output_dir
         self.provider_name = "registry.terraform.io/cloudflare/cloudflare"
@@ -25,7 +25,7 @@ class Cloudflare:
         self.schema_data = load_provider_schema(self.script_dir, self.provider_name_short,
                                                 self.provider_source, self.provider_version)
 
-        self.cf_clients = CFClients()
+        self.cf_clients = CFClients(cassette)
         self.account_name = self.get_account_name()
 
     def get_account_name(self):
@@ -2,5 +2,7 @@ import CloudFlare
 
 
 class CFClients:
-    def __init__(self):
+    def __init__(self, cassette=None):
         self.cf = CloudFlare.CloudFlare(raw=True)
+        if cassette:
+            self.cf = cassette.wrap(self.cf)
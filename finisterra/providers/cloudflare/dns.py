@@ -1,10 +1,40 @@
 from ...utils.hcl import HCL
+from ...utils.native_state import native_builder
 import logging
 import inspect
 
 logger = logging.getLogger('finisterra')
 
 
+@native_builder("cloudflare_record")
+def record_state(attributes, payload):
+    # payload is the DNS records API record, the provider versions of ~> 4.0
+    # name the record content "value" or "content", the schema keeps its own
+    if payload.get("data"):
+        # SRV, CAA, LOC, ... records keep their fields in a data block
+        return None
+    metadata = {key: str(value).lower() if isinstance(value, bool) else str(value)
+                for key, value in (payload.get("meta") or {}).items()}
+    return {
+        "zone_id": attributes["zone_id"],
+        "allow_overwrite": False,
+        "comment": payload.get("comment") or "",
+        "content": payload["content"],
+        "created_on": payload.get("created_on", ""),
+        "hostname": payload["name"],
+        "metadata": metadata,
+        "modified_on": payload.get("modified_on", ""),
+        "name": payload["name"],
+        "priority": payload.get("priority"),
+        "proxiable": payload.get("proxiable", False),
+        "proxied": payload.get("proxied", False),
+        "tags": payload.get("tags") or [],
+        "ttl": payload.get("ttl"),
+        "type": payload["type"],
+        "value": payload["content"],
+    }
+
+
 class DNS:
     def __init__(self, provider_instance, hcl=None):
         self.provider_instance = provider_instance
@@ -55,21 +85,44 @@ class DNS:
             self.process_single_cloudflare_zone(zone_id, ftstack)
             return
 
-        zones = self.provider_instance.cf_clients.cf.zones.get()
-        total = 0
-        for zone in zones['result']:
-            total += 1
-
-        if total > 0:
-            self.task = self.provider_instance.progress.add_task(
-                f"[cyan]Processing {self.__class__.__name__}...", total=total)
-        for zone in zones['result']:
+        for zone in self.zones():
             zone_id = zone['id']
             self.provider_instance.progress.update(
                 self.task, advance=1, description=f"[cyan]{self.__class__.__name__} [bold]{zone['name']}[/]")
-            self.process_single_cloudflare_zone(zone_id, zone['name'], ftstack)
+            self.process_single_cloudflare_zone(zone_id, zone['name'], ftstack, zone)
+
+    def zones(self):
+        """
+        Yields the account zones page by page, adding the progress task with
+        the first page and raising its total as the next ones arrive.
+        """
+        page_number = 0
+        total = 0
+        while True:
+            page_number += 1
+            params = {
+                'per_page': 50,
+                'page': page_number
+            }
+            raw_response = self.provider_instance.cf_clients.cf.zones.get(
+                params=params)
+
+            zones = raw_response['result']
+            if zones:
+                if total == 0:
+                    self.task = self.provider_instance.progress.add_task(
+                        f"[cyan]Processing {self.__class__.__name__}...", total=len(zones))
+                else:
+                    self.provider_instance.progress.update(
+                        self.task, total=total + len(zones))
+                total += len(zones)
+            yield from zones
+
+            total_pages = raw_response['result_info']['total_pages']
+            if page_number >= total_pages:
+                break
 
-    def process_single_cloudflare_zone(self, zone_id, zone_name, ftstack=None):
+    def process_single_cloudflare_zone(self, zone_id, zone_name, ftstack=None, zone=None):
         resource_name = "cloudflare_zone"
 
         logger.debug(f"Processing {resource_name}: {zone_name}")
@@ -81,7 +134,7 @@ class DNS:
         }
 
         self.hcl.process_resource(
-            resource_name, zone_id.replace("-", "_"), attributes)
+            resource_name, zone_id.replace("-", "_"), attributes, zone)
         self.hcl.add_stack(resource_name, id, ftstack)
         self.cloudflare_record(zone_id, zone_name)
 
@@ -113,7 +166,7 @@ class DNS:
                     "zone_id": zone_id,
                 }
                 self.hcl.process_resource(
-                    resource_name, id.replace("-", "_"), attributes)
+                    resource_name, id.replace("-", "_"), attributes, record)
                 self.hcl.add_additional_data(
                     resource_name, id, "zone_name", zone_name)
 
@@ -0,0 +1,141 @@
+import json
+import threading
+import time
+import logging
+
+from botocore import xform_name
+
+from ..providers.aws.api_cache import THROTTLING_ERRORS, error_code
+
+logger = logging.getLogger('finisterra')
+
+# Name of the module (vpc, s3, ...) the current thread is discovering
+_context = threading.local()
+
+
+def set_current_module(module):
+    _context.module = module
+
+
+def get_current_module():
+    return getattr(_context, "module", None)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0
+    values = sorted(values)
+    index = max(0, int(round(pct / 100 * len(values))) - 1)
+    return values[index]
+
+
+class OperationStats:
+    def __init__(self):
+        self.calls = 0
+        self.cached = 0
+        self.pages = 0
+        self.retries = 0
+        self.throttles = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latencies = []
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "cached": self.cached,
+            "pages": self.pages,
+            "retries": self.retries,
+            "throttles": self.throttles,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "latency_ms": {
+                "p50": round(percentile(self.latencies, 50) * 1000, 1),
+                "p90": round(percentile(self.latencies, 90) * 1000, 1),
+                "p99": round(percentile(self.latencies, 99) * 1000, 1),
+                "max": round(max(self.latencies, default=0) * 1000, 1),
+            },
+        }
+
+
+class ApiMetrics:
+    """
+    Counts calls, pages, retries, throttles, bytes and latency of every AWS
+    call per (service, operation, module), using botocore's event system on
+    the clients built by AwsClients.
+
+    Calls answered without the network (ApiCache, replay) count as cached.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def register(self, client):
+        service_name = client.meta.service_model.service_name
+        paginated = {}
+
+        def can_paginate(operation_name):
+            if operation_name not in paginated:
+                paginated[operation_name] = client.can_paginate(
+                    xform_name(operation_name))
+            return paginated[operation_name]
+
+        def before_parameter_build(model, context, **kwargs):
+            context['ft_metrics_operation'] = model.name
+            context['ft_metrics_start'] = time.perf_counter()
+
+        def after_call(http_response, parsed, model, context, **kwargs):
+            latency = time.perf_counter() - context.get('ft_metrics_start', time.perf_counter())
+            with self.lock:
+                stats = self.operation(service_name, model.name)
+                stats.calls += 1
+                stats.latencies.append(latency)
+                if can_paginate(model.name):
+                    stats.pages += 1
+                if http_response.status_code >= 300:
+                    stats.errors += 1
+                if http_response.raw is None:
+                    stats.cached += 1
+                else:
+                    stats.retries += parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                    stats.bytes += len(http_response.content or b"")
+
+        def after_call_error(context, **kwargs):
+            with self.lock:
+                stats = self.operation(service_name, context.get('ft_metrics_operation', 'Unknown'))
+                stats.calls += 1
+                stats.errors += 1
+
+        def needs_retry(response=None, operation=None, **kwargs):
+            if response is None:
+                return
+            http_response, parsed = response
+            if http_response.status_code == 429 or error_code(parsed) in THROTTLING_ERRORS:
+                with self.lock:
+                    self.operation(service_name, operation.name).throttles += 1
+
+        events = client.meta.events
+        events.register('before-parameter-build', before_parameter_build)
+        events.register('after-call', after_call)
+        events.register('after-call-error', after_call_error)
+        events.register('needs-retry', needs_retry)
+
+    def operation(self, service_name, operation_name):
+        key = (service_name, operation_name, get_current_module())
+        if key not in self.stats:
+            self.stats[key] = OperationStats()
+        return self.stats[key]
+
+    def to_list(self):
+        with self.lock:
+            items = [dict(service=service, operation=operation, module=module, **stats.to_dict())
+                     for (service, operation, module), stats in self.stats.items()]
+        return sorted(items, key=lambda item: item["calls"], reverse=True)
+
+    def save(self, path):
+        metrics = self.to_list()
+        with open(path, "w") as f:
+            json.dump({"operations": metrics}, f, indent=2)
+        total = sum(item["calls"] for item in metrics)
+        logger.info(f"API metrics for {total} calls written to {path}")
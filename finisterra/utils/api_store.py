@@ -0,0 +1,84 @@
+import base64
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+
+logger = logging.getLogger('finisterra')
+
+
+def encode_value(value):
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode()}
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def decode_value(value):
+    if "__datetime__" in value:
+        return datetime.datetime.fromisoformat(value["__datetime__"])
+    if "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    return value
+
+
+def dumps_response(response):
+    return json.dumps(response, default=encode_value, separators=(',', ':'))
+
+
+def loads_response(data):
+    return json.loads(data, object_hook=decode_value)
+
+
+def hash_key(key):
+    return hashlib.sha256(json.dumps(key, default=str).encode()).hexdigest()
+
+
+class ApiStore:
+    """
+    Compact on-disk store of API responses, one zlib-compressed JSON row per
+    call in a SQLite database, used to serve re-runs while entries are fresh.
+    """
+
+    def __init__(self, cache_dir, ttl):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "api_cache.sqlite")
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, status INTEGER, body BLOB)")
+        self.conn.execute(
+            "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,))
+        self.conn.commit()
+        logger.debug(f"API response store: {self.path}")
+
+    def get(self, key):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT created, status, body FROM responses WHERE key = ?", (hash_key(key),)).fetchone()
+        if not row:
+            return None
+        created, status, body = row
+        if created < time.time() - self.ttl:
+            return None
+        return status, loads_response(zlib.decompress(body))
+
+    def put(self, key, status, response):
+        body = zlib.compress(dumps_response(response).encode())
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                              (hash_key(key), time.time(), status, body))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,125 @@
+import copy
+import gzip
+import json
+import os
+import threading
+import logging
+
+from botocore.awsrequest import AWSResponse
+
+from ..utils.api_store import dumps_response, loads_response, hash_key
+from ..providers.aws.api_cache import cache_key
+
+logger = logging.getLogger('finisterra')
+
+CLOUDFLARE_VERBS = ("get", "post", "put", "patch", "delete")
+
+
+class CassetteMiss(Exception):
+    pass
+
+
+class Cassette:
+    """
+    Records every AWS (botocore) and Cloudflare response of a run into
+    ``<dir>/<name>.json.gz`` and serves them back on replay, without any
+    network access, so discovery can be benchmarked against a frozen account.
+    """
+
+    def __init__(self, cassette_dir, mode, name="cassette"):
+        # Absolute, it is saved long after the options were parsed
+        self.path = os.path.abspath(
+            os.path.join(cassette_dir, f"{name}.json.gz"))
+        self.mode = mode
+        self.entries = {}
+        self.lock = threading.Lock()
+        if self.replaying:
+            with gzip.open(self.path, "rt") as f:
+                self.entries = loads_response(f.read())
+            logger.info(
+                f"Replaying {len(self.entries)} API responses from {self.path}")
+        else:
+            os.makedirs(cassette_dir, exist_ok=True)
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    def record(self, key, status, response):
+        with self.lock:
+            self.entries[hash_key(key)] = {
+                "status": status, "response": copy.deepcopy(response)}
+
+    def lookup(self, key):
+        entry = self.entries.get(hash_key(key))
+        if entry is None:
+            raise CassetteMiss(f"No recorded response for {key}")
+        return entry["status"], copy.deepcopy(entry["response"])
+
+    def save(self):
+        if self.replaying:
+            return
+        with self.lock:
+            data = dumps_response(self.entries)
+        with gzip.open(self.path, "wt") as f:
+            f.write(data)
+        logger.info(f"Recorded {len(self.entries)} API responses to {self.path}")
+
+    # botocore clients
+
+    def register(self, client):
+        events = client.meta.events
+        events.register('before-parameter-build', self.before_parameter_build)
+        if self.replaying:
+            events.register('before-call', self.before_call)
+        else:
+            events.register('after-call', self.after_call)
+
+    def before_parameter_build(self, params, model, context, **kwargs):
+        context['ft_cassette_key'] = cache_key(model, params, context)
+
+    def before_call(self, context, **kwargs):
+        try:
+            status, response = self.lookup(context['ft_cassette_key'])
+        except CassetteMiss as e:
+            # Surface as a ClientError so callers handle it like any API error
+            logger.warning(str(e))
+            status = 404
+            response = {"Error": {"Code": "CassetteMiss", "Message": str(e)},
+                        "ResponseMetadata": {"HTTPStatusCode": status}}
+        return AWSResponse(None, status, {}, None), response
+
+    def after_call(self, http_response, parsed, context, **kwargs):
+        self.record(context['ft_cassette_key'],
+                    http_response.status_code, parsed)
+
+    # Cloudflare clients
+
+    def wrap(self, target, path="cloudflare"):
+        return CassetteProxy(self, target, path)
+
+    def call(self, key, fetch):
+        if self.replaying:
+            return self.lookup(key)[1]
+        response = fetch()
+        self.record(key, 200, response)
+        return response
+
+
+class CassetteProxy:
+    """Wraps a CloudFlare.CloudFlare endpoint tree, recording or replaying its calls."""
+
+    def __init__(self, cassette, target, path):
+        self._cassette = cassette
+        self._target = target
+        self._path = path
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name in CLOUDFLARE_VERBS:
+            def call(*args, **kwargs):
+                key = (self._path, name, json.dumps(
+                    [args, kwargs], sort_keys=True, default=str))
+                return self._cassette.call(key, lambda: attr(*args, **kwargs))
+            return call
+        return CassetteProxy(self._cassette, attr, f"{self._path}.{name}")
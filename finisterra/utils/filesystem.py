@@ -1,10 +1,17 @@
 import os
+import re
+import glob
+import shutil
+import tempfile
+import threading
 import subprocess
 import json
 import logging
 
 logger = logging.getLogger('finisterra')
 
+_plugin_cache_lock = threading.Lock()
+
 
 def create_version_file(path, provider_name, provider_source, provider_version):
     file_name = os.path.join(path, "versions.tf")
@@ -24,6 +31,10 @@ def load_provider_schema(script_dir,  provider_name, provider_source, provider_v
     if os.environ.get('FT_CACHE_DIR', '') != '':
         cache_dir = os.environ.get('FT_CACHE_DIR')
 
+    # Providers are kept in the shared plugin cache and mirror for every
+    # terraform working directory of the run, and the next runs
+    prepare_provider(provider_name, provider_source, provider_version)
+
     # Save current folder
     temp_file = os.path.join(
         cache_dir, f'terraform_providers_schema_{provider_name}.json')
@@ -35,15 +46,125 @@ def load_provider_schema(script_dir,  provider_name, provider_source, provider_v
 
         logger.info("Initializing Terraform...")
         subprocess.run(["terraform", "init"], check=True,
-                       cwd=cache_dir, stdout=subprocess.PIPE)
+                       cwd=cache_dir, env=terraform_env(), stdout=subprocess.PIPE)
 
         logger.info("Loading provider schema...")
         with open(temp_file, 'w') as output:
             subprocess.run(["terraform", "providers", "schema",
-                            "-json"], check=True, stdout=output, cwd=cache_dir)
+                            "-json"], check=True, stdout=output, cwd=cache_dir, env=terraform_env())
 
     # Load the schema data from the newly created file
     with open(temp_file, "r") as schema_file:
         schema_data = json.load(schema_file)
 
     return schema_data
+
+
+def cache_root():
+    """FT_CACHE_DIR, or the user's cache directory (~/.cache/finisterra)."""
+    if os.environ.get('FT_CACHE_DIR', '') != '':
+        return os.environ.get('FT_CACHE_DIR')
+    user_cache = os.environ.get(
+        'XDG_CACHE_HOME') or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(user_cache, "finisterra")
+
+
+def plugin_cache_dir():
+    path = os.path.join(cache_root(), "terraform", "plugin-cache")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def mirror_dir():
+    path = os.path.join(cache_root(), "terraform", "providers")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cli_config_path():
+    return os.path.join(cache_root(), "terraform", "terraform.rc")
+
+
+def user_cli_config():
+    """Whether the user has a terraform CLI config file of their own."""
+    if os.environ.get('TF_CLI_CONFIG_FILE'):
+        return True
+    if os.name == "nt":
+        path = os.path.join(os.environ.get('APPDATA', ''), "terraform.rc")
+    else:
+        path = os.path.join(os.path.expanduser("~"), ".terraformrc")
+    return os.path.isfile(path)
+
+
+def mirrored_sources():
+    """Provider sources (hostname/namespace/type) present in the mirror."""
+    root = mirror_dir()
+    return sorted(os.path.relpath(path, root).replace(os.sep, "/")
+                  for path in glob.glob(os.path.join(root, "*", "*", "*")) if os.path.isdir(path))
+
+
+def write_cli_config():
+    """
+    Installs the mirrored providers from disk, the registry stays the
+    fallback (e.g. for another version of a mirrored provider).
+    """
+    sources = mirrored_sources()
+    if not sources:
+        return
+    include = ", ".join(f'"{source}"' for source in sources)
+    with open(cli_config_path(), "w") as f:
+        f.write('provider_installation {\n')
+        f.write('  filesystem_mirror {\n')
+        f.write(f'    path    = "{mirror_dir()}"\n')
+        f.write(f'    include = [{include}]\n')
+        f.write('  }\n')
+        f.write('  direct {}\n')
+        f.write('}\n')
+
+
+def terraform_env(use_mirror=True):
+    """
+    Environment for every terraform/terragrunt subprocess: providers are
+    linked from the shared plugin cache and installed from the local mirror,
+    so init does not download them again. Settings already in the
+    environment win, and the mirror is not used when the user has a CLI
+    config file (it may hold credentials or provider_installation blocks).
+    """
+    env = dict(os.environ)
+    env.setdefault('TF_PLUGIN_CACHE_DIR', plugin_cache_dir())
+    # Working directories are temporary and have no lock file to verify against
+    env.setdefault('TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE', 'true')
+    env.setdefault('TF_IN_AUTOMATION', 'true')
+    if use_mirror and os.path.isfile(cli_config_path()) and not user_cli_config():
+        env['TF_CLI_CONFIG_FILE'] = cli_config_path()
+    return env
+
+
+def prepare_provider(provider_name, provider_source, provider_version):
+    """
+    Mirrors the provider into the local filesystem mirror and the plugin
+    cache, once per provider version. Runs before modules start, the plugin
+    cache is not safe for concurrent installs of the same provider.
+    """
+    marker = os.path.join(mirror_dir(), ".{}-{}".format(
+        provider_name, re.sub(r'[^\w.]+', '_', provider_version)))
+    with _plugin_cache_lock:
+        if os.path.isfile(marker):
+            return
+        work_dir = tempfile.mkdtemp()
+        try:
+            create_version_file(work_dir, provider_name,
+                                provider_source, provider_version)
+            logger.info(f"Caching the {provider_source} provider...")
+            subprocess.run(["terraform", "providers", "mirror", mirror_dir()], check=True,
+                           cwd=work_dir, env=terraform_env(use_mirror=False), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            write_cli_config()
+            # Unpack it once into the plugin cache, later inits only link it
+            subprocess.run(["terraform", "init", "-no-color"], check=True,
+                           cwd=work_dir, env=terraform_env(), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            open(marker, "w").close()
+        except (OSError, subprocess.CalledProcessError) as e:
+            # Still usable, terraform falls back to the registry
+            logger.debug(f"Could not cache the {provider_source} provider: {e}")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
@@ -21,7 +21,7 @@ logger = logging.getLogger('finisterra')
 class GithubUtils:
     def __init__(self, repository_name):
         self.repository_name = repository_name
-        pass
+        self.aws_session = None
 
     def wait_for_enter(self, message, url):
         logger.info(f"{message}")
@@ -211,8 +211,9 @@ class GithubUtils:
     def check_aws_gh_role(self):
         role_name = "ft-rw-gha-cicd-role"
         logger.debug(f"Checking if the IAM role '{role_name}' exists...")
-        session = boto3.Session()
-        aws_clients = AwsClients(session, "us-east-1")
+        if not self.aws_session:
+            self.aws_session = boto3.Session()
+        aws_clients = AwsClients(self.aws_session, "us-east-1")
         try:
             response = aws_clients.iam_client.get_role(RoleName=role_name)
             # If the call above doesn't raise an exception, the role exists
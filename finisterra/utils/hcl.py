@@ -1,18 +1,85 @@
-from ..utils.filesystem import create_version_file
+from ..utils.filesystem import create_version_file, terraform_env
+from ..utils.native_state import build_state
+from ..utils.state_cache import StateCache, state_fingerprint
+from ..utils.retry import backoff_delay, is_transient, run_with_retries
 from ..utils.auth import read_token_from_file
 import subprocess
 import os
 import re
 import shutil
 import tempfile
+import threading
 import json
 import http.client
 import zipfile
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger('finisterra')
 
+# Fewest resources worth a terraform refresh of their own
+MIN_SHARD_SIZE = 100
+
+# Retries of the resources failing to refresh with a transient error
+REFRESH_RETRIES = 3
+
+
+def default_refresh_concurrency():
+    """At least one refresh per module running at once, or per CPU."""
+    cpus = os.cpu_count() or 1
+    max_parallel = int(os.getenv('MAX_PARALLEL', max(5, cpus)))
+    return max(max_parallel, cpus)
+
+
+# Concurrent terraform refreshes of the whole run (all modules and shards)
+_refresh_slots = threading.BoundedSemaphore(
+    max(1, int(os.getenv('FT_REFRESH_CONCURRENCY', default_refresh_concurrency()))))
+
+
+def default_refresh_shards():
+    """One shard per CPU, MIN_SHARD_SIZE keeps small modules whole."""
+    return os.cpu_count() or 1
+
+
+def resource_address(resource):
+    """Terraform address of a state resource."""
+    address = f"{resource['type']}.{resource['name']}"
+    return f"{resource['module']}.{address}" if resource.get("module") else address
+
+
+def refresh_errors(output):
+    """
+    Errors of a failed `terraform apply -json` by resource address (None for
+    the ones without), as (message, transient). Resources whose refresh was
+    started but never completed count as interrupted, which is transient.
+    """
+    errors = {}
+    started = set()
+    for line in output.splitlines():
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if message.get("type") == "diagnostic":
+            diagnostic = message.get("diagnostic", {})
+            if diagnostic.get("severity") != "error":
+                continue
+            text = f"{diagnostic.get('summary', '')}: {diagnostic.get('detail', '')}".strip(": ")
+            address = diagnostic.get("address")
+            if address:
+                errors[address] = (text, is_transient(text))
+            else:
+                errors.setdefault(None, []).append((text, is_transient(text)))
+        elif message.get("type") == "refresh_start":
+            started.add(message["hook"]["resource"]["addr"])
+        elif message.get("type") == "refresh_complete":
+            started.discard(message["hook"]["resource"]["addr"])
+    if any(address is not None for address in errors):
+        for address in started:
+            errors.setdefault(address, ("refresh interrupted", True))
+    return errors
+
 
 class HCL:
     def __init__(self, schema_data):
@@ -35,6 +102,15 @@ class HCL:
             "resources": []
         }
         self.state_instances = {}
+        # (type, name, id) of the resources whose state was built natively
+        self.native_resources = set()
+        # (type, name, id) -> fingerprint of the resources discovered with a
+        # payload, and the ones unchanged since the last run (see StateCache)
+        self.fingerprints = {}
+        self.cached_resources = set()
+        self.state_cache = None
+        # Modules may discover resources from several threads (--inner-parallel)
+        self.lock = threading.RLock()
 
     def search_state_file(self, resource_type, resource_name, resource_id):
         # Search for the resource in the state
@@ -44,9 +120,29 @@ class HCL:
                     return True
         return False
 
-    def create_state_file(self, resource_type, resource_name, attributes):
-        schema_version = int(self.schema_data['provider_schemas'][self.provider_name]
-                             ['resource_schemas'][resource_type]['version'])
+    def create_state_file(self, resource_type, resource_name, attributes, payload=None):
+        resource_schema = self.schema_data['provider_schemas'][self.provider_name]['resource_schemas'][resource_type]
+        schema_version = int(resource_schema['version'])
+
+        instance = {
+            "schema_version": schema_version,
+            "attributes": attributes
+        }
+        native_attributes = build_state(
+            resource_schema, resource_type, attributes, payload)
+        address = (resource_type, resource_name, attributes["id"])
+        if native_attributes is not None:
+            instance["attributes"] = native_attributes
+            instance["sensitive_attributes"] = []
+            self.native_resources.add(address)
+        elif payload is not None:
+            fingerprint = state_fingerprint(resource_schema, attributes, payload)
+            self.fingerprints[address] = fingerprint
+            cached_instance = self.get_state_cache().get(
+                resource_type, attributes["id"], fingerprint)
+            if cached_instance is not None:
+                instance = cached_instance
+                self.cached_resources.add(address)
 
         key = f"{resource_type}_{resource_name}"
         module = ""
@@ -61,12 +157,7 @@ class HCL:
             "type": resource_type,
             "name": resource_name,
             "provider": f"provider[\"{self.provider_name}\"]",
-            "instances": [
-                {
-                    "schema_version": schema_version,
-                    "attributes": attributes
-                }
-            ]
+            "instances": [instance]
         }
         self.state_data['resources'].append(resource)
         if resource_type not in self.state_instances:
@@ -76,6 +167,12 @@ class HCL:
         if attributes["id"] not in self.state_instances[resource_type][resource_name]:
             self.state_instances[resource_type][resource_name][attributes["id"]] = True
 
+    def get_state_cache(self):
+        if self.state_cache is None:
+            self.state_cache = StateCache(
+                self.provider_name_short, self.account_id or self.account_name, self.region)
+        return self.state_cache
+
     def replace_special_chars(self, input_string):
         # Define a mapping of special characters to their ASCII representations
         ascii_map = {
@@ -100,14 +197,21 @@ class HCL:
         else:
             return string
 
-    def process_resource(self, resource_type, resource_name, attributes):
+    def process_resource(self, resource_type, resource_name, attributes, payload=None):
+        """
+        Adds the resource to the state. `payload` is the discovery data of the
+        resource, if it has a native_builder its state is built from it
+        instead of being refreshed by terraform, otherwise the refreshed state
+        is cached and reused while the payload does not change.
+        """
         resource_id = attributes["id"]
         resource_name = self.add_underscore(
             self.replace_special_chars(resource_name))
-        # search if resource exists in the state
-        if not self.search_state_file(resource_type, resource_name, resource_id):
-            self.create_state_file(
-                resource_type, resource_name, attributes)
+        with self.lock:
+            # search if resource exists in the state
+            if not self.search_state_file(resource_type, resource_name, resource_id):
+                self.create_state_file(
+                    resource_type, resource_name, attributes, payload)
 
     def count_state(self):
         resource_count = {}
@@ -143,43 +247,50 @@ class HCL:
             logger.debug("No state file found.")
             return 0
 
-        with open(self.terraform_state_file, 'w') as state_file:
-            json.dump(self.state_data, state_file, indent=2)
-
-        # Initializing Terraform with a retry mechanism
-        logger.debug("Initializing Terraform...")
-        try:
-            subprocess.run(["terraform", "init", "-no-color"], cwd=self.script_dir,
-                           check=True, stdout=subprocess.DEVNULL)
-        except subprocess.CalledProcessError:
-            logger.debug("Terraform init failed, retrying in 5 seconds...")
-            time.sleep(5)
-            try:
-                subprocess.run(["terraform", "init"], cwd=self.script_dir,
-                               check=True, stdout=subprocess.DEVNULL)
-            except subprocess.CalledProcessError:
-                logger.error("Terraform init failed on retry.")
-                return
-
-        logger.debug("Refreshing state...")
-        try:
-            subprocess.run(["terraform", "refresh", "-no-color"], cwd=self.script_dir,
-                           check=True, stdout=subprocess.DEVNULL)
-        except subprocess.CalledProcessError:
-            logger.debug("Terraform refresh failed, retrying in 5 seconds...")
-            time.sleep(5)
+        # Resources built natively or unchanged since the last run are not refreshed
+        prebuilt_addresses = self.native_resources | self.cached_resources
+        prebuilt = []
+        pending = []
+        for resource in self.state_data["resources"]:
+            if self.address(resource) in prebuilt_addresses:
+                prebuilt.append(resource)
+            else:
+                pending.append(resource)
+        if prebuilt:
+            logger.debug(
+                f"{len(self.native_resources)} resources built natively, {len(self.cached_resources)} "
+                f"unchanged since the last run, refreshing {len(pending)}")
+
+        # (state, {address: error} of its resources terraform could not refresh)
+        results = []
+        if pending:
+            shards = self.state_shards(pending)
+            if len(shards) == 1:
+                with open(self.terraform_state_file, 'w') as state_file:
+                    json.dump(dict(self.state_data, resources=pending),
+                              state_file, indent=2)
+                failed = self.terraform_refresh(self.script_dir)
+                with open(self.terraform_state_file, "r") as state_file:
+                    results.append((json.load(state_file), failed))
+            else:
+                results = self.refresh_shards(shards)
+        self.write_state([state for state, _ in results], prebuilt)
+        failed = {}
+        for _, state_failed in results:
+            failed.update(state_failed)
+        self.save_state_cache([state for state, _ in results], failed)
+        if failed:
+            logger.error(
+                f"{len(failed)} resources could not be refreshed, they keep their discovered attributes:")
+            for address, error in failed.items():
+                logger.error(f"  {address}: {error.splitlines()[0] if error else ''}")
+
+        # Attempt to remove the backup state file (sharded refreshes leave none)
+        if os.path.exists(self.terraform_state_file + ".backup"):
             try:
-                subprocess.run(["terraform", "refresh", "-no-color"], cwd=self.script_dir,
-                               check=True, stdout=subprocess.DEVNULL)
-            except subprocess.CalledProcessError:
-                logger.error("Terraform refresh failed on retry.")
-
-        # Attempt to remove the backup state file
-        try:
-            subprocess.run(
-                ["rm", self.terraform_state_file + ".backup"], check=True)
-        except Exception as e:
-            logger.debug(f"Could not remove backup state file: {e}")
+                os.remove(self.terraform_state_file + ".backup")
+            except OSError as e:
+                logger.debug(f"Could not remove backup state file: {e}")
 
         logger.debug("Counting resources in state file...")
         resources_count = self.count_state_file()
@@ -196,6 +307,205 @@ class HCL:
         # logger.debug(
         #     f"State file refreshed {os.path.join(self.script_dir, 'terraform.tfstate')}")
 
+    def terraform_refresh(self, work_dir):
+        """
+        Inits and refreshes the state of work_dir. Resources failing to refresh
+        are set aside so the others refresh, and retried with backoff while
+        their error is transient. Failed resources stay unrefreshed in the state,
+        returns {address: error} of those.
+        """
+        state_file_path = os.path.join(work_dir, "terraform.tfstate")
+        with open(state_file_path, "r") as state_file:
+            state = json.load(state_file)
+
+        logger.debug("Initializing Terraform...")
+        try:
+            run_with_retries(["terraform", "init", "-no-color"], cwd=work_dir,
+                             env=terraform_env(), stdout=subprocess.DEVNULL)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Terraform init failed: {e.stderr.decode('utf-8', 'replace').strip()}")
+            return {resource_address(resource): "terraform init failed"
+                    for resource in state["resources"]}
+
+        logger.debug("Refreshing state...")
+        refreshed, failed = self.refresh_resources(
+            work_dir, state, state["resources"])
+
+        # Failed resources keep their discovered attributes
+        position = {resource_address(resource): index for index,
+                    resource in enumerate(state["resources"])}
+        resources = refreshed + [resource for resource in state["resources"]
+                                 if resource_address(resource) in failed]
+        resources.sort(key=lambda resource: position.get(
+            resource_address(resource), len(position)))
+        with open(state_file_path, 'w') as state_file:
+            # Refresh bumps the serial
+            json.dump(dict(state, resources=resources, serial=state.get("serial", 0) + 1),
+                      state_file, indent=2)
+        return failed
+
+    def refresh_resources(self, work_dir, state, resources, attempt=0):
+        """
+        Refreshes `resources` in work_dir, returns the refreshed resources and
+        {address: error} of the ones that failed.
+        """
+        refreshed_state, errors, stderr = self.refresh_attempt(
+            work_dir, state, resources)
+        if refreshed_state is not None:
+            return refreshed_state.get("resources", []), {}
+
+        addresses = {resource_address(resource) for resource in resources}
+        resource_errors = {address: error for address,
+                           error in errors.items() if address in addresses}
+        global_errors = errors.get(None, [])
+
+        if resource_errors:
+            # Refresh the others without the failing resources, then retry these
+            failing = [resource for resource in resources
+                       if resource_address(resource) in resource_errors]
+            others = [resource for resource in resources
+                      if resource_address(resource) not in resource_errors]
+            refreshed, failed = self.refresh_resources(
+                work_dir, state, others, attempt) if others else ([], {})
+            retry = []
+            for resource in failing:
+                message, transient = resource_errors[resource_address(resource)]
+                if transient and attempt < REFRESH_RETRIES:
+                    retry.append(resource)
+                else:
+                    failed[resource_address(resource)] = message
+            if retry:
+                retried, retry_failed = self.retry_resources(
+                    work_dir, state, retry, attempt)
+                refreshed.extend(retried)
+                failed.update(retry_failed)
+            return refreshed, failed
+
+        if global_errors:
+            message = "; ".join(message for message, _ in global_errors)
+            if all(transient for _, transient in global_errors) and attempt < REFRESH_RETRIES:
+                return self.retry_resources(work_dir, state, resources, attempt)
+            return [], {address: message for address in addresses}
+
+        # Nothing tells which resources failed (e.g. a provider crash), bisect them
+        if len(resources) == 1:
+            return [], {resource_address(resources[0]): stderr.strip() or "terraform refresh failed"}
+        half = len(resources) // 2
+        refreshed, failed = self.refresh_resources(
+            work_dir, state, resources[:half], attempt)
+        right_refreshed, right_failed = self.refresh_resources(
+            work_dir, state, resources[half:], attempt)
+        return refreshed + right_refreshed, {**failed, **right_failed}
+
+    def retry_resources(self, work_dir, state, resources, attempt):
+        delay = backoff_delay(attempt)
+        logger.debug(
+            f"Retrying the refresh of {len(resources)} resources in {delay:.1f}s...")
+        time.sleep(delay)
+        return self.refresh_resources(work_dir, state, resources, attempt + 1)
+
+    def refresh_attempt(self, work_dir, state, resources):
+        """
+        One refresh-only apply of `resources` in work_dir. Returns the refreshed
+        state, or None, the errors (see refresh_errors) and terraform's stderr.
+        """
+        state_file_path = os.path.join(work_dir, "terraform.tfstate")
+        with open(state_file_path, 'w') as state_file:
+            json.dump(dict(state, resources=resources), state_file, indent=2)
+
+        # At most FT_REFRESH_CONCURRENCY terraform refreshes run at a time,
+        # whatever the number of modules and shards (see
+        # default_refresh_concurrency)
+        with _refresh_slots:
+            result = subprocess.run(
+                ["terraform", "apply", "-refresh-only", "-auto-approve", "-input=false", "-json"],
+                cwd=work_dir, env=terraform_env(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if result.returncode == 0:
+            with open(state_file_path, "r") as state_file:
+                return json.load(state_file), None, ""
+        return (None, refresh_errors(result.stdout.decode("utf-8", "replace")),
+                result.stderr.decode("utf-8", "replace"))
+
+    @staticmethod
+    def address(resource):
+        """(type, name, id) of a state resource."""
+        return (resource["type"], resource["name"], resource["instances"][0]["attributes"]["id"])
+
+    def save_state_cache(self, states, failed=None):
+        """
+        Caches the refreshed instances of the resources discovered with a
+        payload, except the `failed` addresses.
+        """
+        entries = {}
+        for state in states:
+            for resource in state.get("resources", []):
+                if resource_address(resource) in (failed or {}):
+                    continue
+                fingerprint = self.fingerprints.get(self.address(resource))
+                if fingerprint:
+                    entries.setdefault(resource["type"], {})[
+                        resource["instances"][0]["attributes"]["id"]] = (fingerprint, resource["instances"][0])
+        if entries or self.cached_resources:
+            self.get_state_cache().save(entries)
+
+    def state_shards(self, resources):
+        """
+        Splits the resources into FT_REFRESH_SHARDS shards (by default
+        default_refresh_shards()), of at least MIN_SHARD_SIZE resources each.
+        """
+        shard_count = int(os.getenv('FT_REFRESH_SHARDS', default_refresh_shards()))
+        shard_count = max(1, min(shard_count, len(resources) // MIN_SHARD_SIZE))
+        return [resources[shard::shard_count] for shard in range(shard_count)]
+
+    def refresh_shards(self, shards):
+        """
+        Refreshes each shard in its own working directory, all at once, and
+        returns their states with the resources terraform could not refresh.
+        """
+        logger.debug(
+            f"Refreshing {sum(len(resources) for resources in shards)} resources in {len(shards)} shards...")
+        shard_dirs = []
+        for shard, resources in enumerate(shards):
+            shard_dir = os.path.join(self.script_dir, f"shard_{shard}")
+            os.makedirs(shard_dir, exist_ok=True)
+            shutil.copyfile(os.path.join(self.script_dir, "versions.tf"),
+                            os.path.join(shard_dir, "versions.tf"))
+            with open(os.path.join(shard_dir, "terraform.tfstate"), 'w') as state_file:
+                json.dump(dict(self.state_data, resources=resources),
+                          state_file, indent=2)
+            shard_dirs.append(shard_dir)
+
+        with ThreadPoolExecutor(max_workers=len(shard_dirs)) as executor:
+            failed = list(executor.map(self.terraform_refresh, shard_dirs))
+
+        results = []
+        for shard_dir, shard_failed in zip(shard_dirs, failed):
+            with open(os.path.join(shard_dir, "terraform.tfstate"), "r") as state_file:
+                results.append((json.load(state_file), shard_failed))
+            shutil.rmtree(shard_dir, ignore_errors=True)
+        return results
+
+    def write_state(self, states, resources=None):
+        """
+        Writes terraform_state_file with the resources of the refreshed states
+        plus `resources`, in the order they were discovered.
+        """
+        def state_address(resource):
+            return (resource.get("module", ""), resource["type"], resource["name"])
+
+        position = {state_address(resource): index for index,
+                    resource in enumerate(self.state_data["resources"])}
+        merged = dict(self.state_data, resources=list(resources or []))
+        for state in states:
+            merged["resources"].extend(state.get("resources", []))
+            # Refresh bumps the serial, keep the highest one
+            merged["serial"] = max(merged["serial"], state.get("serial", 0))
+        merged["resources"].sort(key=lambda resource: position.get(
+            state_address(resource), len(position)))
+
+        with open(self.terraform_state_file, 'w') as state_file:
+            json.dump(merged, state_file, indent=2)
+
     def create_folder(self, folder):
         if os.path.exists(folder):
             logger.debug(f"Folder '{folder}' already exists removing it.")
@@ -213,37 +523,40 @@ class HCL:
 
     def add_stack(self, resource_name, id, ftstack, files=None):
         if ftstack:
-            if resource_name not in self.ftstacks:
-                self.ftstacks[resource_name] = {}
-            if id not in self.ftstacks[resource_name]:
-                self.ftstacks[resource_name][id] = {}
-            if "ftstack_list" not in self.ftstacks[resource_name][id]:
-                self.ftstacks[resource_name][id]["ftstack_list"] = set()
-            self.ftstacks[resource_name][id]["ftstack_list"].add(ftstack)
-            self.unique_ftstacks.add(ftstack)
-            if files:
-                if ftstack not in self.ftstacks_files:
-                    self.ftstacks_files[ftstack] = []
-                self.ftstacks_files[ftstack].append(files)
+            with self.lock:
+                if resource_name not in self.ftstacks:
+                    self.ftstacks[resource_name] = {}
+                if id not in self.ftstacks[resource_name]:
+                    self.ftstacks[resource_name][id] = {}
+                if "ftstack_list" not in self.ftstacks[resource_name][id]:
+                    self.ftstacks[resource_name][id]["ftstack_list"] = set()
+                self.ftstacks[resource_name][id]["ftstack_list"].add(ftstack)
+                self.unique_ftstacks.add(ftstack)
+                if files:
+                    if ftstack not in self.ftstacks_files:
+                        self.ftstacks_files[ftstack] = []
+                    self.ftstacks_files[ftstack].append(files)
 
     def id_resource_processed(self, resource_name, id, ftstack):
         if ftstack:
-            if resource_name not in self.ftstacks:
-                return False
-            if id not in self.ftstacks[resource_name]:
-                return False
-            if "ftstack_list" not in self.ftstacks[resource_name][id]:
-                return False
-            if ftstack not in self.ftstacks[resource_name][id]["ftstack_list"]:
-                return False
-            return True
+            with self.lock:
+                if resource_name not in self.ftstacks:
+                    return False
+                if id not in self.ftstacks[resource_name]:
+                    return False
+                if "ftstack_list" not in self.ftstacks[resource_name][id]:
+                    return False
+                if ftstack not in self.ftstacks[resource_name][id]["ftstack_list"]:
+                    return False
+                return True
 
     def add_additional_data(self, resource_type, id, key, value):
-        if resource_type not in self.additional_data:
-            self.additional_data[resource_type] = {}
-        if id not in self.additional_data[resource_type]:
-            self.additional_data[resource_type][id] = {}
-        self.additional_data[resource_type][id][key] = value
+        with self.lock:
+            if resource_type not in self.additional_data:
+                self.additional_data[resource_type] = {}
+            if id not in self.additional_data[resource_type]:
+                self.additional_data[resource_type][id] = {}
+            self.additional_data[resource_type][id][key] = value
 
     def request_tf_code(self):
         tfstate = None
@@ -323,15 +636,12 @@ class HCL:
             with open(zip_file_path, 'wb') as zip_file:
                 zip_file.write(response_data)
 
-            # clean up folder
-            try:
-                os.chdir(os.path.join(self.output_dir, "tf_code"))
-                for stack in self.unique_ftstacks:
-                    shutil.rmtree(stack)
-            except:
-                pass
+            # clean up folder, by path: other modules run on sibling threads
+            for stack in self.unique_ftstacks:
+                shutil.rmtree(os.path.join(
+                    self.output_dir, "tf_code", stack), ignore_errors=True)
 
-            # Unzip the file to the current directory
+            # Unzip the file to the output directory
             with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
                 zip_ref.extractall(self.output_dir)
 
@@ -341,7 +651,7 @@ class HCL:
                     filename = zip_file["filename"]
                     target_dir = os.path.join(
                         self.output_dir, "tf_code", ftstack)
-                    os.makedirs(os.path.dirname(target_dir), exist_ok=True)
+                    os.makedirs(target_dir, exist_ok=True)
                     target_file = os.path.join(
                         target_dir, os.path.basename(filename))
                     shutil.copyfile(filename, target_file)
@@ -0,0 +1,61 @@
+import os
+import logging
+
+logger = logging.getLogger('finisterra')
+
+# resource type -> builder(attributes, payload), see native_builder
+BUILDERS = {}
+
+
+def native_builder(resource_type):
+    """
+    Registers a function building the refreshed state attributes of
+    `resource_type` from the discovery payload a module already holds, so
+    HCL.refresh_state does not need terraform for it.
+
+    The builder gets the attributes passed to process_resource and the
+    payload, and returns the attribute values it knows (only those in the
+    provider schema are kept, the others are null), or None to leave the
+    resource to terraform refresh.
+    """
+    def register(func):
+        BUILDERS[resource_type] = func
+        return func
+    return register
+
+
+def native_state_enabled():
+    return os.getenv('FT_NATIVE_STATE', 'true').lower() not in ('false', '0', 'no')
+
+
+def schema_defaults(block):
+    """Attributes of a schema block as terraform stores them when unset."""
+    values = {name: None for name in block.get("attributes", {})}
+    for name, block_type in block.get("block_types", {}).items():
+        values[name] = [] if block_type.get("nesting_mode") in ("list", "set") else None
+    return values
+
+
+def build_state(schema, resource_type, attributes, payload):
+    """Refreshed state attributes of the resource, or None if it needs terraform."""
+    builder = BUILDERS.get(resource_type)
+    if builder is None or payload is None or not native_state_enabled():
+        return None
+    try:
+        built = builder(attributes, payload)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.debug(f"Native state of {resource_type} {attributes['id']} not built: {e}")
+        return None
+    if built is None:
+        return None
+    state = schema_defaults(schema["block"])
+    state.update({key: value for key, value in built.items() if key in state})
+    state["id"] = attributes["id"]
+    return state
+
+
+def tags_dict(tags):
+    """[{Key, Value}] (or a dict) as a terraform tags map."""
+    if isinstance(tags, dict):
+        return dict(tags)
+    return {tag["Key"]: tag["Value"] for tag in tags or []}
@@ -0,0 +1,61 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from ..utils.api_metrics import get_current_module, set_current_module
+
+logger = logging.getLogger('finisterra')
+
+
+def parse_inner_parallel(value):
+    """
+    Parses --inner-parallel: a default worker count and/or per module counts,
+    e.g. "4", "vpc=4,s3=8" or "2,s3=8". Returns (default, {module: workers}).
+    """
+    default = 1
+    modules = {}
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if "=" in item:
+            module, workers = item.split("=", 1)
+            modules[module.strip()] = max(1, int(workers))
+        else:
+            default = max(1, int(item))
+    return default, modules
+
+
+def inner_workers(module=None):
+    """Workers a module may use for its own resources (FT_INNER_PARALLEL)."""
+    default, modules = parse_inner_parallel(os.getenv('FT_INNER_PARALLEL'))
+    return modules.get(module or get_current_module(), default)
+
+
+def for_each(func, items, workers=None):
+    """
+    Calls func(item) for every item, on up to `workers` threads (by default
+    inner_workers() of the current module). Serial when workers is 1. Raises
+    the first exception, after every item has been processed.
+    """
+    items = list(items)
+    if workers is None:
+        workers = inner_workers()
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            func(item)
+        return
+
+    # Worker threads report their API calls under the caller's module
+    module = get_current_module()
+
+    def run(item):
+        set_current_module(module)
+        return func(item)
+
+    logger.debug(
+        f"Processing {len(items)} {module or ''} items with {workers} workers")
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        futures = [executor.submit(run, item) for item in items]
+    for future in futures:
+        future.result()
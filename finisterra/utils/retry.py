@@ -0,0 +1,47 @@
+import re
+import time
+import random
+import logging
+import subprocess
+
+logger = logging.getLogger('finisterra')
+
+# Terraform and provider errors worth retrying: throttling, timeouts and
+# network failures, as opposed to e.g. access denied or invalid configuration
+TRANSIENT_ERRORS = re.compile(
+    r"throttl|rate exceeded|too many requests|requestlimitexceeded|slowdown|"
+    r"\b429\b|\b50[234]\b|timeout|timed out|connection reset|connection refused|"
+    r"temporarily unavailable|unexpected eof|tls handshake|no such host|try again",
+    re.IGNORECASE)
+
+
+def is_transient(message):
+    return bool(TRANSIENT_ERRORS.search(message or ""))
+
+
+def backoff_delay(attempt, base=2.0, cap=60.0):
+    """Exponential backoff with full jitter: up to base * 2**attempt seconds, at most cap."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def run_with_retries(command, retries=3, **kwargs):
+    """
+    subprocess.run(command, check=True, **kwargs), retried with backoff while
+    it fails with a transient error (stderr is captured to tell). Raises the
+    last CalledProcessError.
+    """
+    kwargs.setdefault("stderr", subprocess.PIPE)
+    attempt = 0
+    while True:
+        try:
+            return subprocess.run(command, check=True, **kwargs)
+        except subprocess.CalledProcessError as e:
+            message = e.stderr.decode("utf-8", "replace") if isinstance(
+                e.stderr, bytes) else str(e.stderr or "")
+            if attempt >= retries or not is_transient(message):
+                raise
+            delay = backoff_delay(attempt)
+            logger.debug(
+                f"{' '.join(command[:2])} failed, retrying in {delay:.1f}s: {message.strip()[:200]}")
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,145 @@
+import os
+import json
+import time
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+logger = logging.getLogger('finisterra')
+
+# Seconds assumed for a module without recorded duration and no history at all
+DEFAULT_DURATION = 30.0
+
+
+class ModuleScheduler:
+    """
+    Runs a provider's modules on `workers` threads, longest critical path
+    first (LPT), using the module durations recorded by previous runs in
+    FT_CACHE_DIR.
+
+    `hints` maps a module to the modules that should only start once it has
+    finished, because its results warm the shared caches for them (e.g.
+    security_group before ec2). Hints on modules outside the run are ignored.
+    """
+
+    def __init__(self, provider, modules, workers, hints=None):
+        self.modules = list(dict.fromkeys(modules))
+        self.workers = max(1, workers)
+        self.successors = {module: [] for module in self.modules}
+        self.predecessors = {module: set() for module in self.modules}
+        for module, followers in (hints or {}).items():
+            if module not in self.successors:
+                continue
+            for follower in followers:
+                if follower not in self.predecessors or self.reaches(follower, module):
+                    continue
+                self.successors[module].append(follower)
+                self.predecessors[follower].add(module)
+
+        cache_dir = os.environ.get('FT_CACHE_DIR', '')
+        self.durations_file = os.path.join(
+            cache_dir, f'module_durations_{provider}.json') if cache_dir else None
+        self.history = self.load_durations()
+        known = sorted(self.history.values())
+        self.default_duration = known[len(known) // 2] if known else DEFAULT_DURATION
+        self.priorities = {}
+        for module in self.modules:
+            self.priority(module)
+
+    def reaches(self, module, target):
+        """Whether target is module or one of its followers, hints must not loop."""
+        return module == target or any(
+            self.reaches(follower, target) for follower in self.successors[module])
+
+    def load_durations(self):
+        if not self.durations_file or not os.path.isfile(self.durations_file):
+            return {}
+        try:
+            with open(self.durations_file, "r") as f:
+                return {module: float(seconds) for module, seconds in json.load(f).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f"Could not read module durations: {e}")
+            return {}
+
+    def save_durations(self, durations):
+        if not self.durations_file:
+            return
+        history = dict(self.history)
+        history.update(durations)
+        try:
+            with open(self.durations_file, "w") as f:
+                json.dump(history, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.debug(f"Could not save module durations: {e}")
+
+    def estimate(self, module):
+        return self.history.get(module, self.default_duration)
+
+    def priority(self, module):
+        """Expected duration of the module plus its longest chain of followers."""
+        if module not in self.priorities:
+            self.priorities[module] = self.estimate(module) + max(
+                (self.priority(follower) for follower in self.successors[module]), default=0)
+        return self.priorities[module]
+
+    def order(self, modules):
+        # Highest priority first, ties in the given order
+        return sorted(modules, key=lambda module: (-self.priorities[module], self.modules.index(module)))
+
+    def next_modules(self, pending, finished, running):
+        """Modules to start now, given the ones pending, finished and running."""
+        ready = [module for module in pending if self.predecessors[module] <= finished]
+        return self.order(ready)[:self.workers - len(running)]
+
+    def expected_makespan(self):
+        """Makespan of this schedule if every module takes its estimate."""
+        pending = list(self.modules)
+        finished = set()
+        running = []
+        now = 0.0
+        while pending or running:
+            for module in self.next_modules(pending, finished, running):
+                pending.remove(module)
+                heapq.heappush(running, (now + self.estimate(module), module))
+            now, module = heapq.heappop(running)
+            finished.add(module)
+        return now
+
+    def run(self, func, *args):
+        """Calls func(*args, module) for every module, returns their results."""
+        expected = self.expected_makespan()
+        logger.debug(
+            f"Module order: {', '.join(self.order(self.modules))}")
+
+        pending = list(self.modules)
+        finished = set()
+        durations = {}
+        results = []
+        start = time.monotonic()
+
+        def timed(module):
+            module_start = time.monotonic()
+            try:
+                return func(*args, module)
+            finally:
+                durations[module] = round(time.monotonic() - module_start, 1)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            running = {}
+            while pending or running:
+                for module in self.next_modules(pending, finished, running):
+                    pending.remove(module)
+                    running[executor.submit(timed, module)] = module
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished.add(running.pop(future))
+                    results.append(future.result())
+
+        actual = time.monotonic() - start
+        self.save_durations(durations)
+        if self.history:
+            logger.info(
+                f"Modules finished in {actual:.1f}s (expected {expected:.1f}s)")
+        else:
+            logger.info(f"Modules finished in {actual:.1f}s")
+        return results
@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import logging
+
+logger = logging.getLogger('finisterra')
+
+# Entries not seen by any run for this long are dropped
+MAX_AGE = 30 * 24 * 3600
+
+# Modules of a run share the cache files
+_files_lock = threading.Lock()
+
+
+# Fields of AWS responses that change without any change to the resource:
+# per-request metadata, usage counters, health, alarm and log stream states,
+# event source processing results and restore windows
+VOLATILE_KEYS = {
+    "ResponseMetadata",
+    "ItemCount",
+    "TableSizeBytes",
+    "LatestRestorableTime",
+    "EarliestRestorableTime",
+    "SubscriptionsConfirmed",
+    "SubscriptionsPending",
+    "SubscriptionsDeleted",
+    "runningCount",
+    "pendingCount",
+    "events",
+    "deployments",
+    "Health",
+    "health",
+    "HealthStatus",
+    "assetSizeBytes",
+    "ServiceCount",
+    "AvailableIpAddressCount",
+    "AttachmentCount",
+    "RoleLastUsed",
+    "PasswordLastUsed",
+    "StateValue",
+    "StateReason",
+    "StateReasonData",
+    "StateUpdatedTimestamp",
+    "StateTransitionedTimestamp",
+    "LastProcessingResult",
+    "firstEventTimestamp",
+    "lastEventTimestamp",
+    "lastIngestionTime",
+    "uploadSequenceToken",
+    "storedBytes",
+    "runningTasksCount",
+    "pendingTasksCount",
+    "activeServicesCount",
+    "registeredContainerInstancesCount",
+    "statistics",
+    "stabilityStatus",
+    "stabilityStatusAt",
+}
+
+
+def stable(payload):
+    """payload without its VOLATILE_KEYS, at any depth."""
+    if isinstance(payload, dict):
+        return {key: stable(value) for key, value in payload.items()
+                if key not in VOLATILE_KEYS}
+    if isinstance(payload, (list, tuple)):
+        return [stable(value) for value in payload]
+    return payload
+
+
+def state_fingerprint(resource_schema, attributes, payload):
+    """Hash of everything the refreshed state of a resource depends on."""
+    data = json.dumps([resource_schema, attributes, stable(payload)],
+                      sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def full_refresh():
+    return os.getenv('FT_FULL_REFRESH', 'false').lower() in ('true', '1', 'yes')
+
+
+class StateCache:
+    """
+    Refreshed state instances of the resources discovered with a payload,
+    kept in FT_CACHE_DIR between runs, one file per resource type, with the
+    fingerprint of what they were refreshed from.
+
+    A resource whose fingerprint has not changed since the last run takes
+    its cached instance instead of being refreshed again. Nothing is kept
+    when FT_CACHE_DIR is not set, and nothing is reused with FT_FULL_REFRESH.
+    """
+
+    def __init__(self, provider, account, region):
+        cache_dir = os.environ.get('FT_CACHE_DIR', '')
+        self.cache_dir = os.path.join(
+            cache_dir, "state", provider, f"{account}_{region}") if cache_dir else None
+        self.types = {}
+        self.seen = {}
+
+    def path(self, resource_type):
+        return os.path.join(self.cache_dir, f"{resource_type}.json")
+
+    def read(self, resource_type):
+        path = self.path(resource_type)
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read state cache {path}: {e}")
+            return {}
+
+    def get(self, resource_type, resource_id, fingerprint):
+        """Cached state instance of the resource if its fingerprint matches."""
+        if not self.cache_dir or full_refresh():
+            return None
+        if resource_type not in self.types:
+            with _files_lock:
+                self.types[resource_type] = self.read(resource_type)
+        entry = self.types[resource_type].get(resource_id)
+        if not entry or entry["fingerprint"] != fingerprint:
+            return None
+        self.seen.setdefault(resource_type, set()).add(resource_id)
+        return entry["instance"]
+
+    def save(self, entries):
+        """
+        Stores {resource_type: {id: (fingerprint, instance)}} and marks the
+        entries read by get() as seen.
+        """
+        if not self.cache_dir:
+            return
+        now = int(time.time())
+        with _files_lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for resource_type in set(entries) | set(self.seen):
+                cache = self.read(resource_type)
+                for resource_id in self.seen.get(resource_type, ()):
+                    if resource_id in cache:
+                        cache[resource_id]["seen"] = now
+                for resource_id, (fingerprint, instance) in entries.get(resource_type, {}).items():
+                    cache[resource_id] = {
+                        "fingerprint": fingerprint,
+                        "instance": instance,
+                        "seen": now,
+                    }
+                cache = {resource_id: entry for resource_id, entry in cache.items()
+                         if now - entry.get("seen", 0) < MAX_AGE}
+                try:
+                    with open(self.path(resource_type), "w") as f:
+                        json.dump(cache, f)
+                except OSError as e:
+                    logger.debug(
+                        f"Could not save state cache {self.path(resource_type)}: {e}")
+        self.seen = {}